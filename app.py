@@ -1,44 +1,148 @@
 # app.py
-import dash
-import dash_bootstrap_components as dbc
-from flask import Flask
-from config import PORT
-from callbacks import register_callbacks
-from cache_config import cache
-
-
-# Initialize Flask server
-server = Flask(__name__)
-# Initialize Dash app with Flask server
-app = dash.Dash(__name__, server=server, external_stylesheets=[dbc.themes.BOOTSTRAP], title="NFL Games", use_pages=True)
-
-# Initialize cache and clear
-cache.init_app(app.server)
-with app.server.app_context():
-   cache.clear()
-
-# Set up the app layout with navigation and page container
-app.layout = dbc.Container([
-    dbc.Nav([
-        dbc.NavLink(
-            "Scores", href="/", active="exact",
-            className="nav-link-custom",
-        ),
-        dbc.NavLink(
-            "Standings", href="/standings", active="exact",
-            className="nav-link-custom",
-        ),
-        dbc.NavLink(
-            "Rosters", href="/players", active="exact",
-            className="nav-link-custom",
-        ),
-    ], pills=True, style={"margin": "20px 0"}),
-
-    dash.page_container  # Display selected page content
-], fluid=True)
-
-# Register callbacks
-register_callbacks(app)
+from startup import phase, record_first_request, startup_report
+
+with phase("import"):
+    import dash
+    import dash_bootstrap_components as dbc
+    import hmac
+    from flask import Flask, Response, jsonify, request
+    from config import PORT, POLLER_ENABLED, ROSTER_REFRESH_ENABLED, JOBS_TOKEN
+    from http_client import connection_stats
+    from singleflight import upstream_calls_saved
+    from poller import start_poller
+    from roster_cache import start_roster_refresher
+    from livefeed import get_live_feed
+    from render_cache import render_cache_stats
+    from jobs import JOBS, RUNNING, submit_job, get_job
+    import scheduler
+    from callbacks import register_callbacks
+    from cache_config import cache
+
+
+with phase("app init"):
+    # Initialize Flask server
+    server = Flask(__name__)
+    # Initialize Dash app with Flask server. Dash builds the callback validation layout from every
+    # page layout on the first request, so page layouts are static shells and their data is filled
+    # in by callbacks (see pages/).
+    app = dash.Dash(__name__, server=server, external_stylesheets=[dbc.themes.BOOTSTRAP], title="NFL Games",
+                    use_pages=True)
+
+with phase("cache init"):
+    # Entries expire on their own; clearing at boot only threw away what the other workers had cached
+    cache.init_app(app.server)
+
+with phase("layout build"):
+    # Set up the app layout with navigation and page container
+    app.layout = dbc.Container([
+        dbc.Nav([
+            dbc.NavLink(
+                "Scores", href="/", active="exact",
+                className="nav-link-custom",
+            ),
+            dbc.NavLink(
+                "Standings", href="/standings", active="exact",
+                className="nav-link-custom",
+            ),
+            dbc.NavLink(
+                "Rosters", href="/players", active="exact",
+                className="nav-link-custom",
+            ),
+        ], pills=True, style={"margin": "20px 0"}),
+
+        dash.page_container  # Display selected page content
+    ], fluid=True)
+
+with phase("callbacks"):
+    # Register callbacks
+    register_callbacks(app)
+
+with phase("background threads"):
+    # Live scores are fetched by one elected worker and read from the shared snapshot by all
+    if POLLER_ENABLED:
+        start_poller()
+
+    # All 32 rosters are prewarmed in the background and refreshed daily off-peak
+    if ROSTER_REFRESH_ENABLED:
+        start_roster_refresher()
+
+
+@server.after_request
+def _record_first_request(response):
+    record_first_request()
+    return response
+
+
+# Boot time of this worker by phase, and how long until it served its first request. The only place
+# the startup profile is reported, so booting workers don't write to the log.
+@server.route("/api/startup")
+def startup_status():
+    return jsonify(startup_report())
+
+
+# Upstream connection pool usage (new vs reused connections) for this worker
+@server.route("/api/http-stats")
+def http_stats():
+    return jsonify(connection_stats())
+
+
+# Upstream calls avoided by request coalescing, across all workers
+@server.route("/api/singleflight-stats")
+def singleflight_stats():
+    return jsonify({"upstream_calls_saved": upstream_calls_saved()})
+
+
+# Remaining RapidAPI budget, token bucket level and queue depth per priority class
+@server.route("/api/quota")
+def quota_status():
+    return jsonify(scheduler.status())
+
+
+# Hit rates of the game card and game detail render cache in this worker
+@server.route("/api/render-cache-stats")
+def render_cache_status():
+    return jsonify(render_cache_stats())
+
+
+# Live score changes pushed as server-sent events. Browsers resume with Last-Event-ID after a drop.
+@server.route("/api/live-scores")
+def live_scores():
+    last_event_id = request.headers.get("Last-Event-ID") or request.args.get("last_seq")
+    last_seq = int(last_event_id) if last_event_id and last_event_id.isdigit() else None
+    return Response(get_live_feed().stream(last_seq), mimetype="text/event-stream", headers={
+        "Cache-Control": "no-cache",
+        "X-Accel-Buffering": "no",  # Don't let a proxy buffer the stream
+    })
+
+
+# Start a background rebuild (standings, rosters or odds). A run already in progress is returned instead,
+# a run that finished within the job's cooldown with 429. Needs "Authorization: Bearer $JOBS_TOKEN".
+# This route is for operators and cron. The standings page's Update button doesn't use it: its
+# Dash callback calls submit_job() server-side, limited only by the job's cooldown.
+@server.route("/api/jobs/<kind>", methods=["POST"])
+def start_job(kind):
+    token = request.headers.get("Authorization", "").removeprefix("Bearer ")
+    if not JOBS_TOKEN or not hmac.compare_digest(token, JOBS_TOKEN):
+        return jsonify({"error": "Not authorized"}), 403
+    if kind not in JOBS:
+        return jsonify({"error": f"Unknown job {kind}"}), 404
+    job = submit_job(kind)
+    return jsonify(job), 202 if job["state"] == RUNNING else 429
+
+
+# Status and progress of the latest job of a kind, from any worker
+@server.route("/api/jobs/<kind>")
+def job_status(kind):
+    if kind not in JOBS:
+        return jsonify({"error": f"Unknown job {kind}"}), 404
+    return jsonify(get_job(kind))
+
+
+# Open live score streams in this worker
+@server.route("/api/live-scores/stats")
+def live_scores_stats():
+    feed = get_live_feed()
+    return jsonify({"seq": feed.seq, "subscribers": feed.subscribers})
 
 # Run Dash server
 if __name__ == "__main__":
@@ -0,0 +1,98 @@
+// assets/live_scores.js
+// Live scores pushed from /api/live-scores (server-sent events). One stream per tab, kept open
+// across page changes; the browser reconnects on its own and resumes with Last-Event-ID.
+(function () {
+    var source = null;
+    var games = new Map();  // game_id -> live fields
+
+    function scoresPageMounted() {
+        return document.getElementById('week-selector') !== null;
+    }
+
+    function push() {
+        if (scoresPageMounted()) {
+            dash_clientside.set_props('scores-data', {data: Object.fromEntries(games)});
+        }
+    }
+
+    function setPolling(enabled) {
+        if (scoresPageMounted()) {
+            dash_clientside.set_props('interval-scores', {disabled: !enabled});
+        }
+    }
+
+    function onSnapshot(event) {
+        games = new Map(JSON.parse(event.data).games.map(function (game) {
+            return [game.game_id, game];
+        }));
+        push();
+    }
+
+    function onDelta(event) {
+        var delta = JSON.parse(event.data);
+        delta.removed.forEach(function (gameId) {
+            games.delete(gameId);
+        });
+        Object.keys(delta.changed).forEach(function (gameId) {
+            games.set(gameId, Object.assign({}, games.get(gameId), delta.changed[gameId]));
+        });
+        push();
+    }
+
+    function open() {
+        source = new EventSource('/api/live-scores');
+        source.addEventListener('snapshot', onSnapshot);
+        source.addEventListener('delta', onDelta);
+        source.onopen = function () {
+            setPolling(false);
+        };
+        source.onerror = function () {
+            // Fall back to interval polling until the stream is back
+            setPolling(true);
+        };
+    }
+
+    function renderGameFields(scoresData, gameIds) {
+        var noUpdate = window.dash_clientside.no_update;
+        var fields = [[], [], [], [], [], []];
+        gameIds.forEach(function (gameId) {
+            var game = (scoresData || {})[gameId];
+            if (!game) {
+                fields.forEach(function (values) {
+                    values.push(noUpdate);
+                });
+                return;
+            }
+            var status = game['Status'] || '';
+            var downDistance = game['Down Distance'] || '';
+            fields[0].push(game['Home Team Score'] || '');
+            fields[1].push(game['Away Team Score'] || '');
+            fields[2].push(status === 'final' ? 'Final' : game['Quarter'] + ' Qtr ● ' + game['Time Remaining']);
+            fields[3].push(game['Possession'] === game['Home Team ID'] ? '🏈 ' + downDistance : '');
+            fields[4].push(game['Possession'] === game['Away Team ID'] ? '🏈 ' + downDistance : '');
+            fields[5].push(status);
+        });
+        return fields;
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        live_scores: {
+            render_game_fields: renderGameFields,
+            connect: function (initComplete) {
+                if (!initComplete || typeof EventSource === 'undefined') {
+                    return window.dash_clientside.no_update;
+                }
+                if (source === null) {
+                    open();
+                } else if (source.readyState === EventSource.OPEN) {
+                    // Back on the scores page: fill the fresh store and stop polling again
+                    setPolling(false);
+                    if (games.size) {
+                        push();
+                    }
+                }
+                return true;
+            }
+        }
+    });
+})();
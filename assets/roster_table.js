@@ -0,0 +1,38 @@
+// assets/roster_table.js
+// Roster table rows built in the browser from the columnar roster-data store.
+(function () {
+    // The cell is rendered as HTML markdown, so the upstream URL must not be able to leave the attribute
+    function escapeAttribute(value) {
+        return String(value).replace(/&/g, '&amp;').replace(/"/g, '&quot;').replace(/'/g, '&#39;')
+            .replace(/</g, '&lt;').replace(/>/g, '&gt;');
+    }
+
+    function headshot(src) {
+        return src ? '<img src="' + escapeAttribute(src) + '" loading="lazy" height="50" class="player-photo">' : '';
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        roster_table: {
+            rows: function (rosterData, positions) {
+                if (!rosterData) {
+                    return [];
+                }
+                var selected = positions && positions.length ? new Set(positions) : null;
+                var columns = Object.keys(rosterData);
+                var rows = [];
+                for (var i = 0; i < rosterData.name.length; i++) {
+                    if (selected && !selected.has(rosterData.position[i])) {
+                        continue;
+                    }
+                    var row = {};
+                    columns.forEach(function (column) {
+                        row[column] = rosterData[column][i];
+                    });
+                    row.headshot = headshot(row.headshot);
+                    rows.push(row);
+                }
+                return rows;
+            }
+        }
+    });
+})();
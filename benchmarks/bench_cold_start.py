@@ -0,0 +1,46 @@
+# benchmarks/bench_cold_start.py
+"""Worker cold start: boot phases and time to the first served request, each run in a fresh process.
+
+Point API_BASE_URL at the mock server (python mock_server.py) so no upstream call is made.
+Run from the repository root: python -m benchmarks.bench_cold_start
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 7
+
+PROBE = """
+import sys, json
+sys.path.insert(0, ".")
+import app
+client = app.server.test_client()
+client.get("/")
+client.get("/_dash-layout")
+client.get("/_dash-dependencies")
+report = app.startup_report()
+report["heavy_modules"] = [name for name in ("pandas", "numpy", "plotly.express") if name in sys.modules]
+print(json.dumps(report))
+"""
+
+
+def main():
+    env = {**os.environ, "POLLER_ENABLED": "0", "ROSTER_REFRESH_ENABLED": "0"}
+    reports = []
+    for _ in range(RUNS):
+        output = subprocess.run([sys.executable, "-W", "ignore", "-c", PROBE], capture_output=True, text=True,
+                                env=env, check=True)
+        reports.append(json.loads(output.stdout.strip().splitlines()[-1]))
+
+    print(f"median of {RUNS} fresh processes")
+    for name in reports[0]["phases_ms"]:
+        print(f"  {name:22}{statistics.median(r['phases_ms'][name] for r in reports):>10.1f} ms")
+    print(f"  {'boot':22}{statistics.median(r['boot_ms'] for r in reports):>10.1f} ms")
+    print(f"  {'first request done':22}{statistics.median(r['first_request_ms'] for r in reports):>10.1f} ms")
+    print(f"  heavy modules loaded: {', '.join(reports[0]['heavy_modules']) or 'none'}")
+
+
+if __name__ == "__main__":
+    main()
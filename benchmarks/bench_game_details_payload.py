@@ -0,0 +1,72 @@
+# benchmarks/bench_game_details_payload.py
+"""Bytes on the wire per game-detail click: ALL-pattern callback (before) vs MATCH callback (after).
+
+Starts mock_server.py in-process so no RapidAPI key is needed.
+Run from the repository root: python -m benchmarks.bench_game_details_payload
+"""
+import json
+import os
+import threading
+from werkzeug.serving import make_server
+
+WEEK_INDEX = 14  # Regular season week 11 of the mock season
+
+
+def start_mock_api():
+    import mock_server
+    server = make_server("127.0.0.1", 0, mock_server.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"http://127.0.0.1:{server.server_port}"
+
+
+def dumps(payload):
+    from plotly.io.json import to_json_plotly
+    return to_json_plotly(payload)
+
+
+def main():
+    os.environ["API_BASE_URL"] = start_mock_api()
+    os.environ["POLLER_ENABLED"] = "0"
+    os.environ["ROSTER_REFRESH_ENABLED"] = "0"  # No roster prewarm fan-out during the measurement
+    import app
+    from season_index import get_season_index, get_week_events
+
+    game_ids = [event["id"] for event in get_week_events(get_season_index(), WEEK_INDEX)]
+    clicked = game_ids[0]
+    button = lambda game_id: {"type": "game-button", "index": game_id}
+    panel_id = lambda game_id: json.dumps({"index": game_id, "type": "scoring-plays"}, separators=(",", ":"))
+
+    with app.server.test_request_context():
+        app.server.preprocess_request()
+        from utils import create_game_details
+        panel = create_game_details(clicked)
+
+    # Before: every button's n_clicks and id go up, an output list for every panel comes back
+    before_request = dumps({
+        "output": '..{"index":["ALL"],"type":"scoring-plays"}.children..',
+        "inputs": [[{"id": button(game_id), "property": "n_clicks", "value": int(game_id == clicked)}
+                    for game_id in game_ids]],
+        "state": [[{"id": button(game_id), "property": "id", "value": button(game_id)} for game_id in game_ids]],
+        "changedPropIds": [f"{json.dumps(button(clicked))}.n_clicks"],
+    })
+    before_response = dumps({"multi": True, "response": {
+        panel_id(game_id): {"children": panel if game_id == clicked else []} for game_id in game_ids}})
+
+    # After: only the clicked game's button and panel
+    after_request = dumps({
+        "output": '{"index":["MATCH"],"type":"scoring-plays"}.children',
+        "inputs": [{"id": button(clicked), "property": "n_clicks", "value": 1}],
+        "state": [{"id": button(clicked), "property": "value", "value": clicked}],
+        "changedPropIds": [f"{json.dumps(button(clicked))}.n_clicks"],
+    })
+    after_response = dumps({"multi": True, "response": {panel_id(clicked): {"children": panel}}})
+
+    print(f"{len(game_ids)} games on the page")
+    print(f"{'':10}{'request':>10}{'response':>10}")
+    print(f"{'ALL':10}{len(before_request):>10}{len(before_response):>10}")
+    print(f"{'MATCH':10}{len(after_request):>10}{len(after_response):>10}")
+    print("ALL also re-sends every other panel as [] on each click, closing any panel that was open.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+# benchmarks/bench_playoff_odds.py
+"""Monte Carlo playoff odds from mid-season: throughput per core and with a process pool.
+
+Run from the repository root: python -m benchmarks.bench_playoff_odds
+"""
+import os
+
+os.environ.setdefault("MOCK_NOW", "2024-11-12T12:00Z")  # After week 10, seven weeks left to simulate
+import mock_server
+import pandas as pd
+from roster_cache import load_teams
+from standings_engine import final_games_frame
+from simulator import simulation_inputs, run_simulation
+
+SEASONS = 20000
+
+
+def main():
+    events = {event["id"]: event for event in mock_server._season_events()}
+    games = final_games_frame(events)
+    team_ids = [team["id"] for team in load_teams()]
+    division_of = pd.read_json("data/divisions.json", dtype={"team_id": str}).set_index("team_id")["division_name"]
+
+    inputs = simulation_inputs(events, games, team_ids, division_of)
+    print(f"{len(games)} games played, {len(inputs['home'])} left to simulate, {os.cpu_count()} CPUs")
+
+    print(f"{'processes':>10}{'seasons':>10}{'seconds':>10}{'seasons/s':>12}")
+    for processes in sorted({1, 2, os.cpu_count() or 1}):
+        result = run_simulation(inputs, seasons=SEASONS, processes=processes, seed=1)
+        print(f"{processes:>10}{result['seasons']:>10}{result['seconds']:>10.2f}{result['seasons_per_second']:>12}")
+
+    # Every season fills 14 playoff spots, 8 division titles and 2 byes
+    totals = pd.DataFrame(result["odds"]).T.sum()
+    print("spots per season:", totals.round(3).to_dict())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+# benchmarks/bench_roster_payload.py
+"""Roster page payload: html.Tr component tree (before) vs columnar store + virtualized DataTable (after).
+
+Starts mock_server.py in-process so no RapidAPI key is needed. Time-to-render is measured as
+server build + serialize time and the number of components React has to mount; the DataTable
+only mounts the rows in view.
+Run from the repository root: python -m benchmarks.bench_roster_payload
+"""
+import os
+import time
+from collections import defaultdict
+from benchmarks.bench_game_details_payload import start_mock_api, dumps
+
+TEAM_ID = "22"
+ROUNDS = 20
+VISIBLE_ROWS = 12  # Rows in a 70vh table at 60px each
+
+
+def count_components(node):
+    if isinstance(node, dict) and "props" in node:
+        return 1 + count_components(node["props"].get("children"))
+    if isinstance(node, list):
+        return sum(count_components(child) for child in node)
+    return 0
+
+
+def timed(build):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        payload = dumps(build())
+    return payload, (time.perf_counter() - start) / ROUNDS * 1000
+
+
+def main():
+    os.environ["API_BASE_URL"] = start_mock_api()
+    os.environ["POLLER_ENABLED"] = "0"
+    os.environ["ROSTER_REFRESH_ENABLED"] = "0"
+    import json
+    import app  # noqa: F401
+    from dash import html
+    import dash_bootstrap_components as dbc
+    from utils import create_roster_data, create_roster_header, get_team, get_roster, hex_to_rgba, \
+        parse_and_capitalize
+
+    def legacy_roster_table(team_id):
+        # Team data and roster both come from memory/cache, no upstream call per selection
+        team_data = get_team(team_id)
+        if not team_data:
+            return html.Div("Team not found")
+
+        # Set team logo, name, and color
+        team_logo = team_data['logo']
+        team_name = team_data['display_name']
+        team_color = team_data.get("color", "#003f5c")  # Default color if none is provided
+        background_color_rgba = hex_to_rgba(team_color, alpha=1.0)
+
+        # Team header (logo and name)
+        subheading = dbc.Card([
+            dbc.CardBody([
+                html.Div([
+                    html.Img(src=team_logo, height="80px", style={"marginRight": "10px"}),
+                    html.H2(team_name, style={
+                        "display": "inline-block",
+                        "verticalAlign": "middle",
+                        "marginBottom": "0",
+                        "color": "white",  # Text color
+                        "fontWeight": "bold",
+                        "fontSize": "2.0rem"
+                    }),
+                ], style={
+                    "backgroundColor": "transparent",
+                })
+            ])
+        ], style={
+            "backgroundColor": background_color_rgba,
+            "borderRadius": "5px",
+            "padding": "5px",
+            "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.2)",
+            "border": f"2px solid {team_color}",
+        })
+
+        player_data = get_roster(team_id)
+        table_rows = []
+
+        # Iterate over each group
+        for group in player_data.get("athletes", []):
+            group_name = parse_and_capitalize(group.get("position", "Unknown Group"))
+
+           # Group header row
+            table_rows.append(html.Tr([
+                html.Th(group_name, colSpan=9, className="roster-group-header",
+                        style={'textAlign': 'center',
+                               "marginBottom": "0",
+                        "color": "white",  # Text color
+                        "backgroundColor": background_color_rgba,
+                        "fontWeight": "bold",
+                        "fontSize": "1.5rem"})
+            ]))
+
+            # Group players by position within each main group (e.g., Running Back under Offense)
+            players_by_position = defaultdict(list)
+            for player in group.get("items", []):
+                position = player["position"]["displayName"]
+                players_by_position[position].append(player)
+
+            # Iterate over positions within each group
+            for position, position_players in players_by_position.items():
+                # Position subheading
+                table_rows.append(html.Tr([
+                    html.Th(position, colSpan=9, className="roster-position-header")
+                ]))
+
+                # Add smaller repeated headers for clarity
+                table_rows.append(html.Tr([
+                    html.Th("", style={"fontSize": "14px", "fontWeight": "normal", "color": "white"}),
+                    html.Th("Jersey", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
+                    html.Th("Name", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
+                    html.Th("Position", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
+                    html.Th("Height", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
+                    html.Th("Weight", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
+                    html.Th("Age", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
+                    html.Th("College", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
+                    html.Th("Status", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"})
+                ]))
+
+                # Player rows for each position
+                for player in position_players:
+                    player_row = html.Tr([
+                        html.Td(html.Img(src=player.get('headshot', {}).get('href', ''), height="50px",
+                                         className="player-photo")),
+                        html.Td(player.get("jersey", "N/A")),
+                        html.Td(player.get("displayName", "Unknown Name")),
+                        html.Td(player["position"].get("displayName", "Unknown Position")),
+                        html.Td(player.get("displayHeight", "N/A")),
+                        html.Td(player.get("displayWeight", "N/A")),
+                        html.Td(player.get("age", "N/A")),
+                        html.Td(player.get("college", {}).get("shortName", "N/A")),
+                        html.Td(player.get("status", {}).get("type", "N/A")),
+                    ])
+                    table_rows.append(player_row)
+
+            # Construct the final layout
+        return html.Div([
+            subheading,
+            html.Table([
+                html.Tbody(table_rows)
+            ], className="roster-table")
+        ])
+
+    before, before_ms = timed(lambda: legacy_roster_table(TEAM_ID))
+    after, after_ms = timed(lambda: [create_roster_header(TEAM_ID), create_roster_data(TEAM_ID)])
+    players = len(create_roster_data(TEAM_ID)["name"])
+
+    print(f"{players} players")
+    print(f"{'':12}{'bytes':>10}{'build ms':>10}{'components':>12}")
+    print(f"{'html.Tr':12}{len(before):>10}{before_ms:>10.2f}{count_components(json.loads(before)):>12}")
+    after_components = count_components(json.loads(after)[0]) + 1 + VISIBLE_ROWS * 10
+    print(f"{'columnar':12}{len(after):>10}{after_ms:>10.2f}{after_components:>12}")
+    print(f"Columnar components: header card, the table, {VISIBLE_ROWS} visible rows x 10 cells.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# benchmarks/bench_season_index.py
+"""Week selection cost: walking the calendar and parsing every event date vs. a season index lookup.
+
+Run from the repository root: python -m benchmarks.bench_season_index
+"""
+import timeit
+from datetime import datetime, timezone
+import mock_server
+from season_index import build_season_index, get_week_events
+
+WEEK_INDEX = 12
+
+
+def select_week_by_scan(nfl_events_data, selected_week_index):
+    """The previous display_static_game_info path."""
+    calendar_data = nfl_events_data['leagues'][0]['calendar']
+    week_data = None
+    week_counter = 0
+    for period in calendar_data:
+        if 'entries' in period:
+            for week in period['entries']:
+                if week_counter == selected_week_index:
+                    week_data = week
+                    break
+                week_counter += 1
+        if week_data:
+            break
+
+    week_start = datetime.fromisoformat(week_data['startDate'][:-1]).replace(tzinfo=timezone.utc)
+    week_end = datetime.fromisoformat(week_data['endDate'][:-1]).replace(tzinfo=timezone.utc)
+    return [
+        event for event in nfl_events_data['events']
+        if week_start <= datetime.fromisoformat(event['date'][:-1]).replace(tzinfo=timezone.utc) <= week_end
+    ]
+
+
+def main():
+    payload = {"leagues": [{"calendar": mock_server._calendar()}], "events": mock_server._season_events()}
+    index = build_season_index(payload, version="bench")
+    assert [event['id'] for event in select_week_by_scan(payload, WEEK_INDEX)] == \
+           [event['id'] for event in get_week_events(index, WEEK_INDEX)]
+
+    runs = 200
+    scan = timeit.timeit(lambda: select_week_by_scan(payload, WEEK_INDEX), number=runs) / runs
+    build = timeit.timeit(lambda: build_season_index(payload), number=10) / 10
+    lookup = timeit.timeit(lambda: get_week_events(index, WEEK_INDEX), number=runs) / runs
+
+    print(f"{len(payload['events'])} events, {len(index['weeks'])} calendar weeks")
+    print(f"calendar walk + date scan per selection: {scan * 1e6:9.1f} us")
+    print(f"index lookup per selection:              {lookup * 1e6:9.1f} us ({scan / lookup:.0f}x faster)")
+    print(f"index build, once per events refresh:    {build * 1e6:9.1f} us")
+
+
+if __name__ == "__main__":
+    main()
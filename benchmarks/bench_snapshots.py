@@ -0,0 +1,93 @@
+# benchmarks/bench_snapshots.py
+"""Loading data/*.json tables: pretty-printed JSON (json.load / pd.read_json) vs memory-mapped .npy snapshots.
+
+Load times use the real teams and divisions files. Memory is measured in a fresh process per
+method on a synthetic 200,000-row table, where private (anonymous) and shared (file-backed)
+resident memory can be told apart.
+
+Run from the repository root: python -m benchmarks.bench_snapshots
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import timeit
+import numpy as np
+import pandas as pd
+from snapshot import export_snapshot, records, snapshot_path
+
+ROUNDS = 200
+ROWS = 200_000
+
+LOADERS = {
+    "json.load": "import json; table = json.load(open(PATH))",
+    "pd.read_json": "import pandas as pd; table = pd.read_json(PATH, dtype=str)",
+    "snapshot (mmap)": "from snapshot import load_snapshot; table = load_snapshot(PATH)",
+    "snapshot -> DataFrame": "import pandas as pd; from snapshot import load_snapshot; table = pd.DataFrame(load_snapshot(PATH))",
+}
+
+MEMORY_PROBE = """
+import sys
+sys.path.insert(0, ".")
+PATH = sys.argv[1]
+
+def rss():
+    status = dict(line.split(":", 1) for line in open("/proc/self/status"))
+    return int(status["RssAnon"].split()[0]) // 1024, int(status["RssFile"].split()[0]) // 1024
+
+import json, pandas as pd, numpy as np, snapshot
+before = rss()
+{loader}
+after = rss()
+print(after[0] - before[0], after[1] - before[1])
+"""
+
+
+def load_times(json_path):
+    export_snapshot(json_path)
+    with open(json_path) as f:
+        expected = json.load(f)
+
+    timings = {
+        "json.load": lambda: json.load(open(json_path)),
+        "pd.read_json": lambda: pd.read_json(json_path, dtype=str),
+        "snapshot (mmap)": lambda: np.load(snapshot_path(json_path), mmap_mode="r"),
+        "snapshot -> records": lambda: records(np.load(snapshot_path(json_path), mmap_mode="r")),
+        "snapshot -> DataFrame": lambda: pd.DataFrame(np.load(snapshot_path(json_path), mmap_mode="r")),
+    }
+    assert records(np.load(snapshot_path(json_path), mmap_mode="r")) == expected
+    for label, load in timings.items():
+        ms = timeit.timeit(load, number=ROUNDS) / ROUNDS * 1000
+        print(f"  {label:24}{ms:>10.3f} ms")
+
+
+def memory(json_path):
+    print(f"{'':24}{'private MB':>12}{'shared MB':>12}")
+    for label, loader in LOADERS.items():
+        code = MEMORY_PROBE.replace("{loader}", loader)
+        output = subprocess.run([sys.executable, "-c", code, json_path], capture_output=True, text=True, check=True)
+        private, shared = output.stdout.split()
+        print(f"  {label:22}{private:>12}{shared:>12}")
+
+
+def main():
+    for json_path in ("data/teams.json", "data/divisions.json"):
+        print(f"{json_path} ({os.path.getsize(json_path)} bytes JSON, "
+              f"{os.path.getsize(export_snapshot(json_path))} bytes snapshot)")
+        load_times(json_path)
+
+    with open("data/teams.json") as f:
+        teams = json.load(f)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, "table.json")
+        with open(json_path, "w") as f:
+            json.dump([{**teams[i % len(teams)], "row": i} for i in range(ROWS)], f, indent=2)
+        export_snapshot(json_path)
+        print(f"\n{ROWS} rows ({os.path.getsize(json_path) // 2**20} MB JSON, "
+              f"{os.path.getsize(snapshot_path(json_path)) // 2**20} MB snapshot), one fresh process each")
+        memory(json_path)
+
+
+if __name__ == "__main__":
+    main()
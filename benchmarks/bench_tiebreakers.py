@@ -0,0 +1,52 @@
+# benchmarks/bench_tiebreakers.py
+"""Tiebreakers and playoff seeding for all 32 teams: a full mock season and seasons built for big ties.
+
+Run from the repository root: python -m benchmarks.bench_tiebreakers
+"""
+import os
+import timeit
+
+os.environ.setdefault("MOCK_NOW", "2025-01-07T12:00Z")  # Every regular season game final
+import mock_server
+import pandas as pd
+from roster_cache import load_teams
+from standings_engine import final_games_frame
+from tiebreakers import build_season_table, seed_playoffs
+
+ROUNDS = 200
+
+
+def bench(label, games, team_ids, division_of):
+    table = build_season_table(games, team_ids, division_of)
+    seeding = seed_playoffs(table)
+    build_ms = timeit.timeit(lambda: build_season_table(games, team_ids, division_of), number=ROUNDS) / ROUNDS * 1000
+    seed_ms = timeit.timeit(lambda: seed_playoffs(table), number=ROUNDS) / ROUNDS * 1000
+    tied = pd.Series(table.win_pct).round(6).value_counts()
+    print(f"{label:24}{len(games):>6}{int(tied.max()):>10}{build_ms:>10.2f}{seed_ms:>10.2f}")
+    return seeding
+
+
+def main():
+    events = {event["id"]: event for event in mock_server._season_events()}
+    games = final_games_frame(events)
+    team_ids = [team["id"] for team in load_teams()]
+    division_of = pd.read_json("data/divisions.json", dtype={"team_id": str}).set_index("team_id")["division_name"]
+
+    print(f"{'':24}{'games':>6}{'max tied':>10}{'table ms':>10}{'seed ms':>10}")
+    seeding = bench("full season", games, team_ids, division_of)
+
+    # Home team wins every game: most clubs finish 8-9 or 9-8, so nearly every spot is a multi-team tie
+    home_wins = games.assign(home_score=1.0, away_score=0.0)
+    bench("home team always wins", home_wins, team_ids, division_of)
+
+    # Every game tied: all 32 clubs at .500 and each tie goes down to strength of schedule or a coin toss
+    all_tied = games.assign(home_score=0.0, away_score=0.0)
+    bench("every game tied", all_tied, team_ids, division_of)
+
+    names = {team["id"]: team["display_name"] for team in load_teams()}
+    for conference, seeds in seeding["seeds"].items():
+        print(("AFC" if conference == 0 else "NFC") + " seeds: " + ", ".join(names[team_ids[team]] for team in seeds))
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,11 @@
 from flask_caching import Cache
 import diskcache
 
-# Initialize diskcache explicitly for Heroku's ephemeral storage
-disk_cache = diskcache.Cache("cache-directory")  # Set directory for disk storage
+# Initialize diskcache explicitly for Heroku's ephemeral storage. It gets its own directory
+# because FileSystemCache.clear() removes every file in CACHE_DIR, including diskcache's database.
+disk_cache = diskcache.Cache("diskcache-directory")  # Shared by all workers on the dyno
 cache = Cache(config={
     'CACHE_TYPE': 'FileSystemCache',  # Use file system cache, which works with DiskCache as well
     'CACHE_DIR': "cache-directory",  # Directory for disk-based caching
     'CACHE_DEFAULT_TIMEOUT': 1800,  # Cache timeout set to 30 minutes
-})
\ No newline at end of file
+})
@@ -7,18 +7,130 @@ if not os.getenv("API_KEY"):
     load_dotenv()
 
 API_KEY = os.getenv("API_KEY")
-NFL_EVENTS_URL = "https://nfl-api-data.p.rapidapi.com/nfl-events"
-ODDS_URL = "https://nfl-api-data.p.rapidapi.com/nfl-eventodds"
-SCORING_PLAYS_URL = "https://nfl-api-data.p.rapidapi.com/nfl-scoringplays"
-SCOREBOARD_URL = "https://nfl-api-data.p.rapidapi.com/nfl-scoreboard-day"
-SCOREBOARD_WEEK_URL = "https://nfl-api-data.p.rapidapi.com/nfl-scoreboard-week-type"
-TEAMS_URL = "https://nfl-api-data.p.rapidapi.com/nfl-team-list"
-RECORD_URL = "https://nfl-api-data.p.rapidapi.com/nfl-team-record"
-DIVISION_URL = "https://nfl-api-data.p.rapidapi.com/nfl-team-groups"
-PLAYERS_URL = "https://nfl-api-data.p.rapidapi.com/nfl-player-listing/v1/data"
+# Set API_BASE_URL=http://127.0.0.1:8099 to run against mock_server.py instead of RapidAPI
+API_BASE_URL = os.environ.get("API_BASE_URL", "https://nfl-api-data.p.rapidapi.com").rstrip("/")
+NFL_EVENTS_URL = f"{API_BASE_URL}/nfl-events"
+ODDS_URL = f"{API_BASE_URL}/nfl-eventodds"
+SCORING_PLAYS_URL = f"{API_BASE_URL}/nfl-scoringplays"
+SCOREBOARD_URL = f"{API_BASE_URL}/nfl-scoreboard-day"
+SCOREBOARD_WEEK_URL = f"{API_BASE_URL}/nfl-scoreboard-week-type"
+TEAMS_URL = f"{API_BASE_URL}/nfl-team-list"
+DIVISION_URL = f"{API_BASE_URL}/nfl-team-groups"
+PLAYERS_URL = f"{API_BASE_URL}/nfl-player-listing/v1/data"
 HEADERS = {
     "x-rapidapi-key": API_KEY,
     "x-rapidapi-host": "nfl-api-data.p.rapidapi.com"
 }
-ODDS_FILE_PATH = 'data/last_fetched_odds.json'
+
+# Shared HTTP session settings (see http_client.py)
+HTTP_POOL_CONNECTIONS = int(os.environ.get('HTTP_POOL_CONNECTIONS', 4))  # Number of host pools to keep
+HTTP_POOL_MAXSIZE = int(os.environ.get('HTTP_POOL_MAXSIZE', 20))  # Keep-alive connections per host
+HTTP_MAX_RETRIES = int(os.environ.get('HTTP_MAX_RETRIES', 2))
+HTTP_BACKOFF_FACTOR = float(os.environ.get('HTTP_BACKOFF_FACTOR', 0.3))
+HTTP_DEFAULT_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+ENDPOINT_TIMEOUTS = {
+    "events": (3.05, 30),  # Full-season payload
+    "scoreboard_day": (3.05, 5),
+    "scoreboard_week": (3.05, 10),
+    "odds": (3.05, 5),
+    "scoring_plays": (3.05, 5),
+    "teams": (3.05, 10),
+    "division": (3.05, 5),
+    "players": (3.05, 10),
+}
+
+# Quota-aware scheduler (see scheduler.py). Priority classes: 0 live scores, 1 scoring plays,
+# 2 odds, 3 rosters and standings. Lower classes back off first and fall back to cached data.
+RATE_LIMIT_PER_SECOND = float(os.environ.get('RATE_LIMIT_PER_SECOND', 5))
+RATE_LIMIT_BURST = int(os.environ.get('RATE_LIMIT_BURST', 10))
+MONTHLY_REQUEST_BUDGET = int(os.environ.get('MONTHLY_REQUEST_BUDGET', 100000))
+ENDPOINT_PRIORITIES = {
+    "scoreboard_day": 0,
+    "events": 1,  # Drives the schedule on the scores page
+    "scoring_plays": 1,
+    "odds": 2,
+    "scoreboard_week": 2,
+    "teams": 3,
+    "division": 3,
+    "players": 3,
+}
+PRIORITY_TOKEN_RESERVE = {0: 0, 1: 1, 2: 3, 3: 5}  # Tokens a class must leave in the bucket
+PRIORITY_BUDGET_RESERVE = {0: 0.0, 1: 0.02, 2: 0.05, 3: 0.10}  # Share of the monthly budget kept back
+PRIORITY_MAX_WAIT = {0: 10, 1: 5, 2: 3, 3: 2}  # Seconds a class queues for a token before degrading
+
+# Stale-while-revalidate policies per endpoint (see swr_cache.py), in seconds.
+# "fresh": served without contacting upstream. "max_stale": served immediately while a
+# background refresh runs. Older entries block on a synchronous fetch.
+CACHE_POLICIES = {
+    "events": {"fresh": 1800, "max_stale": 6 * 3600},
+    "scoreboard_week": {"fresh": 1800, "max_stale": 6 * 3600},
+    "scoreboard_day": {"fresh": 10, "max_stale": 60},
+    "odds": {"fresh": 300, "max_stale": 24 * 3600},
+    "scoring_plays": {"fresh": 30, "max_stale": 300},
+    "teams": {"fresh": 24 * 3600, "max_stale": 30 * 24 * 3600},
+    "division": {"fresh": 24 * 3600, "max_stale": 30 * 24 * 3600},
+}
+DEFAULT_CACHE_POLICY = {"fresh": 300, "max_stale": 3600}
+CACHE_RETENTION = 30 * 24 * 3600  # How long entries are kept on disk at all
+SINGLE_FLIGHT_WINDOW = 2  # Seconds a coalesced result is shared with late arrivals from other workers
+SINGLE_FLIGHT_TIMEOUT = 30  # Longest a caller waits on someone else's in-flight request
+
+# Rendered game cards and detail panels (see render_cache.py). Keys include a hash of the rendering
+# code, so a deploy that changes how fragments look never serves old ones.
+RENDER_CACHE_CODE = ('utils.py', 'render_cache.py')  # Modules whose source is part of every key
+RENDER_CACHE_TTL = 3600  # Seconds a fragment of a game that can still change is kept
+RENDER_CACHE_FINAL_TTL = 30 * 24 * 3600  # Seconds a fragment of a final game is kept
+
+# Background scoreboard poller (see poller.py). One worker holds the lease and publishes snapshots.
+POLLER_ENABLED = os.environ.get('POLLER_ENABLED', '1') == '1'  # Set to 0 when running poller.py as a sidecar
+POLLER_INTERVAL = int(os.environ.get('POLLER_INTERVAL', 10))  # Seconds between scoreboard fetches while live
+POLLER_LEASE_TTL = 3 * POLLER_INTERVAL  # A dead leader is replaced after this many seconds
+
+# Schedule-aware polling (see polling.py), in seconds
+POLL_LIVE_INTERVAL = 12  # Browser refresh of live scores while games are on
+POLL_MAX_IDLE_INTERVAL = 30 * 60  # Longest wait before re-checking the schedule when no game is on
+POLL_IDLE_STEP = 60  # The poller's idle wait is slept in steps this long, re-planning if the schedule changes
+GAME_WINDOW = 4 * 3600 + 30 * 60  # A game counts as possibly live this long after kickoff
+
+# Server-sent live score updates (see livefeed.py)
+LIVE_FEED_CHECK_INTERVAL = 1  # Seconds between each worker's checks for a new poller snapshot
+LIVE_FEED_HEARTBEAT = 15  # Seconds of silence before a keep-alive comment is sent to a client
+LIVE_FEED_BACKLOG = 256  # Deltas kept per worker for clients resuming with Last-Event-ID
+LIVE_FEED_RETRY_MS = 3000  # Browser reconnect delay after a dropped stream
+
+# Team rosters (see roster_cache.py). Prewarmed at startup and refreshed once a day off-peak.
+ROSTER_REFRESH_ENABLED = os.environ.get('ROSTER_REFRESH_ENABLED', '1') == '1'
+ROSTER_TTL = 24 * 3600  # A roster older than this is refetched by the next prewarm
+ROSTER_REFRESH_HOUR_UTC = 9  # Daily refresh at 5am Eastern, when nobody is browsing
+ROSTER_LEASE_TTL = 15 * 60  # Longest a worker may hold the refresh lease
+ROSTER_RETRY_ATTEMPTS = 3  # Extra rounds for rosters whose fetch failed, e.g. no bulk token in time
+ROSTER_RETRY_BACKOFF = 5  # Seconds before the first retry round, doubled for each later one
+
+# Playoff odds simulation (see simulator.py)
+# Seasons simulated per data version. ~5-7 s on one core at ~3-4k seasons/s; the odds are shown as
+# whole percentages and 20k seasons keeps their standard error under half a point.
+SIM_SEASONS = int(os.environ.get('SIM_SEASONS', 20000))
+SIM_BATCH_SIZE = 2000  # Seasons per process pool task
+SIM_PROCESSES = int(os.environ.get('SIM_PROCESSES', os.cpu_count() or 1))
+SIM_SPREAD_STDDEV = 13.5  # Points; spread of final margins around the betting line
+
+# Background jobs (see jobs.py). Status lives in diskcache so every worker sees the same job.
+JOB_TIMEOUT = 15 * 60  # A job still running after this long is reported failed and may be resubmitted
+JOB_STATUS_TTL = 24 * 3600  # Seconds a finished job's status is kept
+JOB_COOLDOWN = {"standings": 60, "rosters": 3600, "odds": 300}  # Seconds after a run before the next may start
+JOB_ROSTER_MAX_AGE = 3600  # A roster job only refetches rosters not checked within this many seconds
+JOBS_TOKEN = os.environ.get('JOBS_TOKEN')  # Bearer token for POST /api/jobs/<kind>; that route is off without it
+
+FANOUT_CONCURRENCY = int(os.environ.get('FANOUT_CONCURRENCY', 8))  # Max concurrent upstream calls per fan-out
+# Bulk fetches (rosters) only run while the bucket holds more than the bulk reserve; more calls
+# in flight than that just queue for tokens and time out
+BULK_FANOUT_CONCURRENCY = max(1, min(FANOUT_CONCURRENCY, RATE_LIMIT_BURST - PRIORITY_TOKEN_RESERVE[3]))
+ODDS_FILE_PATH = 'data/last_fetched_odds.json'  # Legacy odds file, migrated into ODDS_DB_PATH on first use
+ODDS_DB_PATH = os.environ.get('ODDS_DB_PATH', 'data/odds.sqlite3')
+TEAMS_FILE_PATH = 'data/teams.json'
+DIVISIONS_FILE_PATH = 'data/divisions.json'
+SNAPSHOT_VERSION = 1  # Binary snapshots of data/*.json (see snapshot.py); bump when their layout changes
+# Tables read through snapshots. Only those loaded as DataFrames: for small lists of dicts such as
+# teams.json, json.load is faster than mapping and converting back (benchmarks/bench_snapshots.py)
+SNAPSHOT_TABLES = (DIVISIONS_FILE_PATH,)
 PORT = int(os.environ.get('PORT', 8080))
\ No newline at end of file
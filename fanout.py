@@ -0,0 +1,65 @@
+# fanout.py
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from config import FANOUT_CONCURRENCY
+
+
+def _timed_call(func, item):
+    start = time.perf_counter()
+    result = func(item)
+    return result, time.perf_counter() - start
+
+
+def fan_out(func, items, concurrency=FANOUT_CONCURRENCY, skip=None, on_result=None):
+    """Call func(item) for every item with at most `concurrency` calls in flight.
+
+    skip(item) is checked just before an item is submitted, so it can look at results that
+    have already come back. on_result(index, item, result) runs in the calling thread as each
+    call completes. Returns ({index: result}, stats), where stats compares wall-clock time with
+    the summed duration of the individual calls (what a serial loop would have cost).
+    """
+    items = list(items)
+    results = {}
+    serial_time = 0.0
+    skipped = 0
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        pending = {}
+        next_index = 0
+
+        while next_index < len(items) or pending:
+            # Top up the in-flight window
+            while next_index < len(items) and len(pending) < concurrency:
+                item = items[next_index]
+                if skip and skip(item):
+                    skipped += 1
+                else:
+                    pending[executor.submit(_timed_call, func, item)] = next_index
+                next_index += 1
+
+            if not pending:
+                continue
+
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    result, elapsed = future.result()
+                except Exception as e:
+                    print(f"Error in fan-out call for {items[index]}: {e}")
+                    result, elapsed = None, 0.0
+                serial_time += elapsed
+                results[index] = result
+                if on_result:
+                    on_result(index, items[index], result)
+
+    wall_time = time.perf_counter() - start
+    stats = {
+        "calls": len(results),
+        "skipped": skipped,
+        "wall_time": wall_time,
+        "serial_time": serial_time,
+        "speedup": serial_time / wall_time if wall_time > 0 else 1.0,
+    }
+    return results, stats
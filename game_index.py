@@ -0,0 +1,61 @@
+# game_index.py
+import threading
+from season_index import get_season_index
+
+_index = {"version": None, "status": {}, "details": {}}
+_index_lock = threading.Lock()
+
+
+def _status_key(event):
+    competitors = event.get("competitions", [{}])[0].get("competitors", [])
+    return (
+        event.get("status", {}).get("type", {}).get("description"),
+        event.get("status", {}).get("period"),
+        event.get("status", {}).get("displayClock"),
+        tuple(competitor.get("score") for competitor in competitors),
+    )
+
+
+def build_game_detail(event):
+    """Line scores, leaders and home/away competitors for one event."""
+    competition = event.get("competitions", [{}])[0]
+    competitors = competition.get("competitors", [])
+    home_team = next((team for team in competitors if team.get("homeAway") == "home"), None)
+    away_team = next((team for team in competitors if team.get("homeAway") == "away"), None)
+
+    game_status = event.get("status", {}).get("type", {}).get("description", "").lower()
+    season_type = event.get("season", {}).get("type")
+    # Only regular season games with a final status get a box score
+    has_line_scores = season_type == 2 and game_status == "final"
+
+    return {
+        "status": game_status,
+        "home_team": home_team,
+        "away_team": away_team,
+        "home_line_scores": [score.get("value") for score in home_team.get("linescores", [])]
+        if has_line_scores and home_team else [],
+        "away_line_scores": [score.get("value") for score in away_team.get("linescores", [])]
+        if has_line_scores and away_team else [],
+        "leaders": competition.get("leaders", []),
+    }
+
+
+def _refresh(season_index):
+    """Rebuild details only for events whose status or score changed since the last refresh."""
+    status, details = dict(_index["status"]), dict(_index["details"])
+    for game_id, event in season_index["events_by_id"].items():
+        key = _status_key(event)
+        if status.get(game_id) != key:
+            status[game_id] = key
+            details[game_id] = build_game_detail(event)
+    _index.update(version=season_index["version"], status=status, details=details)
+
+
+def get_game_detail(game_id):
+    """Detail for one game, keeping the index in step with the latest events refresh."""
+    season_index = get_season_index()
+    if _index["version"] != season_index["version"] or not _index["details"]:
+        with _index_lock:
+            if _index["version"] != season_index["version"] or not _index["details"]:
+                _refresh(season_index)
+    return _index["details"].get(game_id)
@@ -0,0 +1,124 @@
+# http_client.py
+import threading
+import time
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+import scheduler
+from config import (HEADERS, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE, HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR,
+                    HTTP_DEFAULT_TIMEOUT, ENDPOINT_TIMEOUTS)
+
+RETRY_STATUSES = (500, 502, 503, 504)  # 429 is left to the scheduler
+
+_session = None
+_session_lock = threading.Lock()
+_stats = {"requests": 0, "new_connections": 0, "pools": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(name):
+    with _stats_lock:
+        _stats[name] += 1
+
+
+# Counting hooks: every socket the pools open goes through connect(), every request through send()
+class _CountingHTTPConnection(HTTPConnection):
+    def connect(self):
+        _count("new_connections")
+        super().connect()
+
+
+class _CountingHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        _count("new_connections")
+        super().connect()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CountingHTTPConnection
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _count("pools")
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CountingHTTPSConnection
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _count("pools")
+
+
+class _CountingAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {"http": _CountingHTTPConnectionPool,
+                                                   "https": _CountingHTTPSConnectionPool}
+
+    def send(self, request, *args, **kwargs):
+        _count("requests")
+        return super().send(request, *args, **kwargs)
+
+
+def _build_session():
+    """Create a pooled keep-alive session shared by every fetch_* function."""
+    # Only failed connects are retried here: those requests never reached upstream, so they cost
+    # no quota. Retries of requests that did reach it go through get(), which pays for each one.
+    retry = Retry(
+        total=HTTP_MAX_RETRIES,
+        connect=HTTP_MAX_RETRIES,
+        read=0,
+        status=0,
+        other=0,
+        backoff_factor=HTTP_BACKOFF_FACTOR,
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,  # Let callers see the final response and decide
+    )
+    adapter = _CountingAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+        pool_block=False,
+    )
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session():
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get(url, endpoint, params=None, headers=None):
+    """GET through the shared session using the timeout configured for the endpoint.
+
+    Every attempt, retries of 5xx responses included, spends a token from the quota scheduler
+    first, and raises scheduler.QuotaExceeded instead of sending when the endpoint's class is
+    out of quota.
+    """
+    timeout = ENDPOINT_TIMEOUTS.get(endpoint, HTTP_DEFAULT_TIMEOUT)
+    for attempt in range(HTTP_MAX_RETRIES + 1):
+        scheduler.acquire(endpoint)
+        response = get_session().get(url, params=params, headers=headers, timeout=timeout)
+        scheduler.record_response(response)
+        if response.status_code not in RETRY_STATUSES or attempt == HTTP_MAX_RETRIES:
+            return response
+        time.sleep(HTTP_BACKOFF_FACTOR * 2 ** attempt)
+
+
+def connection_stats():
+    """Report how many upstream connections were opened and how many requests reused one."""
+    with _stats_lock:
+        stats = dict(_stats)
+    stats["reused_connections"] = max(stats["requests"] - stats["new_connections"], 0)
+    return stats
@@ -0,0 +1,127 @@
+# jobs.py
+import threading
+import time
+import uuid
+from cache_config import disk_cache
+from config import JOB_TIMEOUT, JOB_STATUS_TTL, JOB_COOLDOWN, JOB_ROSTER_MAX_AGE
+from utils import update_standings, resolve_week_odds
+from roster_cache import refresh_rosters
+from season_index import get_season_index, current_week
+from odds_store import get_odds_store
+
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+
+JOB_KEY = "job:{}"
+ODDS_WAIT = 60  # Longest a standings job waits for the playoff odds of the new results
+
+
+def _lock_key(kind):
+    return JOB_KEY.format(kind) + ":lock"
+
+
+def rebuild_standings(progress):
+    from standings import get_standings  # pandas and the standings engine load on first use
+
+    progress(0.1, "Fetching results")
+    update_standings()
+    progress(0.4, "Ranking teams")
+    get_standings()
+
+    # The simulation for the new results runs in the background; the job ends when the page has it
+    deadline = time.monotonic() + ODDS_WAIT
+    while "playoffs_odds" not in get_standings():
+        if time.monotonic() > deadline:
+            return "Standings updated, playoff odds still simulating"
+        progress(0.6, "Simulating playoff odds")
+        time.sleep(1)
+    return "Standings updated"
+
+
+def rebuild_rosters(progress):
+    progress(0.0, "Fetching rosters")
+    result = refresh_rosters(max_age=JOB_ROSTER_MAX_AGE, progress=lambda done, total: progress(
+        done / total, f"Fetched {done} of {total} rosters"))
+    message = f"{result['changed']} of {result['fetched']} rosters changed"
+    if result["failed"]:
+        message += f", {result['failed']} could not be fetched"
+    return message
+
+
+def rebuild_odds(progress):
+    week_index = current_week(get_season_index())
+    if week_index is None:
+        return "No week to fetch spreads for"  # Season calendar not published yet
+    progress(0.2, "Fetching spreads")
+    changed = resolve_week_odds(week_index, get_odds_store())
+    return "Spreads updated" if changed else "Spreads unchanged"
+
+
+JOBS = {
+    "standings": rebuild_standings,
+    "rosters": rebuild_rosters,
+    "odds": rebuild_odds,
+}
+
+
+def get_job(kind):
+    """Status of the latest job of this kind on any worker, or None if there hasn't been one."""
+    status = disk_cache.get(JOB_KEY.format(kind))
+    if status and status["state"] == RUNNING and _lock_key(kind) not in disk_cache:
+        # The worker running it went away, or the job overran JOB_TIMEOUT
+        status = {**status, "state": FAILED, "message": "Job stopped unexpectedly"}
+    return status
+
+
+def submit_job(kind):
+    """Start a job of this kind in the background. Returns its status.
+
+    A job of the same kind already running on any worker is returned instead of starting a
+    second one, so repeated clicks and other tabs all follow the same run. Within
+    JOB_COOLDOWN of the last successful run finishing, that run is returned and nothing starts,
+    so the trigger can't be used to burn upstream quota. A failed run can be retried at once.
+    """
+    job_id = uuid.uuid4().hex[:12]
+    status = {
+        "id": job_id,
+        "kind": kind,
+        "state": RUNNING,
+        "progress": 0.0,
+        "message": "Starting",
+        "started_at": time.time(),
+        "finished_at": None,
+    }
+    # Cooldown check, lock and status in one transaction, so two workers can't both pass the
+    # check and one that loses the lock always sees the winner's status
+    with disk_cache.transact():
+        last = get_job(kind)
+        if last and last["state"] == DONE and time.time() - last["finished_at"] < JOB_COOLDOWN.get(kind, 0):
+            return last
+        if not disk_cache.add(_lock_key(kind), job_id, expire=JOB_TIMEOUT):
+            if last and last["state"] == RUNNING:
+                return last
+            # Another run holds the lock but its status is gone (evicted or expired)
+            return {**status, "id": disk_cache.get(_lock_key(kind)), "message": "Running"}
+        disk_cache.set(JOB_KEY.format(kind), status, expire=JOB_STATUS_TTL)
+    threading.Thread(target=_run, args=(kind, status), name=f"job-{kind}", daemon=True).start()
+    return status
+
+
+def _run(kind, status):
+    def progress(fraction, message):
+        status.update(progress=round(fraction, 3), message=message)
+        disk_cache.set(JOB_KEY.format(kind), status, expire=JOB_STATUS_TTL)
+
+    try:
+        message = JOBS[kind](progress)
+        status.update(state=DONE, progress=1.0, message=message)
+    except Exception as e:
+        print(f"Error running {kind} job: {e}")
+        status.update(state=FAILED, message=str(e))
+    finally:
+        status["finished_at"] = time.time()
+        disk_cache.set(JOB_KEY.format(kind), status, expire=JOB_STATUS_TTL)
+        with disk_cache.transact():
+            if disk_cache.get(_lock_key(kind)) == status["id"]:  # Not a newer run's lock after a timeout
+                disk_cache.delete(_lock_key(kind))
@@ -1,451 +1,527 @@
 # layout.py
-from dash import dcc, html
-import json
-import os
-from datetime import datetime
+from dash import dcc, html, dash_table
 import dash_bootstrap_components as dbc
-from utils import create_standings, create_roster_table,hex_to_rgba
-
-# Get the prepared standings data
-standings_df = create_standings()
-creation_time = os.path.getctime('data/records.json')
-creation_date = datetime.fromtimestamp(creation_time).strftime('%B %d, %Y')
-
+from utils import hex_to_rgba
 
 # Main layout with styled header and centered dropdown
-main_layout = dbc.Container([
-    dcc.Interval(id='interval-scores', interval=12 * 1000, n_intervals=0),
-    dcc.Interval(id='interval-odds', interval=300 * 1000, n_intervals=0),
-    dcc.Store(id='init-complete', data=False),
-    dcc.Store(id='in-progress-flag', data=False),
-    dcc.Store(id='selected-week', data={'value': None}),
-    dcc.Store(id='week-options-store', data=False),
-    dcc.Store(id='scores-data', data=[]),
-    dcc.Store(id='nfl-events-data', data={}),
+def main_layout():
+    """Scores page. Built per visit; the game cards are filled in by callbacks."""
+    return dbc.Container([
+        dcc.Interval(id='interval-scores', interval=12 * 1000, n_intervals=0),
+        dcc.Interval(id='interval-odds', interval=300 * 1000, n_intervals=0),
+        dcc.Store(id='init-complete', data=False),
+        dcc.Store(id='selected-week', data={'value': None}),
+        dcc.Store(id='week-options-store', data=False),
+        dcc.Store(id='scores-data', data={}),  # Live fields by game_id
+        dcc.Store(id='live-feed', data=None),  # Set once the browser's live score stream is open
+        dcc.Store(id='nfl-events-data', data=None),  # Version of the server-side season data
+        dcc.Store(id='odds-version', data=None),
 
-    # Header with NFL Logo and Title for Main Layout
-    dbc.Card([
-        dbc.CardBody(
-            html.Div([
-                html.Img(src="assets/nfl-3644686_1280.webp", height="100px", style={"marginRight": "15px"}),
-                html.H1("NFL Games", style={
-                    "display": "inline-block",
-                    "verticalAlign": "middle",
-                    "color": "white",
-                    "padding": "10px 20px",
-                    # "backgroundColor": "#1E3A5F",
-                    "borderRadius": "8px",
-                    "fontSize": "2.5rem",
-                    "fontWeight": "bold",
-                    "margin": "0"
-                })
-            ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})
-        )
-    ], style={
-        "backgroundColor": "#1E3A5F",
-        "marginBottom": "20px",
-        "borderRadius": "8px",
-        "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.3)",
-        "padding": "10px"
-    }),
+        # Header with NFL Logo and Title for Main Layout
+        dbc.Card([
+            dbc.CardBody(
+                html.Div([
+                    html.Img(src="assets/nfl-3644686_1280.webp", height="100px", style={"marginRight": "15px"}),
+                    html.H1("NFL Games", style={
+                        "display": "inline-block",
+                        "verticalAlign": "middle",
+                        "color": "white",
+                        "padding": "10px 20px",
+                        # "backgroundColor": "#1E3A5F",
+                        "borderRadius": "8px",
+                        "fontSize": "2.5rem",
+                        "fontWeight": "bold",
+                        "margin": "0"
+                    })
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})
+            )
+        ], style={
+            "backgroundColor": "#1E3A5F",
+            "marginBottom": "20px",
+            "borderRadius": "8px",
+            "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.3)",
+            "padding": "10px"
+        }),
 
-    dbc.Row(
-        dbc.Col(
-            dcc.Dropdown(
-                id='week-selector',
-                options=[],
-                placeholder="Select a week",
-                style={
-                    "width": "100%",
-                    "textAlign": "center",
-                    "fontSize": "18px",
-                    "padding": "3px",
-                    "border": "none",
-                    "borderRadius": "8px",
-                    # "backgroundColor": "#FFFFFF",  # Fully opaque white background
-                    "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.1)",  # Subtle shadow
-                }
+        dbc.Row(
+            dbc.Col(
+                dcc.Dropdown(
+                    id='week-selector',
+                    options=[],
+                    placeholder="Select a week",
+                    style={
+                        "width": "100%",
+                        "textAlign": "center",
+                        "fontSize": "18px",
+                        "padding": "3px",
+                        "border": "none",
+                        "borderRadius": "8px",
+                        # "backgroundColor": "#FFFFFF",  # Fully opaque white background
+                        "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.1)",  # Subtle shadow
+                    }
+                ),
+                width=6,  # Adjust width as needed
+                style={"display": "flex", "justifyContent": "center"}  # Center the dropdown in the column
             ),
-            width=6,  # Adjust width as needed
-            style={"display": "flex", "justifyContent": "center"}  # Center the dropdown in the column
+            justify="center",
+            style={"marginBottom": "20px"}
         ),
-        justify="center",
-        style={"marginBottom": "20px"}
-    ),
 
-    # Game information loading section
-    dbc.Row(
-        dbc.Col(
-            dcc.Loading(
-                id='loading',
-                type='circle',
-                children=[html.Div(id='static-game-info'), html.Div(id='dynamic-game-info')]
-            ),
-            width=12
+        # Game information loading section
+        dbc.Row(
+            dbc.Col(
+                dcc.Loading(
+                    id='loading',
+                    type='circle',
+                    children=[html.Div(id='static-game-info'), html.Div(id='dynamic-game-info')]
+                ),
+                width=12
+            )
         )
-    )
-], fluid=True)
-
+    ], fluid=True)
 
-# Standings layout
-# Filter divisions based on AFC or NFC
-afc_divisions = standings_df[standings_df["division_name"].str.startswith("AFC")]
-nfc_divisions = standings_df[standings_df["division_name"].str.startswith("NFC")]
 
 # Standings layout with AFC and NFC subheadings
-standings_layout = dbc.Container([
-    # Header with NFL Logo and Title
-    dbc.Card([
-        dbc.CardBody(
-            html.Div([
-                html.Img(src="assets/nfl-3644686_1280.webp", height="75px", style={"marginRight": "15px"}),
+def standings_layout():
+    """Standings page shell. The date and tables are filled in by a callback (see standings.py)."""
+    return dbc.Container([
+        # Header with NFL Logo and Title
+        dbc.Card([
+            dbc.CardBody(
                 html.Div([
-                    html.H1("Current Standings", style={
-                        "color": "white",
-                        "padding": "0px 0px",
-                        "borderRadius": "8px",
-                        "fontSize": "2.5rem",
-                        "fontWeight": "bold",
-                        "margin": "0",
-                        "marginBottom": "2px !important"
-                    }),
-                    # Displaying the creation date below the heading
-                    html.P(f"{creation_date}", style={
-                        "color": "white",
-                        "fontSize": "1rem",
-                        "margin": "0",
-                        "marginTop": "2px !important",
-                        "fontStyle": "italic"
-                    }),
-                    # Add the button for updating standings
-                    dbc.Button(
-                        "Update Standings",
-                        id="update-standings-button",
-                        color="primary",
-                        style={"marginTop": "15px"}
-                    ),
-                    # Add a hidden Store component to track the button state
-                    dcc.Store(id="button-state", data="default")
-                ], style={"textAlign": "center"})
-            ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})
-        )
-    ], style={
-        "backgroundColor": "#1E3A5F",
-        "marginBottom": "20px",
-        "borderRadius": "8px"
-    }),
+                    html.Img(src="assets/nfl-3644686_1280.webp", height="75px", style={"marginRight": "15px"}),
+                    html.Div([
+                        html.H1("Current Standings", style={
+                            "color": "white",
+                            "padding": "0px 0px",
+                            "borderRadius": "8px",
+                            "fontSize": "2.5rem",
+                            "fontWeight": "bold",
+                            "margin": "0",
+                            "marginBottom": "2px !important"
+                        }),
+                        # Displaying the creation date below the heading
+                        html.P(id="standings-updated-date", style={
+                            "color": "white",
+                            "fontSize": "1rem",
+                            "margin": "0",
+                            "marginTop": "2px !important",
+                            "fontStyle": "italic"
+                        }),
+                        # Add the button for updating standings
+                        dbc.Button(
+                            "Update Standings",
+                            id="update-standings-button",
+                            color="primary",
+                            style={"marginTop": "15px"}
+                        ),
+                        # Progress of the background update job, polled while it runs
+                        dbc.Progress(id="standings-job-progress", value=0, striped=True, animated=True,
+                                     style={"display": "none"}),
+                        dcc.Interval(id="standings-job-interval", interval=1000, disabled=True),
+                        dcc.Location(id="standings-reload", refresh=True)
+                    ], style={"textAlign": "center"})
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})
+            )
+        ], style={
+            "backgroundColor": "#1E3A5F",
+            "marginBottom": "20px",
+            "borderRadius": "8px"
+        }),
+
+        # AFC and NFC tables of the current standings version
+        html.Div(id="standings-tables"),
+    ], fluid=True, style={"fontFamily": "Arial, sans-serif", "padding": "20px"})
+
 
-    # AFC Subheading with background and logo
-    dbc.Card([
-        dbc.CardBody([
-            html.Div([
-                html.Img(src="/assets/AFC_logo.webp", height="40px", style={"marginRight": "10px"}),
-                html.H2("AFC", style={"display": "inline-block", "verticalAlign": "middle", "marginBottom": "0"}),
-            ], style={"display": "flex", "alignItems": "center", "color": "white"})
-        ])
-    ], style={
-        "backgroundColor": "#003f5c",
-        "padding": "10px",
-        "marginTop": "20px",
-        "marginBottom": "10px",
-        "borderRadius": "8px",
-        "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.2)"
-    }),
+def build_standings_tables(standings_df):
+    """AFC and NFC division tables for one version of the standings data."""
+    # Filter divisions based on AFC or NFC
+    afc_divisions = standings_df[standings_df["division_name"].str.startswith("AFC")]
+    nfc_divisions = standings_df[standings_df["division_name"].str.startswith("NFC")]
+    has_odds = "playoffs_odds" in standings_df  # Only once a simulation run has finished
 
-    # AFC Division tables
-    *[
+    return [
+        # AFC Subheading with background and logo
         dbc.Card([
-            dbc.CardHeader(html.H3(division_df["division_name"].iloc[0], style={"textAlign": "left"})),
             dbc.CardBody([
-                html.Table(
-                    [
-                        # Header Row with Overall and Division section headers
-                        html.Tr([
-                            html.Th(),
-                            html.Th("Overall", colSpan="4", style={
-                                "textAlign": "center",
-                                "fontWeight": "bold",
-                                "backgroundColor": "#f0f0f0",
-                                "borderTopLeftRadius": "8px",
-                                "borderTopRightRadius": "8px",
-                                "boxShadow": "0px 2px 4px rgba(0, 0, 0, 0.1)",
-                            }),
-                            html.Th("Division", colSpan="4", style={
-                                "textAlign": "center",
-                                "fontWeight": "bold",
-                                "backgroundColor": "#e0e0e0",
-                                "borderTopLeftRadius": "8px",
-                                "borderTopRightRadius": "8px"
-                            })
-                        ]),
-                        # Subheader Row for Overall and Division details
-                        html.Tr([
-                            html.Th(),
-                            html.Th("W", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
-                            html.Th("L", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
-                            html.Th("T", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
-                            html.Th("Win %", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
-                            html.Th("W", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
-                            html.Th("L", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
-                            html.Th("T", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
-                            html.Th("Win %", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"})
-                        ])
-                    ] + [
-                        html.Tr([
-                            html.Td(
-                                [html.Img(src=row["logo"], style={"height": "40px", "marginRight": "10px"}),
-                                 html.Span(row["display_name"], style={"color": row["color"], "fontWeight": "bold"})],
-                                style={
-                                    "display": "flex",
-                                    "alignItems": "center",
-                                    "padding": "5px",
-                                    "backgroundColor": hex_to_rgba(row["color"], alpha=0.2),
-                                    "borderRadius": "5px",
-                                    "boxShadow": "0px 2px 4px rgba(0, 0, 0, 0.1)",
-                                }
-                            ),
-                            # Overall section with background
-                            html.Td(row["wins"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(220, 220, 220, 0.5)",
-                            }),
-                            html.Td(row["losses"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(220, 220, 220, 0.5)",
-                            }),
-                            html.Td(row["ties"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(220, 220, 220, 0.5)",
-                            }),
-                            html.Td(f"{row['overall_win%']:.3f}", style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(220, 220, 220, 0.5)",
-                            }),
-
-                            # Division section with background
-                            html.Td(row["division_wins"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(255, 255, 255, 0.5)",
-                            }),
-                            html.Td(row["division_losses"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(255, 255, 255, 0.5)",
-                            }),
-                            html.Td(row["division_ties"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(255, 255, 255, 0.5)",
-                            }),
-                            html.Td(f"{row['division_win%']:.3f}", style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(255, 255, 255, 0.5)",
-                            }),
-                        ])
-                        for _, row in division_df.iterrows()
-                    ],
-                    style={"width": "100%", "borderCollapse": "collapse", "marginTop": "10px", "fontSize": "24px"}
-                )
+                html.Div([
+                    html.Img(src="/assets/AFC_logo.webp", height="40px", style={"marginRight": "10px"}),
+                    html.H2("AFC", style={"display": "inline-block", "verticalAlign": "middle", "marginBottom": "0"}),
+                ], style={"display": "flex", "alignItems": "center", "color": "white"})
             ])
         ], style={
-            "marginBottom": "20px",
-            "boxShadow": "0px 2px 4px rgba(0, 0, 0, 0.1)",
-            "backgroundColor": "rgba(255, 255, 255, 0.8)",
+            "backgroundColor": "#003f5c",
+            "padding": "10px",
+            "marginTop": "20px",
+            "marginBottom": "10px",
             "borderRadius": "8px",
-            "padding": "10px"
-        })
-        for division_name, division_df in afc_divisions.groupby("division_name")
-    ],
+            "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.2)"
+        }),
 
-    # NFC Subheading with background and logo
-    dbc.Card([
-        dbc.CardBody([
-            html.Div([
-                html.Img(src="/assets/NFC_logo.webp", height="40px", style={"marginRight": "10px"}),
-                html.H2("NFC", style={"display": "inline-block", "verticalAlign": "middle", "marginBottom": "0"}),
-            ], style={"display": "flex", "alignItems": "center", "color": "white"})
-        ])
-    ], style={
-        "backgroundColor": "#2f4b7c",
-        "padding": "10px",
-        "marginTop": "20px",
-        "marginBottom": "10px",
-        "borderRadius": "8px",
-        "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.2)"
-    }),
+        # AFC Division tables
+        *[
+            dbc.Card([
+                dbc.CardHeader(html.H3(division_df["division_name"].iloc[0], style={"textAlign": "left"})),
+                dbc.CardBody([
+                    html.Table(
+                        [
+                            # Header Row with Overall and Division section headers
+                            html.Tr([
+                                html.Th(),
+                                html.Th("Overall", colSpan="4", style={
+                                    "textAlign": "center",
+                                    "fontWeight": "bold",
+                                    "backgroundColor": "#f0f0f0",
+                                    "borderTopLeftRadius": "8px",
+                                    "borderTopRightRadius": "8px",
+                                    "boxShadow": "0px 2px 4px rgba(0, 0, 0, 0.1)",
+                                }),
+                                html.Th("Division", colSpan="4", style={
+                                    "textAlign": "center",
+                                    "fontWeight": "bold",
+                                    "backgroundColor": "#e0e0e0",
+                                    "borderTopLeftRadius": "8px",
+                                    "borderTopRightRadius": "8px"
+                                }),
+                                *([html.Th("Odds", colSpan="3", style={
+                                    "textAlign": "center",
+                                    "fontWeight": "bold",
+                                    "backgroundColor": "#f0f0f0",
+                                    "borderTopLeftRadius": "8px",
+                                    "borderTopRightRadius": "8px"
+                                })] if has_odds else [])
+                            ]),
+                            # Subheader Row for Overall and Division details
+                            html.Tr([
+                                html.Th(),
+                                html.Th("W", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
+                                html.Th("L", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
+                                html.Th("T", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
+                                html.Th("Win %", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
+                                html.Th("W", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
+                                html.Th("L", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
+                                html.Th("T", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
+                                html.Th("Win %", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
+                                *([html.Th(label, style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"})
+                                   for label in ("Playoffs", "Div", "Bye")] if has_odds else [])
+                            ])
+                        ] + [
+                            html.Tr([
+                                html.Td(
+                                    [html.Img(src=row["logo"], style={"height": "40px", "marginRight": "10px"}),
+                                     html.Span(row["display_name"], style={"color": row["color"], "fontWeight": "bold"}),
+                                     # Current playoff seed
+                                     html.Small(f"({row['seed']:.0f})" if row["seed"] == row["seed"] else "",
+                                                style={"marginLeft": "6px", "color": "#555"})],
+                                    style={
+                                        "display": "flex",
+                                        "alignItems": "center",
+                                        "padding": "5px",
+                                        "backgroundColor": hex_to_rgba(row["color"], alpha=0.2),
+                                        "borderRadius": "5px",
+                                        "boxShadow": "0px 2px 4px rgba(0, 0, 0, 0.1)",
+                                    }
+                                ),
+                                # Overall section with background
+                                html.Td(row["wins"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",
+                                }),
+                                html.Td(row["losses"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",
+                                }),
+                                html.Td(row["ties"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",
+                                }),
+                                html.Td(f"{row['overall_win%']:.3f}", style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",
+                                }),
 
-    # NFC Division tables
-    *[
-        dbc.Card([
-            dbc.CardHeader(html.H3(division_df["division_name"].iloc[0], style={"textAlign": "left"})),
-            dbc.CardBody([
-                html.Table(
-                    [
-                        # Header Row with Overall and Division section headers
-                        html.Tr([
-                            html.Th(),
-                            html.Th("Overall", colSpan="4", style={
-                                "textAlign": "center",
-                                "fontWeight": "bold",
-                                "backgroundColor": "rgba(220, 220, 220, 0.5)",                                "borderTopLeftRadius": "8px",
-                                "borderTopRightRadius": "8px"
-                            }),
-                            html.Th("Division", colSpan="4", style={
-                                "textAlign": "center",
-                                "fontWeight": "bold",
-                                "backgroundColor": "rgba(255, 255, 255, 0.5)",
-                                "borderTopLeftRadius": "8px",
-                                "borderTopRightRadius": "8px"
-                            })
-                        ]),
-                        # Subheader Row for Overall and Division details
-                        html.Tr([
-                            html.Th(),
-                            html.Th("W", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
-                            html.Th("L", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
-                            html.Th("T", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
-                            html.Th("Win %", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
-                            html.Th("W", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
-                            html.Th("L", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
-                            html.Th("T", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
-                            html.Th("Win %", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"})
-                        ])
-                    ] + [
-                        html.Tr([
-                            html.Td(
-                                [html.Img(src=row["logo"], style={"height": "40px", "marginRight": "10px"}),
-                                 html.Span(row["display_name"], style={"color": row["color"], "fontWeight": "bold"})],
-                                style={
-                                    "display": "flex",
-                                    "alignItems": "center",
+                                # Division section with background
+                                html.Td(row["division_wins"], style={
                                     "padding": "5px",
-                                    "backgroundColor": hex_to_rgba(row["color"], alpha=0.2),
-                                    "borderRadius": "5px",
-                                    "boxShadow": "0px 2px 4px rgba(0, 0, 0, 0.1)",
-                                }
-                            ),
-                            # Overall section with background
-                            html.Td(row["wins"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(220, 220, 220, 0.5)",
-                            }),
-                            html.Td(row["losses"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(220, 220, 220, 0.5)",
-                            }),
-                            html.Td(row["ties"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(220, 220, 220, 0.5)",
-                            }),
-                            html.Td(f"{row['overall_win%']:.3f}", style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(220, 220, 220, 0.5)",
-                            }),
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(255, 255, 255, 0.5)",
+                                }),
+                                html.Td(row["division_losses"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(255, 255, 255, 0.5)",
+                                }),
+                                html.Td(row["division_ties"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(255, 255, 255, 0.5)",
+                                }),
+                                html.Td(f"{row['division_win%']:.3f}", style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(255, 255, 255, 0.5)",
+                                }),
 
-                            # Division section with background
-                            html.Td(row["division_wins"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(255, 255, 255, 0.5)",
-                            }),
-                            html.Td(row["division_losses"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(255, 255, 255, 0.5)",
-                            }),
-                            html.Td(row["division_ties"], style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(255, 255, 255, 0.5)",
-                            }),
-                            html.Td(f"{row['division_win%']:.3f}", style={
-                                "padding": "5px",
-                                "textAlign": "center",
-                                "backgroundColor": "rgba(255, 255, 255, 0.5)",
-                            }),
-                        ])
-                        for _, row in division_df.iterrows()
-                    ],
-                    style={"width": "100%", "borderCollapse": "collapse", "marginTop": "10px", "fontSize": "24px"}
-                )
+                                # Simulated playoff, division title and first-round bye odds
+                                *([html.Td(f"{row[column]:.0%}", style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",
+                                }) for column in ("playoffs_odds", "division_odds", "bye_odds")] if has_odds else []),
+                            ])
+                            for _, row in division_df.iterrows()
+                        ],
+                        style={"width": "100%", "borderCollapse": "collapse", "marginTop": "10px", "fontSize": "24px"}
+                    )
+                ])
+            ], style={
+                "marginBottom": "20px",
+                "boxShadow": "0px 2px 4px rgba(0, 0, 0, 0.1)",
+                "backgroundColor": "rgba(255, 255, 255, 0.8)",
+                "borderRadius": "8px",
+                "padding": "10px"
+            })
+            for division_name, division_df in afc_divisions.groupby("division_name")
+        ],
+
+        # NFC Subheading with background and logo
+        dbc.Card([
+            dbc.CardBody([
+                html.Div([
+                    html.Img(src="/assets/NFC_logo.webp", height="40px", style={"marginRight": "10px"}),
+                    html.H2("NFC", style={"display": "inline-block", "verticalAlign": "middle", "marginBottom": "0"}),
+                ], style={"display": "flex", "alignItems": "center", "color": "white"})
             ])
         ], style={
-            "marginBottom": "20px",
-            "boxShadow": "0px 2px 4px rgba(0, 0, 0, 0.1)",
-            "backgroundColor": "rgba(255, 255, 255, 0.8)",
+            "backgroundColor": "#2f4b7c",
+            "padding": "10px",
+            "marginTop": "20px",
+            "marginBottom": "10px",
             "borderRadius": "8px",
-            "padding": "10px"
-        })
-        for division_name, division_df in nfc_divisions.groupby("division_name")
-    ]
-], fluid=True, style={"fontFamily": "Arial, sans-serif", "padding": "20px"})
+            "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.2)"
+        }),
+
+        # NFC Division tables
+        *[
+            dbc.Card([
+                dbc.CardHeader(html.H3(division_df["division_name"].iloc[0], style={"textAlign": "left"})),
+                dbc.CardBody([
+                    html.Table(
+                        [
+                            # Header Row with Overall and Division section headers
+                            html.Tr([
+                                html.Th(),
+                                html.Th("Overall", colSpan="4", style={
+                                    "textAlign": "center",
+                                    "fontWeight": "bold",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",                                "borderTopLeftRadius": "8px",
+                                    "borderTopRightRadius": "8px"
+                                }),
+                                html.Th("Division", colSpan="4", style={
+                                    "textAlign": "center",
+                                    "fontWeight": "bold",
+                                    "backgroundColor": "rgba(255, 255, 255, 0.5)",
+                                    "borderTopLeftRadius": "8px",
+                                    "borderTopRightRadius": "8px"
+                                }),
+                                *([html.Th("Odds", colSpan="3", style={
+                                    "textAlign": "center",
+                                    "fontWeight": "bold",
+                                    "backgroundColor": "#f0f0f0",
+                                    "borderTopLeftRadius": "8px",
+                                    "borderTopRightRadius": "8px"
+                                })] if has_odds else [])
+                            ]),
+                            # Subheader Row for Overall and Division details
+                            html.Tr([
+                                html.Th(),
+                                html.Th("W", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
+                                html.Th("L", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
+                                html.Th("T", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
+                                html.Th("Win %", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"}),
+                                html.Th("W", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
+                                html.Th("L", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
+                                html.Th("T", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
+                                html.Th("Win %", style={"padding": "5px", "textAlign": "center", "backgroundColor": "#e0e0e0"}),
+                                *([html.Th(label, style={"padding": "5px", "textAlign": "center", "backgroundColor": "#f0f0f0"})
+                                   for label in ("Playoffs", "Div", "Bye")] if has_odds else [])
+                            ])
+                        ] + [
+                            html.Tr([
+                                html.Td(
+                                    [html.Img(src=row["logo"], style={"height": "40px", "marginRight": "10px"}),
+                                     html.Span(row["display_name"], style={"color": row["color"], "fontWeight": "bold"}),
+                                     # Current playoff seed
+                                     html.Small(f"({row['seed']:.0f})" if row["seed"] == row["seed"] else "",
+                                                style={"marginLeft": "6px", "color": "#555"})],
+                                    style={
+                                        "display": "flex",
+                                        "alignItems": "center",
+                                        "padding": "5px",
+                                        "backgroundColor": hex_to_rgba(row["color"], alpha=0.2),
+                                        "borderRadius": "5px",
+                                        "boxShadow": "0px 2px 4px rgba(0, 0, 0, 0.1)",
+                                    }
+                                ),
+                                # Overall section with background
+                                html.Td(row["wins"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",
+                                }),
+                                html.Td(row["losses"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",
+                                }),
+                                html.Td(row["ties"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",
+                                }),
+                                html.Td(f"{row['overall_win%']:.3f}", style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",
+                                }),
+
+                                # Division section with background
+                                html.Td(row["division_wins"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(255, 255, 255, 0.5)",
+                                }),
+                                html.Td(row["division_losses"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(255, 255, 255, 0.5)",
+                                }),
+                                html.Td(row["division_ties"], style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(255, 255, 255, 0.5)",
+                                }),
+                                html.Td(f"{row['division_win%']:.3f}", style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(255, 255, 255, 0.5)",
+                                }),
 
-# Load the teams from JSON
-with open('data/teams.json') as f:
-    teams_data = json.load(f)
+                                # Simulated playoff, division title and first-round bye odds
+                                *([html.Td(f"{row[column]:.0%}", style={
+                                    "padding": "5px",
+                                    "textAlign": "center",
+                                    "backgroundColor": "rgba(220, 220, 220, 0.5)",
+                                }) for column in ("playoffs_odds", "division_odds", "bye_odds")] if has_odds else []),
+                            ])
+                            for _, row in division_df.iterrows()
+                        ],
+                        style={"width": "100%", "borderCollapse": "collapse", "marginTop": "10px", "fontSize": "24px"}
+                    )
+                ])
+            ], style={
+                "marginBottom": "20px",
+                "boxShadow": "0px 2px 4px rgba(0, 0, 0, 0.1)",
+                "backgroundColor": "rgba(255, 255, 255, 0.8)",
+                "borderRadius": "8px",
+                "padding": "10px"
+            })
+            for division_name, division_df in nfc_divisions.groupby("division_name")
+        ]
+    ]
 
-# Prepare the dropdown options from the loaded teams data
-team_options = [{"label": team["display_name"], "value": team["id"]} for team in teams_data]
 
-roster_layout = (
-    dbc.Card([
-        dbc.CardBody(
-            html.Div([
-                html.Img(src="assets/nfl-3644686_1280.webp", height="100px", style={"marginRight": "15px"}),
-                html.H1("Roster", style={
-                    "display": "inline-block",
-                    "verticalAlign": "middle",
-                    "color": "white",
-                    "padding": "10px 20px",
-                    # "backgroundColor": "#1E3A5F",
-                    "borderRadius": "8px",
-                    "fontSize": "2.5rem",
-                    "fontWeight": "bold",
-                    "margin": "0"
-                })
-            ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})
-        )
-    ], style={
-        "backgroundColor": "#1E3A5F",
-        "marginBottom": "20px",
-        "borderRadius": "8px",
-        "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.3)",
-        "padding": "10px"
-    }),
+def roster_layout():
+    """Rosters page shell. The team list is filled in by a callback when the page is visited."""
+    return (
+        dbc.Card([
+            dbc.CardBody(
+                html.Div([
+                    html.Img(src="assets/nfl-3644686_1280.webp", height="100px", style={"marginRight": "15px"}),
+                    html.H1("Roster", style={
+                        "display": "inline-block",
+                        "verticalAlign": "middle",
+                        "color": "white",
+                        "padding": "10px 20px",
+                        # "backgroundColor": "#1E3A5F",
+                        "borderRadius": "8px",
+                        "fontSize": "2.5rem",
+                        "fontWeight": "bold",
+                        "margin": "0"
+                    })
+                ], style={"display": "flex", "alignItems": "center", "justifyContent": "center"})
+            )
+        ], style={
+            "backgroundColor": "#1E3A5F",
+            "marginBottom": "20px",
+            "borderRadius": "8px",
+            "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.3)",
+            "padding": "10px"
+        }),
 
-    dbc.Row(
-        dbc.Col(
-            dcc.Dropdown(
-                id='team-selector',
-                options=team_options,
-                placeholder="Select a team",
-                style={
-                    "width": "100%",
-                    "textAlign": "center",
-                    "fontSize": "18px",
-                    "padding": "3px",
-                    "border": "none",
-                    "borderRadius": "8px",
-                    # "backgroundColor": "#FFFFFF",  # Fully opaque white background
-                    "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.1)",  # Subtle shadow
-                }
+        dbc.Row(
+            dbc.Col(
+                dcc.Dropdown(
+                    id='team-selector',
+                    options=[],
+                    placeholder="Select a team",
+                    style={
+                        "width": "100%",
+                        "textAlign": "center",
+                        "fontSize": "18px",
+                        "padding": "3px",
+                        "border": "none",
+                        "borderRadius": "8px",
+                        # "backgroundColor": "#FFFFFF",  # Fully opaque white background
+                        "boxShadow": "0px 4px 8px rgba(0, 0, 0, 0.1)",  # Subtle shadow
+                    }
+                ),
+                width=6,  # Adjust width as needed
+                style={"display": "flex", "justifyContent": "center"}  # Center the dropdown in the column
             ),
-            width=6,  # Adjust width as needed
-            style={"display": "flex", "justifyContent": "center"}  # Center the dropdown in the column
+            justify="center",
+            style={"marginBottom": "20px"}
         ),
-        justify="center",
-        style={"marginBottom": "20px"}
-    ),
 
-    html.Div(id = "roster-table-container")
-)
+        html.Div(id="roster-team-header"),
+        dcc.Store(id="roster-data"),  # Columns of the selected team's roster
+        dcc.Dropdown(
+            id="roster-position-filter",
+            options=[],
+            multi=True,
+            placeholder="All positions",
+            style={"margin": "15px 0"},
+        ),
+        # Only the rows in view are rendered, headshots load lazily as they scroll in
+        dash_table.DataTable(
+            id="roster-table",
+            columns=[
+                {"name": "", "id": "headshot", "presentation": "markdown"},
+                {"name": "Jersey", "id": "jersey"},
+                {"name": "Name", "id": "name"},
+                {"name": "Position", "id": "position"},
+                {"name": "Group", "id": "group"},
+                {"name": "Height", "id": "height"},
+                {"name": "Weight", "id": "weight"},
+                {"name": "Age", "id": "age"},
+                {"name": "College", "id": "college"},
+                {"name": "Status", "id": "status"},
+            ],
+            data=[],
+            virtualization=True,
+            fixed_rows={"headers": True},
+            page_action="none",
+            sort_action="native",
+            markdown_options={"html": True},
+            css=[{"selector": ".dash-cell p", "rule": "margin: 0;"}],
+            style_table={"height": "70vh", "overflowY": "auto"},
+            style_header={"backgroundColor": "#003f5c", "color": "white", "fontWeight": "bold"},
+            style_cell={"textAlign": "left", "padding": "8px", "height": "60px", "minWidth": "60px"},
+            style_data_conditional=[{"if": {"row_index": "odd"}, "backgroundColor": "#f8f9fa"}],
+        ),
+    )
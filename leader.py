@@ -0,0 +1,30 @@
+# leader.py
+import os
+import socket
+import uuid
+from cache_config import disk_cache
+
+# Unique per process, so a restarted worker with a recycled pid never inherits a stale lease
+_identity = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def hold_leadership(name, ttl):
+    """Become or stay the leader for `name`. Returns True while this process holds the lease.
+
+    The lease lives in diskcache, which every worker on the dyno shares, and expires after
+    `ttl` seconds unless the leader renews it by calling this again.
+    """
+    key = f"leader:{name}"
+    with disk_cache.transact():
+        holder = disk_cache.get(key)
+        if holder is None or holder == _identity:
+            disk_cache.set(key, _identity, expire=ttl)
+            return True
+    return False
+
+
+def release_leadership(name):
+    key = f"leader:{name}"
+    with disk_cache.transact():
+        if disk_cache.get(key) == _identity:
+            disk_cache.delete(key)
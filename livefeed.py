@@ -0,0 +1,126 @@
+# livefeed.py
+import json
+import threading
+import time
+from collections import deque
+from poller import get_snapshot
+from config import LIVE_FEED_CHECK_INTERVAL, LIVE_FEED_HEARTBEAT, LIVE_FEED_BACKLOG, LIVE_FEED_RETRY_MS
+
+_feed = None
+_feed_lock = threading.Lock()
+
+
+def _sse(event, seq, data):
+    return f"id: {seq}\nevent: {event}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+
+
+class LiveFeed:
+    """Pushes scoreboard changes to server-sent event subscribers in this worker.
+
+    The poller is the single producer. One watcher per worker notices a new snapshot seq and
+    turns it into a delta of only the changed live fields, which every subscriber waiting on
+    the condition then sends. Idle subscribers cost a parked greenlet under gevent.
+    """
+
+    def __init__(self, backlog=LIVE_FEED_BACKLOG):
+        self._cond = threading.Condition()
+        self._deltas = deque(maxlen=backlog)  # (previous seq, seq, delta)
+        self._games = {}
+        self._thread = None
+        self.seq = None
+        self.subscribers = 0
+
+    def start(self):
+        with self._cond:
+            if self._thread is not None:
+                return
+            # The watcher's first pass publishes at once, so the first subscriber doesn't wait a tick.
+            # Publishing here instead could raise before the thread starts and leave the feed dead.
+            self._thread = threading.Thread(target=self._watch, name="live-feed", daemon=True)
+            self._thread.start()
+
+    def _watch(self):
+        while True:
+            try:
+                snapshot = get_snapshot()
+                if snapshot and snapshot["seq"] != self.seq:
+                    self.publish(snapshot)
+            except Exception as e:
+                print(f"Error reading scoreboard snapshot: {e}")
+            time.sleep(LIVE_FEED_CHECK_INTERVAL)
+
+    def publish(self, snapshot):
+        if not snapshot:
+            return
+        games = {game["game_id"]: game for game in snapshot["games"]}
+        changed = {}
+        for game_id, game in games.items():
+            previous = self._games.get(game_id)
+            fields = game if previous is None else {k: v for k, v in game.items() if previous.get(k) != v}
+            if fields:
+                changed[game_id] = fields
+        removed = [game_id for game_id in self._games if game_id not in games]
+
+        with self._cond:
+            if self.seq is not None and snapshot["seq"] < self.seq:
+                self._deltas.clear()  # Poller state was reset, old ids can't be resumed
+            self._deltas.append((self.seq, snapshot["seq"], {"changed": changed, "removed": removed}))
+            self._games = games
+            self.seq = snapshot["seq"]
+            self._cond.notify_all()
+
+    def _since(self, last_seq):
+        """Deltas after last_seq, or None when the client is too far behind to catch up."""
+        for position, (previous_seq, _, _) in enumerate(self._deltas):
+            if previous_seq == last_seq:
+                return [delta for _, _, delta in list(self._deltas)[position:]]
+        return None
+
+    def stream(self, last_seq=None):
+        """SSE messages for one client: a full snapshot, then deltas. Resumes from last_seq if it can."""
+        self.start()
+        with self._cond:
+            self.subscribers += 1
+        try:
+            yield f"retry: {LIVE_FEED_RETRY_MS}\n\n"
+            while True:
+                with self._cond:
+                    # Until this worker's feed has published, a resuming client only gets keep-alives
+                    self._cond.wait_for(lambda: self.seq is not None and self.seq != last_seq,
+                                        timeout=LIVE_FEED_HEARTBEAT)
+                    seq = self.seq
+                    if seq is None or seq == last_seq:
+                        messages = [": keep-alive\n\n"]
+                    else:
+                        deltas = self._since(last_seq) if last_seq is not None else None
+                        if deltas is None:
+                            messages = [_sse("snapshot", seq, {"games": list(self._games.values())})]
+                        else:
+                            messages = [_sse("delta", seq, _merge(deltas))]
+                        last_seq = seq
+                yield from messages
+        finally:
+            with self._cond:
+                self.subscribers -= 1
+
+
+def _merge(deltas):
+    """Collapse consecutive deltas into one so a resuming client gets a single message."""
+    changed, removed = {}, set()
+    for delta in deltas:
+        for game_id in delta["removed"]:
+            changed.pop(game_id, None)
+            removed.add(game_id)
+        for game_id, fields in delta["changed"].items():
+            removed.discard(game_id)
+            changed.setdefault(game_id, {}).update(fields)
+    return {"changed": changed, "removed": sorted(removed)}
+
+
+def get_live_feed():
+    global _feed
+    if _feed is None:
+        with _feed_lock:
+            if _feed is None:
+                _feed = LiveFeed()
+    return _feed
@@ -0,0 +1,524 @@
+# mock_server.py
+"""Local stand-in for nfl-api-data.p.rapidapi.com.
+
+Serves every endpoint in config.py from recorded fixtures when they exist, and otherwise from a
+synthetic, deterministic season built from datamodels/First_event_data.json. Point the app at it
+with API_BASE_URL=http://127.0.0.1:8099 and run:
+
+    python mock_server.py
+
+Environment knobs: MOCK_PORT, MOCK_SEED, MOCK_NOW (ISO timestamp used to decide which games are
+final, live or scheduled), MOCK_SEASON_START, MOCK_LATENCY_MS, MOCK_LATENCY_JITTER_MS,
+MOCK_ERROR_RATE, MOCK_429_RATE, MOCK_FIXTURES_DIR.
+"""
+import copy
+import hashlib
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from flask import Flask, Response, request
+import pytz
+
+MOCK_PORT = int(os.environ.get("MOCK_PORT", 8099))
+MOCK_SEED = int(os.environ.get("MOCK_SEED", 2024))
+MOCK_SEASON_START = os.environ.get("MOCK_SEASON_START", "2024-09-04T07:00Z")  # Wednesday of week 1
+MOCK_NOW = os.environ.get("MOCK_NOW")  # Defaults to the real clock
+MOCK_LATENCY_MS = float(os.environ.get("MOCK_LATENCY_MS", 0))
+MOCK_LATENCY_JITTER_MS = float(os.environ.get("MOCK_LATENCY_JITTER_MS", 0))
+MOCK_ERROR_RATE = float(os.environ.get("MOCK_ERROR_RATE", 0))
+MOCK_429_RATE = float(os.environ.get("MOCK_429_RATE", 0))
+MOCK_FIXTURES_DIR = os.environ.get("MOCK_FIXTURES_DIR", "datamodels/fixtures")
+
+REGULAR_SEASON_WEEKS = 18
+PRESEASON_WEEKS = ["Hall of Fame Weekend", "Preseason Week 1", "Preseason Week 2", "Preseason Week 3"]
+POSTSEASON_WEEKS = ["Wild Card", "Divisional Round", "Conference Championship", "Pro Bowl", "Super Bowl"]
+GAME_LENGTH = timedelta(hours=3, minutes=15)
+# (days after Wednesday 07:00Z, UTC time) for the slots games are spread over
+KICKOFF_SLOTS = [(1, "00:15"), (4, "17:00"), (4, "17:00"), (4, "17:00"), (4, "17:00"), (4, "17:00"),
+                 (4, "17:00"), (4, "17:00"), (4, "17:00"), (4, "20:05"), (4, "20:25"), (4, "20:25"),
+                 (5, "00:20"), (6, "00:15"), (4, "17:00"), (4, "20:25")]
+ROSTER_LAYOUT = {
+    "offense": [("Quarterback", "QB", 3), ("Running Back", "RB", 4), ("Wide Receiver", "WR", 6),
+                ("Tight End", "TE", 3), ("Offensive Tackle", "OT", 4), ("Guard", "G", 4), ("Center", "C", 2)],
+    "defense": [("Defensive End", "DE", 4), ("Defensive Tackle", "DT", 4), ("Linebacker", "LB", 6),
+                ("Cornerback", "CB", 5), ("Safety", "S", 4)],
+    "specialTeam": [("Place Kicker", "PK", 1), ("Punter", "P", 1), ("Long Snapper", "LS", 1)],
+}
+COLLEGES = ["Alabama", "Ohio State", "Georgia", "LSU", "Michigan", "Clemson", "USC", "Oregon", "Texas", "Iowa"]
+
+app = Flask(__name__)
+
+
+def _parse_time(value):
+    return datetime.fromisoformat(value.replace("Z", "")).replace(tzinfo=timezone.utc)
+
+
+def _iso(value):
+    return value.strftime("%Y-%m-%dT%H:%MZ")
+
+
+def _now():
+    return _parse_time(MOCK_NOW) if MOCK_NOW else datetime.now(timezone.utc)
+
+
+# Static inputs ---------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _template_event():
+    with open("datamodels/First_event_data.json") as f:
+        event = json.load(f)
+    # Event_structure.json only lists field types, so it can't seed values; check the template against it
+    with open("datamodels/Event_structure.json") as f:
+        missing = _missing_fields(json.load(f), event)
+    if missing:
+        print(f"Template event is missing fields from Event_structure.json: {', '.join(missing)}")
+    return event
+
+
+def _missing_fields(structure, value, path=""):
+    if isinstance(structure, dict):
+        if not isinstance(value, dict):
+            return [path or "."]
+        return [missing for key, child in structure.items()
+                for missing in (_missing_fields(child, value[key], f"{path}.{key}".lstrip("."))
+                                if key in value else [f"{path}.{key}".lstrip(".")])]
+    if isinstance(structure, list) and structure and isinstance(value, list) and value:
+        # List items vary (e.g. only some records carry an abbreviation): report what no item has
+        per_item = [set(_missing_fields(structure[0], item, f"{path}[]")) for item in value]
+        return sorted(set.intersection(*per_item))
+    return []
+
+
+@lru_cache(maxsize=None)
+def _teams():
+    with open("data/teams.json") as f:
+        teams = json.load(f)
+    for team in teams:
+        team["abbreviation"] = team["logo"].rsplit("/", 1)[-1].split(".")[0].upper()
+    return {team["id"]: team for team in teams}
+
+
+@lru_cache(maxsize=None)
+def _divisions():
+    # Plain JSON on purpose: importing config here would freeze API_BASE_URL before the benchmarks set it
+    with open("data/divisions.json") as f:
+        rows = json.load(f)
+    divisions = {}
+    for row in rows:
+        division = divisions.setdefault(row["division_id"], {"name": row["division_name"], "teams": []})
+        division["teams"].append(row["team_id"])
+    return divisions
+
+
+def _division_of(team_id):
+    return _team_divisions()[team_id]
+
+
+@lru_cache(maxsize=None)
+def _team_divisions():
+    return {team_id: division_id for division_id, division in _divisions().items() for team_id in division["teams"]}
+
+
+# Synthetic season ------------------------------------------------------------
+@lru_cache(maxsize=None)
+def _schedule():
+    """Deterministic regular season: one row per game with kickoff, teams, final line scores and spread."""
+    rng = random.Random(MOCK_SEED)
+    season_start = _parse_time(MOCK_SEASON_START)
+    team_ids = sorted(_teams())
+    games = []
+
+    # Every team gets one bye between weeks 5 and 14
+    bye_order = team_ids[:]
+    rng.shuffle(bye_order)
+    bye_weeks = {}
+    for week, count in zip(range(5, 15), [2, 4, 4, 2, 4, 4, 2, 4, 2, 4]):
+        bye_weeks[week], bye_order = bye_order[:count], bye_order[count:]
+
+    for week in range(1, REGULAR_SEASON_WEEKS + 1):
+        week_start = season_start + timedelta(weeks=week - 1)
+        bye = bye_weeks.get(week, [])
+        playing = [team_id for team_id in team_ids if team_id not in bye]
+        rng.shuffle(playing)
+
+        for slot, index in enumerate(range(0, len(playing) - 1, 2)):
+            home_id, away_id = playing[index], playing[index + 1]
+            day_offset, clock = KICKOFF_SLOTS[slot % len(KICKOFF_SLOTS)]
+            hour, minute = map(int, clock.split(":"))
+            kickoff = (week_start + timedelta(days=day_offset)).replace(hour=hour, minute=minute)
+
+            home_lines = [rng.choice([0, 0, 3, 3, 7, 7, 10, 14]) for _ in range(4)]
+            away_lines = [rng.choice([0, 0, 3, 3, 7, 7, 10, 14]) for _ in range(4)]
+            if sum(home_lines) == sum(away_lines) and rng.random() < 0.8:
+                (home_lines if rng.random() < 0.5 else away_lines).append(rng.choice([3, 6]))
+            elif sum(home_lines) == sum(away_lines):
+                home_lines.append(0)
+                away_lines.append(0)
+
+            spread = rng.choice([1, 1.5, 2.5, 3, 3.5, 4, 6.5, 7, 9.5])
+            favorite = home_id if rng.random() < 0.55 else away_id
+            games.append({
+                "id": str(401671000 + len(games) + 1),
+                "week": week,
+                "kickoff": kickoff,
+                "home_id": home_id,
+                "away_id": away_id,
+                "home_lines": home_lines,
+                "away_lines": away_lines,
+                "odds": f"{_teams()[favorite]['abbreviation']} -{spread:g}",
+                "bye": bye,
+            })
+    return games
+
+
+def _game_state(game, now):
+    """Status and line scores of a game as seen at `now`."""
+    if now < game["kickoff"]:
+        return "Scheduled", [], [], 0, "0:00"
+    if now >= game["kickoff"] + GAME_LENGTH:
+        return "Final", game["home_lines"], game["away_lines"], len(game["home_lines"]), "0:00"
+
+    # Live: map elapsed real time onto four 15 minute quarters
+    elapsed = (now - game["kickoff"]) / GAME_LENGTH * 60
+    period = min(int(elapsed // 15) + 1, 4)
+    remaining = 15 - (elapsed - (period - 1) * 15)
+    clock = f"{int(remaining)}:{int((remaining % 1) * 60):02d}"
+    return "In Progress", game["home_lines"][:period], game["away_lines"][:period], period, clock
+
+
+def _records_before(now, before_week=None):
+    """Overall, home/road and division W-L-T for every team from games final at `now`
+    (and, with before_week, played in earlier weeks)."""
+    records = {team_id: {"wins": 0, "losses": 0, "ties": 0, "home": [0, 0, 0], "road": [0, 0, 0],
+                         "divisionWins": 0, "divisionLosses": 0, "divisionTies": 0} for team_id in _teams()}
+    for game in _schedule():
+        if now < game["kickoff"] + GAME_LENGTH or (before_week and game["week"] >= before_week):
+            continue
+        home_score, away_score = sum(game["home_lines"]), sum(game["away_lines"])
+        same_division = _division_of(game["home_id"]) == _division_of(game["away_id"])
+        for team_id, score, other, venue in [(game["home_id"], home_score, away_score, "home"),
+                                             (game["away_id"], away_score, home_score, "road")]:
+            result = "wins" if score > other else "losses" if score < other else "ties"
+            records[team_id][result] += 1
+            records[team_id][venue][["wins", "losses", "ties"].index(result)] += 1
+            if same_division:
+                records[team_id]["division" + result.capitalize()] += 1
+    return records
+
+
+def _summary(wins, losses, ties):
+    return f"{wins}-{losses}" + (f"-{ties}" if ties else "")
+
+
+def _team_payload(team_id):
+    team = _teams()[team_id]
+    name = team["display_name"].rsplit(" ", 1)
+    return {
+        "id": team_id, "uid": f"s:20~l:28~t:{team_id}", "location": name[0], "name": name[-1],
+        "abbreviation": team["abbreviation"], "displayName": team["display_name"],
+        "shortDisplayName": name[-1], "color": team["color"], "alternateColor": "000000",
+        "isActive": True, "venue": {"id": team_id}, "links": [], "logo": team["logo"],
+    }
+
+
+def _build_event(game, now, records):
+    event = copy.deepcopy(_template_event())
+    status, home_lines, away_lines, period, clock = _game_state(game, now)
+    home, away = _teams()[game["home_id"]], _teams()[game["away_id"]]
+    kickoff = _iso(game["kickoff"])
+
+    event.update({
+        "id": game["id"], "uid": f"s:20~l:28~e:{game['id']}", "date": kickoff,
+        "name": f"{away['display_name']} at {home['display_name']}",
+        "shortName": f"{away['abbreviation']} @ {home['abbreviation']}",
+        "season": {"year": 2024, "type": 2, "slug": "regular-season"},
+        "week": {"number": game["week"]},
+    })
+    status_payload = {
+        "clock": 0, "displayClock": clock, "period": period,
+        "type": {
+            "id": {"Scheduled": "1", "In Progress": "2", "Final": "3"}[status],
+            "name": {"Scheduled": "STATUS_SCHEDULED", "In Progress": "STATUS_IN_PROGRESS",
+                     "Final": "STATUS_FINAL"}[status],
+            "state": {"Scheduled": "pre", "In Progress": "in", "Final": "post"}[status],
+            "completed": status == "Final", "description": status, "detail": status, "shortDetail": status,
+        },
+    }
+    event["status"] = status_payload
+
+    competition = event["competitions"][0]
+    competition.update({"id": game["id"], "uid": event["uid"], "date": kickoff, "startDate": kickoff,
+                        "status": copy.deepcopy(status_payload)})
+    competition["venue"]["fullName"] = f"{home['display_name'].rsplit(' ', 1)[-1]} Stadium"
+    competition["venue"]["address"]["city"] = home["display_name"].rsplit(" ", 1)[0]
+
+    home_score, away_score = sum(home_lines), sum(away_lines)
+    competitors = []
+    for order, (team_id, lines, score, other, venue) in enumerate([
+            (game["home_id"], home_lines, home_score, away_score, "home"),
+            (game["away_id"], away_lines, away_score, home_score, "road")]):
+        record = records[team_id]
+        competitors.append({
+            "id": team_id, "uid": f"s:20~l:28~t:{team_id}", "type": "team", "order": order,
+            "homeAway": "home" if venue == "home" else "away",
+            "winner": status == "Final" and score > other,
+            "team": _team_payload(team_id),
+            "score": str(score) if status != "Scheduled" else "0",
+            "linescores": [{"value": value} for value in lines],
+            "statistics": [],
+            "records": [
+                {"name": "overall", "abbreviation": "Game", "type": "total",
+                 "summary": _summary(record["wins"], record["losses"], record["ties"])},
+                {"name": "Home", "type": "home", "summary": _summary(*record["home"])},
+                {"name": "Road", "type": "road", "summary": _summary(*record["road"])},
+            ],
+        })
+    competition["competitors"] = competitors
+
+    if status == "In Progress":
+        possession = game["home_id"] if period % 2 else game["away_id"]
+        competition["situation"] = {
+            "downDistanceText": f"{['1st', '2nd', '3rd', '4th'][period % 4]} & 10 at {_teams()[possession]['abbreviation']} 35",
+            "possession": possession,
+        }
+    if status != "Final":
+        competition["headlines"] = []
+    else:
+        winner = home if home_score >= away_score else away
+        competition["headlines"] = [{"type": "Recap", "description": "",
+                                     "shortLinkText": f"{winner['display_name']} win {max(home_score, away_score)}"
+                                                      f"-{min(home_score, away_score)}"}]
+    return event
+
+
+@lru_cache(maxsize=8)
+def _season(now_minute):
+    """All regular-season events as seen at `now_minute`, cached per minute of mock time."""
+    now = datetime.fromtimestamp(now_minute * 60, tz=timezone.utc)
+    # Records shown on a card are the ones going into that week
+    weekly_records = {week: _records_before(now, before_week=week) for week in range(1, REGULAR_SEASON_WEEKS + 1)}
+    return [_build_event(game, now, weekly_records[game["week"]]) for game in _schedule()]
+
+
+def _season_events():
+    return _season(int(_now().timestamp() // 60))
+
+
+def _calendar():
+    season_start = _parse_time(MOCK_SEASON_START)
+
+    def entries(labels, first_start):
+        return [{"label": label, "alternateLabel": label, "detail": label,
+                 "value": str(index + 1),
+                 "startDate": _iso(first_start + timedelta(weeks=index)),
+                 "endDate": _iso(first_start + timedelta(weeks=index + 1) - timedelta(minutes=1))}
+                for index, label in enumerate(labels)]
+
+    return [
+        {"label": "Preseason", "value": "1",
+         "entries": entries(PRESEASON_WEEKS, season_start - timedelta(weeks=len(PRESEASON_WEEKS)))},
+        {"label": "Regular Season", "value": "2",
+         "entries": entries([f"Week {week}" for week in range(1, REGULAR_SEASON_WEEKS + 1)], season_start)},
+        {"label": "Postseason", "value": "3",
+         "entries": entries(POSTSEASON_WEEKS, season_start + timedelta(weeks=REGULAR_SEASON_WEEKS))},
+    ]
+
+
+def _scoring_plays(game, now):
+    status, home_lines, away_lines, _, _ = _game_state(game, now)
+    home, away = _teams()[game["home_id"]], _teams()[game["away_id"]]
+    plays, home_score, away_score = [], 0, 0
+    for period, (home_points, away_points) in enumerate(zip(home_lines, away_lines), start=1):
+        for team, points, is_home in [(home, home_points, True), (away, away_points, False)]:
+            while points > 0:
+                value = 7 if points >= 7 else 3 if points >= 3 else points
+                points -= value
+                if is_home:
+                    home_score += value
+                else:
+                    away_score += value
+                plays.append({
+                    "type": {"text": "Touchdown" if value == 7 else "Field Goal Good"},
+                    "text": f"{team['abbreviation']} {'touchdown' if value == 7 else 'field goal'}",
+                    "awayScore": away_score, "homeScore": home_score, "isHome": is_home,
+                    "period": {"number": period}, "clock": {"displayValue": "7:30"},
+                    "team": {"id": team["id"], "displayName": team["display_name"], "logo": team["logo"]},
+                })
+    return plays
+
+
+def _roster(team_id):
+    rng = random.Random(f"{MOCK_SEED}-{team_id}")
+    groups, jersey = [], 1
+    for group, positions in ROSTER_LAYOUT.items():
+        items = []
+        for position_name, abbreviation, count in positions:
+            for _ in range(count):
+                athlete_id = str(4000000 + int(team_id) * 1000 + jersey)
+                feet, inches = rng.choice([5, 6, 6, 6]), rng.randint(0, 11)
+                items.append({
+                    "id": athlete_id,
+                    "displayName": f"{abbreviation} Player {jersey}",
+                    "jersey": str(jersey),
+                    "position": {"displayName": position_name, "abbreviation": abbreviation},
+                    "displayHeight": f"{feet}' {inches}\"",
+                    "displayWeight": f"{rng.randint(180, 330)} lbs",
+                    "age": rng.randint(21, 36),
+                    "college": {"shortName": rng.choice(COLLEGES)},
+                    "status": {"type": "active"},
+                    "headshot": {"href": f"https://a.espncdn.com/i/headshots/nfl/players/full/{athlete_id}.png"},
+                })
+                jersey += 1
+        groups.append({"position": group, "items": items})
+    return {"team": _team_payload(team_id), "athletes": groups}
+
+
+# Request plumbing ------------------------------------------------------------
+def _fixture(name):
+    """Recorded response for this request, if one exists: <fixtures>/<endpoint>/<query>.json"""
+    query = "&".join(f"{key}={value}" for key, value in sorted(request.args.items())) or "default"
+    path = os.path.join(MOCK_FIXTURES_DIR, name, f"{query}.json")
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    return None
+
+
+def _not_found(name, message):
+    """404 for an unknown id, unless a fixture was recorded for the request."""
+    if _fixture(name) is not None:
+        return None
+    return Response(json.dumps({"message": message}), status=404, mimetype="application/json")
+
+
+def _respond(name, build):
+    if MOCK_LATENCY_MS or MOCK_LATENCY_JITTER_MS:
+        time.sleep(max(0.0, random.gauss(MOCK_LATENCY_MS, MOCK_LATENCY_JITTER_MS)) / 1000)
+
+    roll = random.random()
+    if roll < MOCK_429_RATE:
+        return Response('{"message": "Too many requests"}', status=429, headers={"Retry-After": "1"},
+                        mimetype="application/json")
+    if roll < MOCK_429_RATE + MOCK_ERROR_RATE:
+        return Response('{"message": "Internal error"}', status=503, mimetype="application/json")
+
+    payload = _fixture(name)
+    body = json.dumps(payload if payload is not None else build(), separators=(",", ":"))
+    etag = f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+    headers = {"ETag": etag, "x-ratelimit-requests-remaining": "99999"}
+    if request.headers.get("If-None-Match") == etag:
+        return Response(status=304, headers=headers)
+    return Response(body, mimetype="application/json", headers=headers)
+
+
+def _game(game_id):
+    return next((game for game in _schedule() if game["id"] == game_id), None)
+
+
+@app.route("/nfl-events")
+def nfl_events():
+    return _respond("nfl-events", lambda: {"leagues": [{"calendar": _calendar()}], "events": _season_events()})
+
+
+@app.route("/nfl-scoreboard-day")
+def scoreboard_day():
+    day = request.args.get("day", "")
+    eastern = pytz.timezone("America/New_York")
+    if MOCK_NOW and day == datetime.now(eastern).strftime("%Y%m%d"):
+        day = _now().astimezone(eastern).strftime("%Y%m%d")  # The app asks for the real today
+
+    def build():
+        events = [event for event in _season_events()
+                  if _parse_time(event["date"]).astimezone(eastern).strftime("%Y%m%d") == day]
+        return {"events": events}
+    return _respond("nfl-scoreboard-day", build)
+
+
+@app.route("/nfl-scoreboard-week-type")
+def scoreboard_week():
+    week = int(request.args.get("week", 1))
+
+    def build():
+        games = {game["id"]: game for game in _schedule() if game["week"] == week}
+        events = []
+        for event in _season_events():
+            if event["id"] in games:
+                event = copy.deepcopy(event)
+                event["competitions"][0]["odds"] = [{"provider": {"id": "58", "name": "ESPN BET"},
+                                                     "details": games[event["id"]]["odds"]}]
+                events.append(event)
+        bye = next(iter(games.values()))["bye"] if games else []
+        return {"week": {"number": week, "teamsOnBye": [
+            {"id": team_id, "displayName": _teams()[team_id]["display_name"], "logo": _teams()[team_id]["logo"]}
+            for team_id in bye]}, "events": events}
+    return _respond("nfl-scoreboard-week-type", build)
+
+
+@app.route("/nfl-eventodds")
+def event_odds():
+    game = _game(request.args.get("id", ""))
+    return _respond("nfl-eventodds", lambda: {"items": [
+        {"provider": {"id": "58", "name": "ESPN BET"}, "details": game["odds"]}] if game else []})
+
+
+@app.route("/nfl-scoringplays")
+def scoring_plays():
+    game = _game(request.args.get("id", ""))
+    return _respond("nfl-scoringplays", lambda: {"scoringPlays": _scoring_plays(game, _now()) if game else []})
+
+
+@app.route("/nfl-team-list")
+def team_list():
+    return _respond("nfl-team-list", lambda: {"teams": [
+        dict(_team_payload(team_id), logos=[{"href": team["logo"], "rel": ["full", "default"]}])
+        for team_id, team in _teams().items()]})
+
+
+@app.route("/nfl-team-record")
+def team_record():
+    team_id = request.args.get("id", "")
+    if team_id not in _teams():
+        not_found = _not_found("nfl-team-record", f"Team {team_id!r} not found")
+        if not_found is not None:
+            return not_found
+
+    def build():
+        record = _records_before(_now())[team_id]
+        return {"items": [
+            {"name": "overall", "stats": [{"name": name, "value": record[name]}
+                                          for name in ("wins", "losses", "ties")]},
+            {"name": "vs. Div.", "stats": [{"name": name, "value": record[name]}
+                                           for name in ("divisionWins", "divisionLosses", "divisionTies")]},
+        ]}
+    return _respond("nfl-team-record", build)
+
+
+@app.route("/nfl-team-groups")
+def team_groups():
+    team_id = request.args.get("id", "")
+    if team_id not in _team_divisions():
+        not_found = _not_found("nfl-team-groups", f"Team {team_id!r} not found")
+        if not_found is not None:
+            return not_found
+
+    def build():
+        division_id = _division_of(team_id)
+        division = _divisions()[division_id]
+        return {"id": division_id, "name": division["name"], "teams": [{"id": member} for member in division["teams"]]}
+    return _respond("nfl-team-groups", build)
+
+
+@app.route("/nfl-player-listing/v1/data")
+def player_listing():
+    team_id = request.args.get("id", "")
+    if team_id not in _teams():
+        not_found = _not_found("nfl-player-listing", f"Team {team_id!r} not found")
+        if not_found is not None:
+            return not_found
+    return _respond("nfl-player-listing", lambda: _roster(team_id))
+
+
+if __name__ == "__main__":
+    app.run(host="127.0.0.1", port=MOCK_PORT, threaded=True)
@@ -0,0 +1,113 @@
+# odds_store.py
+import json
+import os
+import sqlite3
+import threading
+import time
+from config import ODDS_DB_PATH, ODDS_FILE_PATH
+
+_store = None
+_store_lock = threading.Lock()
+
+
+class OddsStore:
+    """Spreads by game_id in SQLite (WAL mode), with an in-memory index for reads.
+
+    Writes are atomic transactions that any worker can make safely at the same time. Each
+    process keeps a dict copy of the table and reloads it only when PRAGMA data_version shows
+    another connection has committed since the last read.
+    """
+
+    def __init__(self, db_path=ODDS_DB_PATH, json_path=ODDS_FILE_PATH):
+        self.db_path = db_path
+        self.json_path = json_path
+        self._lock = threading.Lock()
+        self._index = {}
+        self._data_version = None
+        self._version = 0
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS odds (game_id TEXT PRIMARY KEY, details TEXT, updated_at REAL NOT NULL)"
+        )
+        self.migrate_from_json()
+
+    def _refresh_index(self):
+        data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if data_version != self._data_version:
+            self._index = dict(self._conn.execute("SELECT game_id, details FROM odds"))
+            self._data_version = data_version
+            self._version += 1
+
+    @property
+    def version(self):
+        """Changes whenever the spreads this process sees change, from its own writes or another's."""
+        with self._lock:
+            self._refresh_index()
+            return self._version
+
+    def get(self, game_id, default=None):
+        with self._lock:
+            self._refresh_index()
+            return self._index.get(game_id, default)
+
+    def __contains__(self, game_id):
+        with self._lock:
+            self._refresh_index()
+            return game_id in self._index
+
+    def snapshot(self):
+        with self._lock:
+            self._refresh_index()
+            return dict(self._index)
+
+    def upsert_many(self, odds):
+        """Store {game_id: details}, skipping games whose spread is unchanged. Returns rows written."""
+        with self._lock:
+            self._refresh_index()
+            changed = {game_id: details for game_id, details in odds.items()
+                       if game_id not in self._index or self._index[game_id] != details}
+            if not changed:
+                return 0
+
+            now = time.time()
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO odds (game_id, details, updated_at) VALUES (?, ?, ?) "
+                    "ON CONFLICT(game_id) DO UPDATE SET details = excluded.details, updated_at = excluded.updated_at",
+                    [(game_id, details, now) for game_id, details in changed.items()],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            self._index.update(changed)
+            self._version += 1
+            return len(changed)
+
+    def migrate_from_json(self):
+        """Seed an empty store from the legacy last_fetched_odds.json file."""
+        if self._conn.execute("SELECT 1 FROM odds LIMIT 1").fetchone() or not os.path.exists(self.json_path):
+            return 0
+        with open(self.json_path) as f:
+            legacy_odds = json.load(f)
+        written = self.upsert_many(legacy_odds)
+        print(f"Migrated {written} odds from {self.json_path} to {self.db_path}")
+        return written
+
+
+def get_odds_store():
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = OddsStore()
+    return _store
+
+
+# One-off migration: python odds_store.py
+if __name__ == "__main__":
+    print(f"{len(get_odds_store().snapshot())} games in {ODDS_DB_PATH}")
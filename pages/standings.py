@@ -6,5 +6,6 @@ from layout import standings_layout
 
 dash.register_page(__name__)
 
-# Define the scores layout
+# A static shell; the tables of the current standings version are filled in by a callback, so
+# pandas and the standings engine are imported on the first visit rather than at worker boot.
 layout = standings_layout
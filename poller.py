@@ -0,0 +1,142 @@
+# poller.py
+import threading
+import time
+from datetime import datetime, timezone
+from api import fetch_games_by_day, fetch_nfl_events_version
+from polling import poll_plan
+from cache_config import disk_cache
+from leader import hold_leadership
+from config import POLLER_INTERVAL, POLLER_LEASE_TTL, POLL_IDLE_STEP
+
+SNAPSHOT_KEY = "scoreboard:snapshot"
+LEADER_NAME = "scoreboard-poller"
+
+_poller_thread = None
+_poller_lock = threading.Lock()
+
+
+def normalize_scoreboard(games_data):
+    """Reduce a scoreboard-day response to the per-game live fields shown on the game cards."""
+    updated_game_data = []
+    games_in_progress = False
+
+    for game in games_data.get('events', []):
+        game_id = game.get('id')
+        competitions = game.get('competitions', [])
+
+        if not competitions:
+            continue
+
+        status_info = competitions[0].get('status', {})
+        game_status = status_info.get('type', {}).get('description', 'N/A')
+
+        if game_status in ["Scheduled", "Final"]:
+            continue
+        else:
+            games_in_progress = True
+
+        home_team = competitions[0]['competitors'][0]['team']['displayName']
+        away_team = competitions[0]['competitors'][1]['team']['displayName']
+        home_score = competitions[0]['competitors'][0].get('score', 'N/A')
+        away_score = competitions[0]['competitors'][1].get('score', 'N/A')
+
+        home_team_id = competitions[0]['competitors'][0]['team']['id']
+        away_team_id = competitions[0]['competitors'][1]['team']['id']
+        quarter = '' if game_status == "Final" else status_info.get('period', 'N/A')
+        time_remaining = '' if game_status == "Final" else status_info.get('displayClock', 'N/A')
+
+        situation = competitions[0].get('situation', {})
+        possession = situation.get('downDistanceText', 'N/A')
+        possession_team = situation.get('possession', 'N/A')
+
+        updated_game_data.append({
+            'game_id': game_id,
+            'Status': game_status,
+            'Home Team ID': home_team_id,
+            'Away Team ID': away_team_id,
+            'Home Team': home_team,
+            'Away Team': away_team,
+            'Home Team Score': home_score,
+            'Away Team Score': away_score,
+            'Quarter': quarter,
+            'Time Remaining': time_remaining,
+            'Down Distance': possession,
+            'Possession': possession_team,
+        })
+
+    return updated_game_data, games_in_progress
+
+
+def get_snapshot():
+    """Latest published scoreboard snapshot, or None if the poller hasn't run yet."""
+    return disk_cache.get(SNAPSHOT_KEY)
+
+
+def poll_once():
+    games_data = fetch_games_by_day(refresh=True)
+    if not games_data or "error" in games_data:
+        return  # Keep serving the previous snapshot
+
+    games, games_in_progress = normalize_scoreboard(games_data)
+    previous = get_snapshot() or {"seq": 0, "games": None}
+    now = time.time()
+
+    snapshot = {
+        "seq": previous["seq"] + (0 if previous["games"] == games else 1),
+        "updated_at": now,
+        "has_events": bool(games_data.get('events')),
+        "games_in_progress": games_in_progress,
+        # Past kickoff but not started yet (weather, late previous game): keep polling
+        "games_pending": any(
+            event.get('status', {}).get('type', {}).get('description') == 'Scheduled'
+            and datetime.fromisoformat(event['date'][:-1]).replace(tzinfo=timezone.utc).timestamp() <= now
+            for event in games_data.get('events', [])
+        ),
+        "games": games,
+    }
+    disk_cache.set(SNAPSHOT_KEY, snapshot)
+
+
+def _sleep_idle(delay):
+    """Sleep through an idle wait in short steps, ending it early when new schedule data arrives
+    (a kickoff may have moved earlier)."""
+    version = fetch_nfl_events_version()
+    deadline = time.monotonic() + delay
+    while (remaining := deadline - time.monotonic()) > 0:
+        time.sleep(min(POLL_IDLE_STEP, remaining))
+        if fetch_nfl_events_version() != version:
+            return
+
+
+def run_poller():
+    """Poll while games are on, but only fetch while this process holds the poller lease.
+
+    Between game windows the loop sleeps until the next kickoff, so idle days cost no
+    upstream calls.
+    """
+    while True:
+        try:
+            plan = poll_plan(get_snapshot())
+            if plan['mode'] != 'live':
+                _sleep_idle(plan['interval'])
+                continue
+            if hold_leadership(LEADER_NAME, POLLER_LEASE_TTL):
+                poll_once()
+        except Exception as e:
+            print(f"Error polling scoreboard: {e}")
+        time.sleep(POLLER_INTERVAL)
+
+
+def start_poller():
+    """Start the poller loop in the background once per process. Every worker calls this,
+    the shared lease makes sure only one of them talks to upstream at a time."""
+    global _poller_thread
+    with _poller_lock:
+        if _poller_thread is None:
+            _poller_thread = threading.Thread(target=run_poller, name="scoreboard-poller", daemon=True)
+            _poller_thread.start()
+
+
+# Run as a sidecar: python poller.py (set POLLER_ENABLED=0 for the web workers)
+if __name__ == "__main__":
+    run_poller()
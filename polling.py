@@ -0,0 +1,30 @@
+# polling.py
+import bisect
+import time
+from season_index import get_season_index
+from config import POLL_LIVE_INTERVAL, POLL_MAX_IDLE_INTERVAL, GAME_WINDOW
+
+
+def poll_plan(snapshot=None, now=None):
+    """Decide how often live scores need polling from the season schedule and latest snapshot.
+
+    "live": a game is in progress, overdue to start, or kicked off since the last snapshot was
+    taken; poll every POLL_LIVE_INTERVAL seconds.
+    "idle": nothing on, wait until the next kickoff (at most POLL_MAX_IDLE_INTERVAL) and re-arm.
+    """
+    now = now or time.time()
+    kickoffs = get_season_index()['kickoffs']
+
+    if snapshot and (snapshot.get('games_in_progress') or snapshot.get('games_pending')):
+        return {'mode': 'live', 'interval': POLL_LIVE_INTERVAL}
+
+    # A kickoff in (now - GAME_WINDOW, now] that no snapshot has looked at yet
+    started = bisect.bisect_right(kickoffs, now)
+    last_kickoff = kickoffs[started - 1] if started > 0 else None
+    if last_kickoff and last_kickoff > now - GAME_WINDOW and (not snapshot or snapshot['updated_at'] < last_kickoff):
+        return {'mode': 'live', 'interval': POLL_LIVE_INTERVAL}
+
+    next_kickoff = kickoffs[started] if started < len(kickoffs) else None
+    if next_kickoff is None:
+        return {'mode': 'idle', 'interval': POLL_MAX_IDLE_INTERVAL}
+    return {'mode': 'idle', 'interval': max(POLL_LIVE_INTERVAL, min(next_kickoff - now, POLL_MAX_IDLE_INTERVAL))}
@@ -0,0 +1,76 @@
+# render_cache.py
+import hashlib
+import json
+import os
+import threading
+from collections import Counter
+import dash
+import dash_bootstrap_components as dbc
+from plotly.io.json import to_json_plotly
+from cache_config import disk_cache
+from config import RENDER_CACHE_CODE, RENDER_CACHE_TTL, RENDER_CACHE_FINAL_TTL
+
+_stats = Counter()
+_stats_lock = threading.Lock()
+_code_version = None
+
+
+def code_version():
+    """Hash of the rendering modules' source and the component library versions, computed once."""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha1(f"{dash.__version__}:{dbc.__version__}".encode())
+        for name in RENDER_CACHE_CODE:
+            with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), name), "rb") as f:
+                digest.update(f.read())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+def content_hash(inputs):
+    payload = json.dumps([code_version(), inputs], sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def _fragment_key(kind, inputs):
+    return f"fragment:{kind}:{content_hash(inputs)}"
+
+
+def get_fragment(kind, inputs):
+    """The cached component tree for these inputs, or None on a miss."""
+    fragment = disk_cache.get(_fragment_key(kind, inputs))
+    with _stats_lock:
+        _stats[kind, fragment is not None] += 1
+    return None if fragment is None else json.loads(fragment)
+
+
+def store_fragment(kind, inputs, component, permanent=False):
+    """Cache a built component tree under its inputs and return it in serialized form."""
+    fragment = to_json_plotly(component)
+    disk_cache.set(_fragment_key(kind, inputs), fragment,
+                   expire=RENDER_CACHE_FINAL_TTL if permanent else RENDER_CACHE_TTL)
+    return json.loads(fragment)
+
+
+def cached_fragment(kind, inputs, build, permanent=False):
+    """Serialized component tree for build(), keyed by a hash of everything it renders from.
+
+    The JSON lives in the shared disk cache, so any worker can reuse it. Same inputs give the
+    same key, so changed data (or changed rendering code) gets a new entry and nothing is ever
+    invalidated. Entries for games that can't change any more (final) are kept much longer.
+    """
+    fragment = get_fragment(kind, inputs)
+    if fragment is None:
+        fragment = store_fragment(kind, inputs, build(), permanent)
+    return fragment
+
+
+def render_cache_stats():
+    """Hits, misses and hit rate per fragment kind for this worker."""
+    with _stats_lock:
+        kinds = {kind for kind, _ in _stats}
+        stats = {}
+        for kind in sorted(kinds):
+            hits, misses = _stats[kind, True], _stats[kind, False]
+            stats[kind] = {"hits": hits, "misses": misses, "hit_rate": round(hits / (hits + misses), 3)}
+    return stats
@@ -0,0 +1,184 @@
+# roster_cache.py
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from api import fetch_players_by_team
+from cache_config import disk_cache
+from fanout import fan_out
+from leader import hold_leadership, release_leadership
+from config import (TEAMS_FILE_PATH, ROSTER_TTL, ROSTER_REFRESH_HOUR_UTC, ROSTER_LEASE_TTL, ROSTER_RETRY_ATTEMPTS,
+                    ROSTER_RETRY_BACKOFF, BULK_FANOUT_CONCURRENCY, CACHE_RETENTION)
+
+LEADER_NAME = "roster-refresher"
+
+_teams = {"mtime": None, "list": [], "by_id": {}}
+_teams_lock = threading.Lock()
+_refresher_thread = None
+_refresher_lock = threading.Lock()
+
+
+def load_teams():
+    """Teams from data/teams.json, parsed once and again only when the file changes."""
+    mtime = os.path.getmtime(TEAMS_FILE_PATH)
+    if _teams["mtime"] != mtime:
+        with _teams_lock:
+            if _teams["mtime"] != mtime:
+                with open(TEAMS_FILE_PATH) as f:
+                    teams = json.load(f)
+                _teams.update(mtime=mtime, list=teams, by_id={team["id"]: team for team in teams})
+    return _teams["list"]
+
+
+def get_team(team_id):
+    load_teams()
+    return _teams["by_id"].get(str(team_id))
+
+
+def _roster_key(team_id):
+    return f"roster:{team_id}"
+
+
+def _checked_key(team_id):
+    return f"roster:{team_id}:checked_at"
+
+
+def store_roster(team_id, roster):
+    """Save a fetched roster. It's only rewritten when its content differs from the stored one."""
+    roster_hash = hashlib.sha1(json.dumps(roster, sort_keys=True).encode()).hexdigest()
+    entry = disk_cache.get(_roster_key(team_id))
+    changed = entry is None or entry["hash"] != roster_hash
+    if changed:
+        disk_cache.set(_roster_key(team_id), {"hash": roster_hash, "updated_at": time.time(), "roster": roster},
+                       expire=CACHE_RETENTION)
+    else:
+        disk_cache.touch(_roster_key(team_id), expire=CACHE_RETENTION)
+    disk_cache.set(_checked_key(team_id), time.time(), expire=CACHE_RETENTION)
+    return changed
+
+
+def _refresh_in_background(team_id):
+    # One refresh per team across all greenlets and workers
+    lock_key = f"{_roster_key(team_id)}:refreshing"
+    if not disk_cache.add(lock_key, True, expire=60):
+        return
+
+    def refresh():
+        try:
+            roster = fetch_players_by_team(team_id)
+            if roster:
+                store_roster(team_id, roster)
+        finally:
+            disk_cache.delete(lock_key)
+
+    threading.Thread(target=refresh, name=f"roster-{team_id}", daemon=True).start()
+
+
+def get_roster(team_id):
+    """Roster for one team from the cache. Only a team nobody has fetched yet goes upstream.
+
+    A roster not checked within ROSTER_TTL is still served, while a background fetch refreshes
+    it, so rosters stay fresh even without the refresher thread (ROSTER_REFRESH_ENABLED=0).
+    """
+    entry = disk_cache.get(_roster_key(team_id))
+    if entry is not None:
+        if time.time() - disk_cache.get(_checked_key(team_id), default=0) >= ROSTER_TTL:
+            _refresh_in_background(team_id)
+        return entry["roster"]
+
+    roster = fetch_players_by_team(team_id)
+    if roster:
+        store_roster(team_id, roster)
+    return roster or {}
+
+
+def refresh_rosters(max_age=ROSTER_TTL, progress=None):
+    """Fetch every team's roster not checked within max_age seconds, concurrently.
+
+    The fan-out is paced to what the bulk priority class may spend, and teams whose fetch still
+    failed are retried in up to ROSTER_RETRY_ATTEMPTS rounds with a doubling backoff.
+    progress(done, total) is called as each team succeeds or finally fails. Returns how many
+    rosters were fetched, how many had actually changed and how many could not be fetched.
+    """
+    now = time.time()
+    team_ids = [team["id"] for team in load_teams()
+                if now - disk_cache.get(_checked_key(team["id"]), default=0) >= max_age]
+    if not team_ids:
+        return {"fetched": 0, "changed": 0, "failed": 0}
+
+    fetched = changed = settled = 0
+    pending = team_ids
+    start = time.perf_counter()
+    for attempt in range(ROSTER_RETRY_ATTEMPTS + 1):
+        if attempt:
+            delay = ROSTER_RETRY_BACKOFF * 2 ** (attempt - 1)
+            print(f"Retrying {len(pending)} rosters in {delay}s")
+            time.sleep(delay)
+        final = attempt == ROSTER_RETRY_ATTEMPTS
+
+        def report(index, team_id, roster):
+            nonlocal settled
+            if roster or final:
+                settled += 1
+                if progress:
+                    progress(settled, len(team_ids))
+
+        results, _ = fan_out(fetch_players_by_team, pending, concurrency=BULK_FANOUT_CONCURRENCY,
+                             on_result=report)
+        failed = []
+        for index, roster in sorted(results.items()):
+            if roster:
+                fetched += 1
+                changed += store_roster(pending[index], roster)
+            else:
+                failed.append(pending[index])
+        pending = failed
+        if not pending:
+            break
+
+    elapsed = time.perf_counter() - start
+    print(f"Refreshed {fetched} rosters in {elapsed:.2f}s, {changed} changed, {len(pending)} failed"
+          + (f" ({', '.join(pending)})" if pending else ""))
+    return {"fetched": fetched, "changed": changed, "failed": len(pending)}
+
+
+def _refresh_as_leader(max_age):
+    # One worker refreshes, the others find everything recently checked when they get the lease
+    if not hold_leadership(LEADER_NAME, ROSTER_LEASE_TTL):
+        return
+    try:
+        refresh_rosters(max_age)
+    finally:
+        release_leadership(LEADER_NAME)
+
+
+def _seconds_until_off_peak(now=None):
+    now = now or datetime.now(timezone.utc)
+    next_run = now.replace(hour=ROSTER_REFRESH_HOUR_UTC, minute=0, second=0, microsecond=0)
+    if next_run <= now:
+        next_run += timedelta(days=1)
+    return (next_run - now).total_seconds()
+
+
+def run_roster_refresher():
+    """Prewarm missing or expired rosters now, then refresh all of them daily off-peak."""
+    try:
+        _refresh_as_leader(ROSTER_TTL)
+    except Exception as e:
+        print(f"Error prewarming rosters: {e}")
+    while True:
+        time.sleep(_seconds_until_off_peak())
+        try:
+            _refresh_as_leader(ROSTER_TTL / 2)
+        except Exception as e:
+            print(f"Error refreshing rosters: {e}")
+
+
+def start_roster_refresher():
+    global _refresher_thread
+    with _refresher_lock:
+        if _refresher_thread is None:
+            _refresher_thread = threading.Thread(target=run_roster_refresher, name="roster-refresher", daemon=True)
+            _refresher_thread.start()
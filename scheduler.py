@@ -0,0 +1,118 @@
+# scheduler.py
+import time
+from datetime import datetime, timezone
+import requests
+from cache_config import disk_cache
+from config import (RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST, MONTHLY_REQUEST_BUDGET, PRIORITY_TOKEN_RESERVE,
+                    PRIORITY_BUDGET_RESERVE, PRIORITY_MAX_WAIT, ENDPOINT_PRIORITIES)
+
+# Priority classes, lower number wins
+PRIORITY_LIVE = 0
+PRIORITY_SCORING = 1
+PRIORITY_ODDS = 2
+PRIORITY_BULK = 3
+PRIORITY_NAMES = {PRIORITY_LIVE: "live", PRIORITY_SCORING: "scoring", PRIORITY_ODDS: "odds", PRIORITY_BULK: "bulk"}
+
+BUCKET_KEY = "quota:bucket"
+BLOCKED_UNTIL_KEY = "quota:blocked_until"
+UPSTREAM_REMAINING_KEY = "quota:upstream_remaining"
+
+
+class QuotaExceeded(requests.exceptions.RequestException):
+    """Raised when a request's priority class may not spend quota right now."""
+
+
+def _month_key():
+    return f"quota:used:{datetime.now(timezone.utc).strftime('%Y-%m')}"
+
+
+def _queue_key(priority):
+    return f"quota:waiting:{priority}"
+
+
+def priority_for(endpoint):
+    return ENDPOINT_PRIORITIES.get(endpoint, PRIORITY_BULK)
+
+
+def remaining_budget():
+    used = disk_cache.get(_month_key(), default=0)
+    remaining = MONTHLY_REQUEST_BUDGET - used
+    # Prefer what RapidAPI told us when it is lower than our own count
+    upstream_remaining = disk_cache.get(UPSTREAM_REMAINING_KEY)
+    if upstream_remaining is not None:
+        remaining = min(remaining, upstream_remaining)
+    return remaining
+
+
+def _try_take_token(priority):
+    """Take a token for this priority if the bucket and monthly budget allow it."""
+    now = time.time()
+    with disk_cache.transact():
+        if disk_cache.get(BLOCKED_UNTIL_KEY, default=0) > now:
+            return False
+
+        if remaining_budget() <= MONTHLY_REQUEST_BUDGET * PRIORITY_BUDGET_RESERVE[priority]:
+            raise QuotaExceeded(f"Monthly budget reserved for higher priority than {PRIORITY_NAMES[priority]}")
+
+        bucket = disk_cache.get(BUCKET_KEY, default={"tokens": RATE_LIMIT_BURST, "updated": now})
+        tokens = min(RATE_LIMIT_BURST, bucket["tokens"] + (now - bucket["updated"]) * RATE_LIMIT_PER_SECOND)
+
+        # Lower classes leave a few tokens in the bucket for higher ones
+        if tokens - 1 < PRIORITY_TOKEN_RESERVE[priority]:
+            disk_cache.set(BUCKET_KEY, {"tokens": tokens, "updated": now})
+            return False
+
+        disk_cache.set(BUCKET_KEY, {"tokens": tokens - 1, "updated": now})
+        disk_cache.incr(_month_key(), default=0)
+        return True
+
+
+def acquire(endpoint):
+    """Block until the endpoint's priority class may send one request, or raise QuotaExceeded.
+
+    Live scores wait longest for a token; lower classes give up quickly so callers fall
+    back to cached data instead of queueing behind the live poller.
+    """
+    priority = priority_for(endpoint)
+    if _try_take_token(priority):
+        return
+
+    deadline = time.monotonic() + PRIORITY_MAX_WAIT[priority]
+    disk_cache.incr(_queue_key(priority), default=0)
+    try:
+        while time.monotonic() < deadline:
+            time.sleep(min(0.1, 1.0 / RATE_LIMIT_PER_SECOND))
+            if _try_take_token(priority):
+                return
+    finally:
+        disk_cache.decr(_queue_key(priority), default=1)
+
+    raise QuotaExceeded(f"No {PRIORITY_NAMES[priority]} token available for {endpoint}")
+
+
+def record_response(response):
+    """Learn from RapidAPI's rate-limit headers and honor 429 Retry-After."""
+    remaining = response.headers.get("x-ratelimit-requests-remaining")
+    if remaining is not None and remaining.isdigit():
+        disk_cache.set(UPSTREAM_REMAINING_KEY, int(remaining), expire=24 * 3600)
+
+    if response.status_code == 429:
+        retry_after = response.headers.get("Retry-After", "")
+        delay = int(retry_after) if retry_after.isdigit() else 60
+        disk_cache.set(BLOCKED_UNTIL_KEY, time.time() + delay, expire=delay)
+        raise QuotaExceeded(f"Rate limited by upstream, retrying after {delay}s")
+
+
+def status():
+    bucket = disk_cache.get(BUCKET_KEY, default={"tokens": RATE_LIMIT_BURST, "updated": time.time()})
+    tokens = min(RATE_LIMIT_BURST, bucket["tokens"] + (time.time() - bucket["updated"]) * RATE_LIMIT_PER_SECOND)
+    blocked_until = disk_cache.get(BLOCKED_UNTIL_KEY, default=0)
+    return {
+        "monthly_budget": MONTHLY_REQUEST_BUDGET,
+        "used_this_month": disk_cache.get(_month_key(), default=0),
+        "remaining_budget": remaining_budget(),
+        "tokens_available": round(tokens, 2),
+        "blocked_for_seconds": max(0, round(blocked_until - time.time(), 1)),
+        "queue_depth": {name: max(0, disk_cache.get(_queue_key(priority), default=0))
+                        for priority, name in PRIORITY_NAMES.items()},
+    }
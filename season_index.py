@@ -0,0 +1,113 @@
+# season_index.py
+import bisect
+import threading
+import time
+from datetime import datetime, timezone
+from api import fetch_nfl_events, fetch_nfl_events_version
+
+FRESHNESS_CHECK_INTERVAL = 60  # How often a warm worker runs the SWR check that refreshes stale events
+
+_index = None
+_index_lock = threading.Lock()
+_checked_at = float("-inf")  # Monotonic time of the last fetch_nfl_events() call
+
+
+def _parse_utc(value):
+    return datetime.fromisoformat(value[:-1]).replace(tzinfo=timezone.utc)
+
+
+def build_season_index(events_data, version=None):
+    """Map every calendar week to its label, date range, events and teams on bye.
+
+    Event dates are parsed once here so selecting a week later is a list lookup.
+    """
+    leagues_data = events_data.get('leagues', []) if events_data else []
+    calendar_data = leagues_data[0].get('calendar', []) if leagues_data else []
+    events = events_data.get('events', []) if events_data else []
+
+    weeks = []
+    for period in calendar_data:
+        for week in period.get('entries', []):
+            start_date = _parse_utc(week['startDate'])
+            end_date = _parse_utc(week['endDate'])
+            weeks.append({
+                'label': f"{week['label']}: {start_date.strftime('%m/%d')} - {end_date.strftime('%m/%d')}",
+                'start': start_date.timestamp(),
+                'end': end_date.timestamp(),
+                'event_ids': [],
+            })
+
+    dated_events = sorted(((_parse_utc(event['date']).timestamp(), position, event)
+                           for position, event in enumerate(events)), key=lambda item: item[:2])
+    regular_season_teams = set()
+    for event_time, _, event in dated_events:
+        if event.get('season', {}).get('type') == 2:
+            regular_season_teams.update(competitor['team']['id']
+                                        for competitor in event['competitions'][0]['competitors'])
+        for week in weeks:
+            if week['start'] <= event_time <= week['end']:
+                week['event_ids'].append(event['id'])
+
+    events_by_id = {event['id']: event for event in events}
+    for week in weeks:
+        week_events = [events_by_id[event_id] for event_id in week['event_ids']]
+        if week_events and all(event.get('season', {}).get('type') == 2 for event in week_events):
+            playing = {competitor['team']['id'] for event in week_events
+                       for competitor in event['competitions'][0]['competitors']}
+            week['bye_team_ids'] = sorted(regular_season_teams - playing, key=int)
+        else:
+            week['bye_team_ids'] = []
+
+    return {
+        'version': version,
+        'weeks': weeks,
+        'kickoffs': [event_time for event_time, _, _ in dated_events],
+        'week_starts': [week['start'] for week in weeks],
+        'options': [{'label': week['label'], 'value': index} for index, week in enumerate(weeks)],
+        'events_by_id': events_by_id,
+    }
+
+
+def get_season_index():
+    """Season index for the current fetch_nfl_events data, rebuilt only when that data changes.
+
+    Comparing versions alone never refreshes the events, so every FRESHNESS_CHECK_INTERVAL the
+    payload is read through fetch_nfl_events(), which starts a background refresh once it's stale.
+    """
+    global _index, _checked_at
+    version = fetch_nfl_events_version()
+    if (_index is not None and version is not None and _index['version'] == version
+            and time.monotonic() - _checked_at < FRESHNESS_CHECK_INTERVAL):
+        return _index
+
+    with _index_lock:
+        events_data = fetch_nfl_events()  # Also populates the version on a cold cache
+        _checked_at = time.monotonic()
+        version = fetch_nfl_events_version()
+        if _index is None or _index['version'] != version:
+            _index = build_season_index(events_data, version)
+    return _index
+
+
+def current_week(index, now=None):
+    """Index of the week containing now, or the first week when we're outside the calendar."""
+    if not index['weeks']:
+        return None
+    now = (now or datetime.now(timezone.utc)).timestamp()
+    position = bisect.bisect_right(index['week_starts'], now) - 1
+    if position >= 0 and now <= index['weeks'][position]['end']:
+        return position
+    return 0
+
+
+def get_week(index, week_index):
+    if week_index is None or not 0 <= week_index < len(index['weeks']):
+        return None
+    return index['weeks'][week_index]
+
+
+def get_week_events(index, week_index):
+    week = get_week(index, week_index)
+    if not week:
+        return []
+    return [index['events_by_id'][event_id] for event_id in week['event_ids']]
@@ -0,0 +1,262 @@
+# simulator.py
+import hashlib
+import json
+import math
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from cache_config import disk_cache
+from config import SIM_SEASONS, SIM_BATCH_SIZE, SIM_PROCESSES, SIM_SPREAD_STDDEV
+from tiebreakers import (EPSILON, PLAYOFF_SEEDS, SeasonTable, _pct, build_season_table, playoff_outcome,
+                         season_stats)
+
+ODDS_KEY = "playoff-odds:{}"
+ODDS_LOCK_KEY = "playoff-odds:running"
+ODDS_LOCK_TTL = 600  # Longest one simulation run may hold the lock
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def spread_home_win_probability(details, home_abbreviation, away_abbreviation):
+    """Chance the home team wins from a line like "KC -3.5", or None when it can't be read.
+
+    Final margins are roughly normal around the spread with a standard deviation of about 13.5
+    points.
+    """
+    parts = (details or "").split()
+    if len(parts) != 2 or parts[0] not in (home_abbreviation, away_abbreviation):
+        return None
+    try:
+        spread = float(parts[1])
+    except ValueError:
+        return None
+    favorite = 0.5 * (1 + math.erf(abs(spread) / SIM_SPREAD_STDDEV / math.sqrt(2)))
+    return favorite if parts[0] == home_abbreviation else 1 - favorite
+
+
+def simulation_inputs(events_by_id, completed, team_ids, division_of, odds=None):
+    """Completed results as matrices plus the remaining regular season schedule.
+
+    completed is a final_games_frame(). Remaining games are weighted by their spread in `odds`
+    ({game_id: details}) when there is one, otherwise they're a coin flip.
+    """
+    table = build_season_table(completed, team_ids, division_of)
+    index = {team_id: position for position, team_id in enumerate(team_ids)}
+    finished = set(completed["game_id"])
+
+    home, away, probability, weights = [], [], [], []
+    for game_id, event in sorted(events_by_id.items()):
+        if game_id in finished or event.get("season", {}).get("type") != 2:
+            continue
+        competitors = event["competitions"][0]["competitors"]
+        home_team = next(team for team in competitors if team.get("homeAway") == "home")["team"]
+        away_team = next(team for team in competitors if team.get("homeAway") == "away")["team"]
+        home.append(index[home_team["id"]])
+        away.append(index[away_team["id"]])
+        details = (odds or {}).get(game_id)
+        chance = spread_home_win_probability(details, home_team.get("abbreviation"), away_team.get("abbreviation"))
+        probability.append(0.5 if chance is None else chance)
+        weights.append(details if chance is not None else None)
+
+    games = table.games.copy()
+    np.add.at(games, (home, away), 1)
+    np.add.at(games, (away, home), 1)
+    return {
+        "team_ids": table.team_ids,
+        "division": table.division,
+        "conference": table.conference,
+        "wins": table.wins,
+        "games": games,  # Every game of the season, played or not
+        "home": np.array(home, dtype=int),
+        "away": np.array(away, dtype=int),
+        "home_win_probability": np.array(probability),
+        "spreads": weights,
+    }
+
+
+def clear_conferences(inputs, win_pct):
+    """Seeding straight from win percentages, for every season and conference needing no tiebreaker.
+
+    win_pct is (seasons, teams). A conference is clear in a season when each of its divisions has
+    a single leader, one division winner has the best record (the bye), and no wild card contender
+    is level with the last club in. Returns (clear, playoffs, division, bye, leaders): a (seasons,
+    conferences) mask, three (seasons, teams) masks that only hold for teams of clear conferences,
+    and each division's leader (seasons, divisions), -1 where the lead is tied.
+    """
+    seasons = np.arange(len(win_pct))
+    division, conference = inputs["division"], inputs["conference"]
+    conferences = np.unique(conference)
+    clear = np.ones((len(win_pct), len(conferences)), dtype=bool)
+
+    division_winner = np.zeros(win_pct.shape, dtype=bool)
+    leaders = np.full((len(win_pct), division.max() + 1), -1)
+    for value in np.unique(division):
+        members = np.flatnonzero(division == value)
+        pct = win_pct[:, members]
+        single = (pct >= pct.max(axis=1, keepdims=True) - EPSILON).sum(axis=1) == 1
+        clear[:, np.searchsorted(conferences, conference[members[0]])] &= single
+        leaders[:, value] = np.where(single, members[pct.argmax(axis=1)], -1)
+        division_winner[seasons, members[pct.argmax(axis=1)]] = True
+
+    playoffs = division_winner.copy()
+    bye = np.zeros(win_pct.shape, dtype=bool)
+    for position, value in enumerate(conferences):
+        in_conference = conference == value
+        winner_pct = np.where(division_winner & in_conference, win_pct, -np.inf)
+        clear[:, position] &= (winner_pct >= winner_pct.max(axis=1, keepdims=True) - EPSILON).sum(axis=1) == 1
+        bye[seasons, winner_pct.argmax(axis=1)] = True
+
+        wild_cards = PLAYOFF_SEEDS - len(np.unique(division[in_conference]))
+        contenders = ~division_winner & in_conference
+        if wild_cards <= 0:
+            continue
+        if contenders.sum(axis=1).max() <= wild_cards:
+            playoffs |= contenders
+            continue
+        # Clubs in are the best `wild_cards` contenders, unless the next one is level with the last in
+        contender_pct = np.where(contenders, win_pct, -np.inf)
+        order = np.argsort(-contender_pct, axis=1, kind="stable")
+        last_in = contender_pct[seasons, order[:, wild_cards - 1]]
+        first_out = contender_pct[seasons, order[:, wild_cards]]
+        clear[:, position] &= first_out < last_in - EPSILON
+        playoffs[seasons[:, None], order[:, :wild_cards]] = True
+    return clear, playoffs, division_winner, bye, leaders
+
+
+def simulate_batch(inputs, seasons, seed):
+    """Play out the remaining schedule `seasons` times. Returns playoff, division title and bye counts.
+
+    Outcomes, win percentages and tiebreak stats are computed for the whole batch with matrix
+    operations, and most conferences are seeded from win percentages directly
+    (clear_conferences). The NFL tiebreakers only run for the ties that decide a division, a bye
+    or the last wild card.
+    """
+    rng = np.random.default_rng(seed)
+    team_count = len(inputs["team_ids"])
+    home, away = inputs["home"], inputs["away"]
+    conference = inputs["conference"]
+
+    # Each game's result is one draw against its home win probability; wins per team are then
+    # the completed wins plus the home and away wins picked out by one-hot schedule matrices
+    home_won = rng.random((seasons, len(home))) < inputs["home_win_probability"]
+    home_team = np.zeros((len(home), team_count))
+    home_team[np.arange(len(home)), home] = 1
+    away_team = np.zeros((len(away), team_count))
+    away_team[np.arange(len(away)), away] = 1
+    total_wins = inputs["wins"].sum(axis=1) + home_won @ home_team + ~home_won @ away_team
+    win_pct = _pct(total_wins, np.broadcast_to(inputs["games"].sum(axis=1), total_wins.shape))
+
+    clear, playoffs, division, bye, leaders = clear_conferences(inputs, win_pct)
+    clear_teams = clear[:, np.searchsorted(np.unique(conference), conference)]
+    counts = np.stack([(playoffs & clear_teams).sum(axis=0), (division & clear_teams).sum(axis=0),
+                       (bye & clear_teams).sum(axis=0)])
+
+    # Full win matrices and tiebreak stats only for seasons with a tie to break, built in one go
+    tied = np.flatnonzero(~clear.all(axis=1))
+    cells = team_count * team_count
+    offsets = (np.arange(len(tied)) * cells)[:, None]
+    wins = np.bincount((offsets + home * team_count + away).ravel(), home_won[tied].ravel(),
+                       minlength=len(tied) * cells)
+    wins += np.bincount((offsets + away * team_count + home).ravel(), (~home_won[tied]).ravel(),
+                        minlength=len(tied) * cells)
+    wins = wins.reshape(len(tied), team_count, team_count) + inputs["wins"]
+    stats = season_stats(wins, inputs["games"], inputs["division"], conference)
+    coins = rng.permuted(np.tile(np.arange(team_count), (len(tied), 1)), axis=1)
+
+    for position, season in enumerate(tied):
+        table = SeasonTable(inputs["team_ids"], inputs["division"], conference, wins[position],
+                            inputs["games"], coin=coins[position],
+                            stats={name: values[position] for name, values in stats.items()})
+        for value in np.unique(conference)[~clear[season]]:
+            winners, conference_bye, playoff_teams = playoff_outcome(table, value, leaders[season])
+            counts[0, playoff_teams] += 1
+            counts[1, winners] += 1
+            counts[2, conference_bye] += 1
+    return counts
+
+
+def run_simulation(inputs, seasons=SIM_SEASONS, processes=SIM_PROCESSES, batch_size=SIM_BATCH_SIZE, seed=None):
+    """Simulate `seasons` seasons in batches, spread over a process pool. Returns per-team odds and timing."""
+    start = time.perf_counter()
+    sizes = [min(batch_size, seasons - offset) for offset in range(0, seasons, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+    if processes > 1 and len(sizes) > 1:
+        # spawn, not fork: the web workers run threads (and gevent) that a forked child can't inherit safely
+        with ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn")) as pool:
+            results = list(pool.map(simulate_batch, [inputs] * len(sizes), sizes, seeds))
+    else:
+        results = [simulate_batch(inputs, size, batch_seed) for size, batch_seed in zip(sizes, seeds)]
+
+    counts = np.sum(results, axis=0) / seasons
+    elapsed = time.perf_counter() - start
+    return {
+        "odds": {team_id: {"playoffs": counts[0, i], "division": counts[1, i], "bye": counts[2, i]}
+                 for i, team_id in enumerate(inputs["team_ids"])},
+        "seasons": seasons,
+        "seconds": round(elapsed, 2),
+        "seasons_per_second": round(seasons / elapsed),
+    }
+
+
+def data_version(season_version, inputs, seasons=SIM_SEASONS):
+    """Changes with the season data, the spreads used for the remaining games, or the run size."""
+    payload = json.dumps([season_version, inputs["spreads"], seasons], default=str)
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def _get_executor():
+    # One long-lived simulation process per web worker, shut down (and joined) with the worker.
+    # spawn, not fork: the web workers run threads (and gevent) that a forked child can't inherit safely
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    return _executor
+
+
+def get_playoff_odds(season_version, inputs):
+    """Cached simulation results for this data version, or None while they're being computed.
+
+    A miss starts a run in the worker's simulation process, never in the web worker itself: the
+    seeding loop is pure Python and would hold a gevent worker's only thread for the whole run.
+    Only one run is in flight across all workers (a lock in the disk cache); a version that
+    misses while another run holds it is simulated on the first request after that run ends.
+    The results are stored under the version so every worker picks them up.
+    """
+    global _executor
+    version = data_version(season_version, inputs)
+    result = disk_cache.get(ODDS_KEY.format(version))
+    if result is not None:
+        return {"version": version, **result}
+
+    if disk_cache.add(ODDS_LOCK_KEY, version, expire=ODDS_LOCK_TTL):
+        try:
+            future = _get_executor().submit(_simulate_and_store, version, inputs)
+        except Exception as e:
+            # A simulation process that died leaves the pool broken; the next miss starts a new one
+            print(f"Error starting playoff odds simulation: {e}")
+            _executor = None
+            disk_cache.delete(ODDS_LOCK_KEY)
+            return None
+        future.add_done_callback(lambda _: _release_lock(version))
+    return None
+
+
+def _release_lock(version):
+    with disk_cache.transact():
+        if disk_cache.get(ODDS_LOCK_KEY) == version:  # Not a newer run's lock after a timeout
+            disk_cache.delete(ODDS_LOCK_KEY)
+
+
+def _simulate_and_store(version, inputs):
+    try:
+        result = run_simulation(inputs)
+        disk_cache.set(ODDS_KEY.format(version), result)
+        print(f"Simulated {result['seasons']} seasons in {result['seconds']}s")
+    except Exception as e:
+        print(f"Error simulating playoff odds: {e}")
@@ -0,0 +1,92 @@
+# singleflight.py
+import os
+import threading
+import time
+from cache_config import disk_cache
+from config import SINGLE_FLIGHT_WINDOW, SINGLE_FLIGHT_TIMEOUT
+
+SAVED_COUNTER_KEY = "singleflight:saved"
+_MISSING = object()
+
+_flights = {}
+_flights_lock = threading.Lock()
+
+
+class _Flight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+def _record_saved():
+    disk_cache.incr(SAVED_COUNTER_KEY, default=0)
+
+
+def upstream_calls_saved():
+    return disk_cache.get(SAVED_COUNTER_KEY, default=0)
+
+
+def _run_across_workers(key, fn, window):
+    """Let one worker call fn() for key; the others wait for its result in the shared cache."""
+    result_key = f"flight:{key}:result"
+    lock_key = f"flight:{key}:lock"
+
+    result = disk_cache.get(result_key, default=_MISSING)
+    if result is not _MISSING:
+        _record_saved()
+        return result
+
+    if disk_cache.add(lock_key, os.getpid(), expire=SINGLE_FLIGHT_TIMEOUT):
+        try:
+            result = fn()
+            disk_cache.set(result_key, result, expire=window)
+            return result
+        finally:
+            disk_cache.delete(lock_key)
+
+    # Another worker owns the flight, poll for its result
+    deadline = time.monotonic() + SINGLE_FLIGHT_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        result = disk_cache.get(result_key, default=_MISSING)
+        if result is not _MISSING:
+            _record_saved()
+            return result
+        if lock_key not in disk_cache:
+            break  # The owner failed without publishing a result
+
+    return fn()
+
+
+def single_flight(key, fn, window=SINGLE_FLIGHT_WINDOW):
+    """Call fn() once for all concurrent callers of the same key and share its result.
+
+    Greenlets in this worker wait on the in-flight call directly; other gunicorn workers
+    coordinate through diskcache and reuse the result for `window` seconds.
+    """
+    with _flights_lock:
+        flight = _flights.get(key)
+        is_owner = flight is None
+        if is_owner:
+            flight = _flights[key] = _Flight()
+
+    if not is_owner:
+        flight.done.wait(SINGLE_FLIGHT_TIMEOUT)
+        if not flight.done.is_set():
+            return fn()
+        _record_saved()
+        if flight.error:
+            raise flight.error
+        return flight.result
+
+    try:
+        flight.result = _run_across_workers(key, fn, window)
+        return flight.result
+    except Exception as e:
+        flight.error = e
+        raise
+    finally:
+        flight.done.set()
+        with _flights_lock:
+            _flights.pop(key, None)
@@ -0,0 +1,127 @@
+# snapshot.py
+import json
+import os
+import tempfile
+import threading
+from config import SNAPSHOT_VERSION, SNAPSHOT_TABLES
+
+INT_MISSING = -2**63  # Stands in for None in integer fields
+_snapshots = {}  # json path -> (snapshot mtime, memory-mapped array)
+_snapshots_lock = threading.Lock()
+
+
+def snapshot_path(json_path):
+    """Where the binary snapshot of a JSON file lives: data/teams.json -> data/teams.v1.npy"""
+    return f"{os.path.splitext(json_path)[0]}.v{SNAPSHOT_VERSION}.npy"
+
+
+def to_records_array(records):
+    """Structured array from a list of flat JSON objects.
+
+    Integer, float and boolean fields keep a numeric dtype, everything else becomes a
+    fixed-width string (missing values as ""), so the array has no Python objects and can be
+    memory-mapped. A missing number is stored as INT_MISSING or NaN; records() turns both back
+    into None.
+    """
+    import numpy as np  # Imported on first use to keep it off the worker boot path
+
+    if not records:
+        return np.empty(0, dtype=np.dtype([]))
+
+    fields = list(dict.fromkeys(key for record in records for key in record))
+    dtype, missing = [], {}
+    for field in fields:
+        values = [record.get(field) for record in records]
+        present = [value for value in values if value is not None]
+        if present and all(isinstance(value, bool) for value in values):
+            dtype.append((field, np.bool_))
+        elif present and all(isinstance(value, int) and not isinstance(value, bool) for value in present):
+            dtype.append((field, np.int64))
+            missing[field] = INT_MISSING
+        elif present and all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+            dtype.append((field, np.float64))
+            missing[field] = float("nan")
+        else:
+            dtype.append((field, f"U{max([len(str(value)) for value in present] + [1])}"))
+            missing[field] = ""
+
+    strings = {field for field, kind in dtype if isinstance(kind, str)}
+    rows = [tuple(missing[field] if record.get(field) is None else
+                  str(record[field]) if field in strings else record[field]
+                  for field in fields) for record in records]
+    return np.array(rows, dtype=dtype)
+
+
+def export_snapshot(json_path, records=None):
+    """Write the snapshot next to json_path. Written to a temp file first, so readers never see half a file."""
+    import numpy as np
+
+    if records is None:
+        with open(json_path) as f:
+            records = json.load(f)
+    path = snapshot_path(json_path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, to_records_array(records), allow_pickle=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return path
+
+
+def load_snapshot(json_path):
+    """The table in json_path as a structured array, memory-mapped from its snapshot.
+
+    Every worker maps the same file, so the pages are shared instead of each process holding
+    its own parsed copy. When the snapshot is missing or older than the JSON, the JSON is
+    parsed instead and the snapshot rewritten for the next load.
+    """
+    import numpy as np
+
+    path = snapshot_path(json_path)
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        json_mtime = os.stat(json_path).st_mtime_ns if os.path.exists(json_path) else 0
+    except FileNotFoundError:
+        mtime = json_mtime = None
+
+    if mtime is not None and mtime >= json_mtime:
+        cached = _snapshots.get(json_path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            table = np.load(path, mmap_mode="r", allow_pickle=False)
+            with _snapshots_lock:
+                _snapshots[json_path] = (mtime, table)
+            return table
+        except (OSError, ValueError) as e:
+            print(f"Error loading snapshot {path}, falling back to JSON: {e}")
+
+    with open(json_path) as f:
+        records = json.load(f)
+    try:
+        export_snapshot(json_path, records)
+    except OSError as e:
+        print(f"Error writing snapshot for {json_path}: {e}")
+    return to_records_array(records)
+
+
+def records(table):
+    """A structured array back as a list of dicts with plain Python values."""
+    names = table.dtype.names or ()
+    rows = [dict(zip(names, row)) for row in table.tolist()]
+    numeric = [name for name in names if table.dtype[name].kind in "if"]
+    for row in rows:
+        for name in numeric:
+            value = row[name]
+            if value == INT_MISSING or value != value:  # value != value only for NaN
+                row[name] = None
+    return rows
+
+
+# Export every table in SNAPSHOT_TABLES: python snapshot.py
+if __name__ == "__main__":
+    for json_path in SNAPSHOT_TABLES:
+        print(f"{json_path} -> {export_snapshot(json_path)}")
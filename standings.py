@@ -0,0 +1,120 @@
+# standings.py
+import os
+import threading
+import pandas as pd
+from layout import build_standings_tables
+from season_index import get_season_index
+from roster_cache import load_teams
+from odds_store import get_odds_store
+from standings_engine import compute_records, final_games_frame
+from tiebreakers import build_season_table, seed_playoffs
+from simulator import simulation_inputs, get_playoff_odds
+from snapshot import load_snapshot
+from config import DIVISIONS_FILE_PATH
+
+# Each is replaced as a whole, never updated in place, so readers outside the lock see a consistent entry
+_standings = {"version": None, "df": None, "tables": None, "updated_date": None}
+_simulation = {"key": None, "inputs": None}
+_standings_lock = threading.Lock()
+
+
+def standings_version(season_index):
+    """Changes whenever an events refresh brings new data or the divisions file is rewritten."""
+    return season_index["version"], os.stat(DIVISIONS_FILE_PATH).st_mtime_ns
+
+
+def division_of():
+    """team_id -> division name, read from two columns of the memory-mapped divisions snapshot.
+
+    The snapshot itself is never copied into a DataFrame, so it stays one set of read-only
+    pages shared by every worker; only this 32-entry dict is private.
+    """
+    table = load_snapshot(DIVISIONS_FILE_PATH)
+    return dict(zip(table["team_id"].tolist(), table["division_name"].tolist()))
+
+
+def _updated_date(season_index):
+    final_dates = [event["date"] for event in season_index["events_by_id"].values()
+                   if event.get("status", {}).get("type", {}).get("description") == "Final"]
+    if not final_dates:
+        return ""
+    return f"Through games of {max(final_dates)[:10]}"
+
+
+def create_standings(events_by_id):
+    # Records are derived from the season's final games, no per-team records/divisions calls
+    teams_df = pd.DataFrame(load_teams())
+    divisions = division_of()
+    games = final_games_frame(events_by_id)
+    standings_df = compute_records(games, teams_df, divisions)
+
+    # Calculate win percentages, a tie counting as half a win as in the tiebreakers
+    standings_df["overall_win%"] = (standings_df["wins"] + 0.5 * standings_df["ties"]) / (
+                standings_df["wins"] + standings_df["losses"] + standings_df["ties"])
+    standings_df["division_win%"] = (standings_df["division_wins"] + 0.5 * standings_df["division_ties"]) / (
+                standings_df["division_wins"] + standings_df["division_losses"] + standings_df["division_ties"])
+    # Teams without a (division) game yet
+    standings_df[["overall_win%", "division_win%"]] = standings_df[["overall_win%", "division_win%"]].fillna(0)
+
+    # Division order and playoff seeds follow the NFL tiebreaking procedures
+    table = build_season_table(games, standings_df["id"].tolist(), divisions)
+    seeding = seed_playoffs(table)
+    standings_df["division_rank"] = seeding["division_rank"]
+    seed_of = {table.team_ids[team]: seed for teams in seeding["seeds"].values()
+               for seed, team in enumerate(teams, start=1)}
+    standings_df["seed"] = standings_df["id"].map(seed_of)
+    standings_df = standings_df.sort_values(by=["division_name", "division_rank"])
+
+    return standings_df
+
+
+def _simulation_inputs(season_index, data_version):
+    """Inputs for the playoff odds simulation, built once per data version and odds store version,
+    so a line move with no new results still reaches the simulation."""
+    global _simulation
+    simulation = _simulation
+    odds_store = get_odds_store()
+    key = data_version + (odds_store.version,)
+    if simulation["key"] != key:
+        events_by_id = season_index["events_by_id"]
+        inputs = simulation_inputs(events_by_id, final_games_frame(events_by_id),
+                                   [team["id"] for team in load_teams()], division_of(),
+                                   odds_store.snapshot())
+        simulation = _simulation = {"key": key, "inputs": inputs}
+    return simulation["inputs"]
+
+
+def _refresh():
+    global _standings
+    season_index = get_season_index()
+    data_version = standings_version(season_index)
+    playoff_odds = get_playoff_odds(season_index["version"], _simulation_inputs(season_index, data_version))
+    # Rebuilt once more when the playoff odds for this data come in
+    version = data_version + (playoff_odds["version"] if playoff_odds else None,)
+
+    standings = _standings
+    if standings["version"] == version:
+        return standings
+
+    with _standings_lock:
+        if _standings["version"] != version:
+            standings_df = create_standings(season_index["events_by_id"])
+            if playoff_odds:
+                for column in ("playoffs", "division", "bye"):
+                    standings_df[f"{column}_odds"] = standings_df["id"].map(
+                        {team_id: odds[column] for team_id, odds in playoff_odds["odds"].items()})
+            _standings = {"version": version, "df": standings_df, "tables": build_standings_tables(standings_df),
+                          "updated_date": _updated_date(season_index)}
+        return _standings
+
+
+def get_standings():
+    """Merged, sorted standings frame for the current data version."""
+    return _refresh()["df"]
+
+
+def get_standings_tables():
+    """Date line and division tables of the standings page, rebuilt only after the season events
+    (or divisions) change."""
+    standings = _refresh()
+    return standings["updated_date"], standings["tables"]
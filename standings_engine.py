@@ -0,0 +1,94 @@
+# standings_engine.py
+import threading
+import numpy as np
+import pandas as pd
+
+GAME_COLUMNS = ["game_id", "date", "home_id", "away_id", "home_score", "away_score"]
+RECORD_SPLITS = ("", "division_", "conference_", "home_", "away_")
+
+_final_games = {}  # game_id -> (signature, row); a row is rebuilt when a score correction changes it
+_final_games_lock = threading.Lock()
+
+
+def final_games_frame(events_by_id):
+    """One row per final regular season game.
+
+    A row is only rebuilt when the game's status, date or scores differ from the last call, so a
+    score correction reaches the standings. Games no longer in events_by_id are dropped.
+    """
+    with _final_games_lock:
+        for game_id in [game_id for game_id in _final_games if game_id not in events_by_id]:
+            del _final_games[game_id]
+
+        for game_id, event in events_by_id.items():
+            if event.get("season", {}).get("type") != 2:
+                continue
+            status = event.get("status", {}).get("type", {}).get("description")
+            if status != "Final":
+                _final_games.pop(game_id, None)  # Not final (any more)
+                continue
+            competitors = event["competitions"][0]["competitors"]
+            home = next(team for team in competitors if team.get("homeAway") == "home")
+            away = next(team for team in competitors if team.get("homeAway") == "away")
+            signature = (event["date"], home["team"]["id"], away["team"]["id"], home.get("score"), away.get("score"))
+            cached = _final_games.get(game_id)
+            if cached is None or cached[0] != signature:
+                _final_games[game_id] = (signature, (game_id, event["date"], home["team"]["id"], away["team"]["id"],
+                                                     float(home.get("score") or 0), float(away.get("score") or 0)))
+        rows = [row for _, row in _final_games.values()]
+
+    games = pd.DataFrame(rows, columns=GAME_COLUMNS)
+    games["date"] = pd.to_datetime(games["date"], utc=True)
+    return games
+
+
+def team_results(games, division_of):
+    """Each game twice, once from each team's side, with the splits it counts towards.
+
+    division_of maps team_id -> division name."""
+    results = pd.concat([
+        pd.DataFrame({"team_id": games["home_id"], "opponent_id": games["away_id"], "date": games["date"],
+                      "home": True, "margin": games["home_score"] - games["away_score"]}),
+        pd.DataFrame({"team_id": games["away_id"], "opponent_id": games["home_id"], "date": games["date"],
+                      "home": False, "margin": games["away_score"] - games["home_score"]}),
+    ], ignore_index=True)
+
+    team_division = results["team_id"].map(division_of)
+    opponent_division = results["opponent_id"].map(division_of)
+    results["division"] = team_division == opponent_division
+    results["conference"] = team_division.str[:3] == opponent_division.str[:3]  # "AFC East" -> "AFC"
+    return results
+
+
+def _streaks(results):
+    """Current streak per team, e.g. "W3", from the length of each team's last run of equal results."""
+    ordered = results.sort_values(["team_id", "date"])
+    outcome = pd.Series(np.select([ordered["margin"] > 0, ordered["margin"] < 0], ["W", "L"], "T"),
+                        index=ordered.index)
+    new_run = (outcome != outcome.shift()) | (ordered["team_id"] != ordered["team_id"].shift())
+    run = new_run.cumsum()
+    last = pd.DataFrame({"team_id": ordered["team_id"], "outcome": outcome, "run": run}).groupby("team_id").tail(1)
+    return (last["outcome"] + last["run"].map(run.value_counts()).astype(str)).set_axis(last["team_id"])
+
+
+def compute_records(games, teams_df, division_of):
+    """Overall, division, conference, home and away W/L/T plus streak for every team."""
+    results = team_results(games, division_of)
+    outcomes = np.column_stack([results["margin"] > 0, results["margin"] < 0, results["margin"] == 0]).astype(int)
+    masks = {
+        "": np.ones(len(results), dtype=bool),
+        "division_": results["division"].to_numpy(),
+        "conference_": results["conference"].to_numpy(),
+        "home_": results["home"].to_numpy(),
+        "away_": ~results["home"].to_numpy(),
+    }
+    columns = [f"{split}{outcome}" for split in RECORD_SPLITS for outcome in ("wins", "losses", "ties")]
+    counts = pd.DataFrame(np.hstack([outcomes * masks[split][:, None] for split in RECORD_SPLITS]),
+                          columns=columns).groupby(results["team_id"].to_numpy()).sum()
+
+    records = teams_df[["id", "display_name", "color", "logo"]].copy()
+    records["division_name"] = records["id"].map(division_of)
+    records = records.join(counts, on="id")
+    records[columns] = records[columns].fillna(0).astype(int)
+    records["streak"] = records["id"].map(_streaks(results)).fillna("")
+    return records
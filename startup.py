@@ -0,0 +1,33 @@
+# startup.py
+import time
+from contextlib import contextmanager
+
+_started = time.perf_counter()  # Imported first by app.py, so this is roughly when the worker began loading the app
+_phases = {}
+_first_request = None
+
+
+@contextmanager
+def phase(name):
+    """Time one step of the worker boot for the startup report."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phases[name] = time.perf_counter() - start
+
+
+def record_first_request():
+    """Called after every request; only the first one is recorded."""
+    global _first_request
+    if _first_request is None:
+        _first_request = time.perf_counter() - _started
+
+
+def startup_report():
+    """Boot time per phase in milliseconds, and the time until this worker finished its first request."""
+    return {
+        "phases_ms": {name: round(seconds * 1000, 1) for name, seconds in _phases.items()},
+        "boot_ms": round(sum(_phases.values()) * 1000, 1),
+        "first_request_ms": None if _first_request is None else round(_first_request * 1000, 1),
+    }
@@ -0,0 +1,114 @@
+# swr_cache.py
+import hashlib
+import json
+import threading
+import time
+import http_client
+from cache_config import disk_cache
+from singleflight import single_flight
+from scheduler import QuotaExceeded
+from config import CACHE_POLICIES, DEFAULT_CACHE_POLICY, CACHE_RETENTION
+
+
+def _cache_key(endpoint, url, params):
+    return f"swr:{endpoint}:{url}:{json.dumps(params or {}, sort_keys=True, default=str)}"
+
+
+def _data_version(data):
+    """Content hash for an entry cached before versions were recorded."""
+    return hashlib.sha1(json.dumps(data, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _policy(endpoint):
+    return CACHE_POLICIES.get(endpoint, DEFAULT_CACHE_POLICY)
+
+
+def _revalidate(key, endpoint, url, params, entry):
+    """Fetch from upstream, sending validators from the cached entry when we have them."""
+    headers = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = http_client.get(url, endpoint, params=params, headers=headers)
+    if response.status_code == 304 and entry:
+        # Upstream confirmed our copy is current, only the freshness clock moves
+        new_entry = dict(entry, fetched_at=time.time())
+        if not new_entry.get("version"):
+            new_entry["version"] = _data_version(entry["data"])
+    else:
+        response.raise_for_status()
+        new_entry = {
+            "data": response.json(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "fetched_at": time.time(),
+            "version": hashlib.sha1(response.content).hexdigest()[:16],
+        }
+    disk_cache.set(key, new_entry, expire=CACHE_RETENTION)
+    # Kept under its own key so readers can check for new data without loading the payload
+    disk_cache.set(f"{key}:version", new_entry.get("version"), expire=CACHE_RETENTION)
+    return new_entry
+
+
+def _refresh_in_background(key, endpoint, url, params, entry):
+    # Only one refresh per key across all greenlets and workers
+    lock_key = f"{key}:refreshing"
+    if not disk_cache.add(lock_key, True, expire=60):
+        return
+
+    def refresh():
+        try:
+            _revalidate(key, endpoint, url, params, entry)
+        except Exception as e:
+            print(f"Background refresh of {endpoint} failed, serving stale data: {e}")
+        finally:
+            disk_cache.delete(lock_key)
+
+    threading.Thread(target=refresh, daemon=True).start()
+
+
+def cached_get_json(endpoint, url, params=None, revalidate=False):
+    """Return the JSON body for a GET, following the endpoint's stale-while-revalidate policy.
+
+    Fresh entries are returned as-is. Entries past their freshness but within max_stale are
+    returned immediately while a background refresh revalidates them. Only a cold miss (or an
+    entry older than max_stale) blocks on the upstream request. revalidate=True always checks
+    upstream (conditionally) and is meant for background producers, not callbacks.
+    """
+    key = _cache_key(endpoint, url, params)
+    policy = _policy(endpoint)
+    entry = disk_cache.get(key)
+
+    if entry is not None and not revalidate:
+        age = time.time() - entry["fetched_at"]
+        if age < policy["fresh"]:
+            return entry["data"]
+        if age < policy["max_stale"]:
+            _refresh_in_background(key, endpoint, url, params, entry)
+            return entry["data"]
+
+    # Concurrent misses for the same request share one upstream call
+    try:
+        return single_flight(key, lambda: _revalidate(key, endpoint, url, params, entry))["data"]
+    except QuotaExceeded as e:
+        if entry is None:
+            raise
+        print(f"Serving cached {endpoint} data: {e}")
+        return entry["data"]
+
+
+def cached_version(endpoint, url, params=None):
+    """Content hash of the cached response, which changes only when upstream data changes."""
+    key = _cache_key(endpoint, url, params)
+    version = disk_cache.get(f"{key}:version")
+    if version is None:
+        entry = disk_cache.get(key)
+        if entry is None:
+            return None
+        # Cached before versions were recorded (or the version key expired first)
+        version = entry.get("version") or _data_version(entry["data"])
+        disk_cache.set(f"{key}:version", version, expire=CACHE_RETENTION)
+    return version
@@ -0,0 +1,37 @@
+# tests/test_snapshot.py
+import json
+import numpy as np
+from snapshot import export_snapshot, load_snapshot, records, snapshot_path, to_records_array
+
+
+def test_missing_numbers_keep_numeric_dtypes():
+    rows = [{"id": "1", "rank": 1, "pct": 0.5, "final": True},
+            {"id": "2", "rank": None, "pct": None, "final": False},
+            {"id": "3", "pct": 2}]
+    table = to_records_array(rows[:2] + [dict(rows[2], rank=3, final=True)])
+    assert table.dtype["rank"] == np.int64
+    assert table.dtype["pct"] == np.float64
+    assert table.dtype["final"] == np.bool_
+    assert records(table)[1] == {"id": "2", "rank": None, "pct": None, "final": False}
+
+    table = to_records_array(rows)
+    assert table.dtype["rank"] == np.int64
+    assert records(table)[2]["rank"] is None
+
+
+def test_empty_table():
+    table = to_records_array([])
+    assert len(table) == 0
+    assert records(table) == []
+
+
+def test_snapshot_round_trip(tmp_path):
+    json_path = str(tmp_path / "table.json")
+    rows = [{"division_id": "3", "team_id": "14", "games": 17}, {"division_id": "4", "team_id": "9", "games": None}]
+    with open(json_path, "w") as f:
+        json.dump(rows, f)
+    export_snapshot(json_path)
+    table = load_snapshot(json_path)
+    assert isinstance(table, np.memmap)
+    assert records(table) == rows
+    assert snapshot_path(json_path).endswith(".v1.npy")
@@ -0,0 +1,127 @@
+# tests/test_tiebreakers.py
+"""Known tie scenarios on small synthetic leagues. Run with: python -m pytest -q"""
+import random
+import numpy as np
+import pandas as pd
+from tiebreakers import (COMMON_GAMES_MINIMUM, _common_games, _division_criteria, _wild_card_criteria,
+                         break_tie, build_season_table, playoff_outcome, rank_teams, seed_playoffs)
+from simulator import clear_conferences, run_simulation, simulation_inputs
+
+
+def _season(results, division_of):
+    """SeasonTable from (winner, loser) pairs; the winner is listed as the home team."""
+    games = pd.DataFrame(
+        [(f"g{number}", "2024-09-08T17:00Z", winner, loser, 24.0, 17.0)
+         for number, (winner, loser) in enumerate(results)],
+        columns=["game_id", "date", "home_id", "away_id", "home_score", "away_score"])
+    return games, build_season_table(games, sorted(division_of), division_of)
+
+
+def _names(table, teams):
+    return [table.team_ids[team] for team in teams]
+
+
+def test_two_team_head_to_head():
+    division_of = {team: "AFC East" for team in "ABCD"}
+    # A and B finish 1-1; A won their meeting
+    _, table = _season([("A", "B"), ("B", "C"), ("D", "A")], division_of)
+    order = rank_teams(table, range(4), _division_criteria)
+    assert _names(table, order) == ["D", "A", "B", "C"]
+
+
+def test_three_team_division_head_to_head():
+    division_of = dict({team: "AFC East" for team in "ABCD"}, E="AFC North")
+    # A, B and C all finish 2-2. A swept the other two, then B beat C
+    results = [("A", "B"), ("A", "C"), ("B", "C"),
+               ("E", "A"), ("E", "A"), ("B", "E"), ("E", "B"), ("C", "E"), ("C", "E")]
+    _, table = _season(results, division_of)
+    tied = [table.team_ids.index(team) for team in "ABC"]
+    assert len({table.win_pct[team] for team in tied}) == 1
+    order = rank_teams(table, [table.team_ids.index(team) for team in "ABCD"], _division_criteria)
+    assert _names(table, order) == ["A", "B", "C", "D"]
+
+
+def _common_games_league(a_games, b_games):
+    """A (AFC East) and B (AFC North) never met and played no conference games. Each schedule is a
+    list of (NFC opponent, won)."""
+    opponents = {opponent for opponent, _ in a_games + b_games}
+    division_of = dict(A="AFC East", B="AFC North", **{opponent: "NFC West" for opponent in opponents})
+    results = [(team, opponent) if won else (opponent, team)
+               for team, schedule in [("A", a_games), ("B", b_games)] for opponent, won in schedule]
+    return _season(results, division_of)[1]
+
+
+def test_wild_card_common_games_need_minimum():
+    # Both 4-2. Four shared opponents: A went 2-2 against them, B 3-1
+    a_games = [("N1", True), ("N2", True), ("N3", False), ("N4", False), ("N5", True), ("N6", True)]
+    b_games = [("N1", True), ("N2", True), ("N3", True), ("N4", False), ("N7", True), ("N8", False)]
+    table = _common_games_league(a_games, b_games)
+    a, b = table.team_ids.index("A"), table.team_ids.index("B")
+    assert table.win_pct[a] == table.win_pct[b]
+    assert table.games[a, b] == 0
+    assert list(_common_games(table, [a, b], COMMON_GAMES_MINIMUM)) == [0.5, 0.75]
+    assert break_tie(table, [a, b], _wild_card_criteria) == b
+
+    # One shared opponent short of the minimum: the step is skipped
+    b_games = [("N1", True), ("N2", True), ("N3", True), ("N7", False), ("N8", True), ("N9", False)]
+    table = _common_games_league(a_games, b_games)
+    a, b = table.team_ids.index("A"), table.team_ids.index("B")
+    assert _common_games(table, [a, b], COMMON_GAMES_MINIMUM) is None
+
+
+def test_wild_cards_seeded_after_division_winners():
+    division_of = dict(A="AFC East", B="AFC East", C="AFC North", D="AFC North")
+    # B (2-1) has a better record than C (1-2), but C won its division
+    _, table = _season([("A", "B"), ("A", "C"), ("A", "D"), ("B", "C"), ("B", "D"), ("C", "D")], division_of)
+    seeding = seed_playoffs(table)
+    assert _names(table, seeding["seeds"][0]) == ["A", "C", "B", "D"]
+    assert _names(table, [team for team in range(4) if seeding["division_rank"][team] == 0]) == ["A", "C"]
+
+
+def _remaining_event(home, away):
+    return {"season": {"type": 2}, "competitions": [{"competitors": [
+        {"homeAway": "home", "team": {"id": home, "abbreviation": home}},
+        {"homeAway": "away", "team": {"id": away, "abbreviation": away}}]}]}
+
+
+def test_seeded_simulation_is_deterministic():
+    division_of = dict(A="AFC East", B="AFC East", C="AFC North", D="AFC North",
+                       E="NFC East", F="NFC East", G="NFC North", H="NFC North")
+    completed, _ = _season([("A", "B"), ("C", "D"), ("E", "F"), ("G", "H")], division_of)
+    remaining = [("B", "A"), ("D", "C"), ("F", "E"), ("H", "G"), ("A", "C"), ("E", "G")]
+    events = dict({game_id: {"season": {"type": 2}} for game_id in completed["game_id"]},
+                  **{f"r{number}": _remaining_event(home, away) for number, (home, away) in enumerate(remaining)})
+    inputs = simulation_inputs(events, completed, sorted(division_of), division_of)
+
+    first = run_simulation(inputs, seasons=400, processes=1, batch_size=100, seed=7)
+    second = run_simulation(inputs, seasons=400, processes=1, batch_size=100, seed=7)
+    assert first["odds"] == second["odds"]
+    # Each division has exactly one winner per simulated season
+    for division in set(division_of.values()):
+        members = [team for team, name in division_of.items() if name == division]
+        assert abs(sum(first["odds"][team]["division"] for team in members) - 1) < 1e-9
+
+
+def test_simulation_shortcuts_match_full_seeding():
+    # Two conferences of two four-team divisions: five wild card contenders for three places
+    division_of = {f"{conference}{number}": f"{conference}FC {'East' if number < 4 else 'West'}"
+                   for conference in "AN" for number in range(8)}
+    teams = sorted(division_of)
+    pairs = [(home, away) for home in teams for away in teams
+             if home < away and (home[0] == away[0] or int(home[1]) == int(away[1]))]
+    rng = random.Random(11)
+    for _ in range(200):
+        results = [(home, away) if rng.random() < 0.5 else (away, home) for home, away in pairs]
+        _, table = _season(results, division_of)
+        seeding = seed_playoffs(table)
+        inputs = {"division": table.division, "conference": table.conference}
+        clear, playoffs, division, bye, leaders = clear_conferences(inputs, np.array([table.win_pct]))
+        for conference, seeds in seeding["seeds"].items():
+            in_conference = table.conference == conference
+            winners = set(np.flatnonzero((seeding["division_rank"] == 0) & in_conference))
+            outcome = playoff_outcome(table, conference, leaders[0])
+            assert (set(outcome[0]), outcome[1], set(outcome[2])) == (winners, seeds[0], set(seeds))
+            if clear[0, conference]:
+                assert set(np.flatnonzero(playoffs[0] & in_conference)) == set(seeds)
+                assert set(np.flatnonzero(division[0] & in_conference)) == winners
+                assert np.flatnonzero(bye[0] & in_conference).tolist() == [seeds[0]]
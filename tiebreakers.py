@@ -0,0 +1,253 @@
+# tiebreakers.py
+import numpy as np
+
+COMMON_GAMES_MINIMUM = 4  # Wild card ties only use common games when each club played this many
+PLAYOFF_SEEDS = 7
+EPSILON = 1e-9  # Percentages closer than this are equal
+
+
+def _pct(won, played):
+    return np.divide(won, played, out=np.zeros(np.shape(won)), where=np.asarray(played) > 0)
+
+
+def season_stats(wins, games, division, conference):
+    """Per-team tiebreak stats from win and game matrices. wins may carry leading season axes
+    (seasons, teams, teams), so a whole simulated batch is computed at once."""
+    total_wins = wins.sum(axis=-1)
+    total_games = games.sum(axis=-1)
+    same_division = division[:, None] == division[None, :]
+    same_conference = conference[:, None] == conference[None, :]
+    played = np.broadcast_to(total_games, total_wins.shape)
+    return {
+        "win_pct": _pct(total_wins, played),
+        "division_pct": _pct((wins * same_division).sum(axis=-1),
+                             np.broadcast_to((games * same_division).sum(axis=-1), total_wins.shape)),
+        "conference_pct": _pct((wins * same_conference).sum(axis=-1),
+                               np.broadcast_to((games * same_conference).sum(axis=-1), total_wins.shape)),
+        # Combined record of the teams beaten (once per win) and of all opponents (once per game)
+        "strength_of_victory": _pct(np.einsum("...ij,...j->...i", wins, total_wins),
+                                    np.einsum("...ij,j->...i", wins, total_games)),
+        "strength_of_schedule": _pct(np.einsum("ij,...j->...i", games, total_wins),
+                                     np.broadcast_to(games @ total_games, total_wins.shape)),
+    }
+
+
+class SeasonTable:
+    """A season's results as matrices over all teams, with every per-team tiebreak stat precomputed.
+
+    wins[i, j] is the number of games team i won against team j (a tie counts half for both),
+    games[i, j] the number of games they played. Teams are indexed by position in team_ids.
+    stats, one season of season_stats(), skips computing them again.
+    """
+
+    def __init__(self, team_ids, division, conference, wins, games, coin=None, stats=None):
+        self.team_ids = list(team_ids)
+        self.division = np.asarray(division)
+        self.conference = np.asarray(conference)
+        self.wins = wins
+        self.games = games
+        # Lower wins the coin toss; team order unless a simulation passes a random draw
+        self.coin = np.arange(len(self.team_ids)) if coin is None else coin
+
+        stats = stats or season_stats(wins, games, self.division, self.conference)
+        self.win_pct = stats["win_pct"].tolist()  # Compared one team at a time
+        self.division_pct = stats["division_pct"]
+        self.conference_pct = stats["conference_pct"]
+        self.strength_of_victory = stats["strength_of_victory"]
+        self.strength_of_schedule = stats["strength_of_schedule"]
+
+
+def build_season_table(games, team_ids, division_of):
+    """SeasonTable from a final_games_frame() and a team_id -> division name mapping."""
+    index = {team_id: position for position, team_id in enumerate(team_ids)}
+    divisions = sorted(set(division_of[team_id] for team_id in team_ids))
+    division = np.array([divisions.index(division_of[team_id]) for team_id in team_ids])
+    conference = np.array([division_of[team_id].startswith("NFC") for team_id in team_ids], dtype=int)
+
+    home = games["home_id"].map(index).to_numpy()
+    away = games["away_id"].map(index).to_numpy()
+    margin = (games["home_score"] - games["away_score"]).to_numpy()
+
+    wins = np.zeros((len(team_ids), len(team_ids)))
+    games_played = np.zeros_like(wins)
+    np.add.at(wins, (home, away), (margin > 0) + 0.5 * (margin == 0))
+    np.add.at(wins, (away, home), (margin < 0) + 0.5 * (margin == 0))
+    np.add.at(games_played, (home, away), 1)
+    np.add.at(games_played, (away, home), 1)
+    return SeasonTable(team_ids, division, conference, wins, games_played)
+
+
+def _head_to_head(table, tied):
+    among = (tied[:, None], tied)
+    return _pct(table.wins[among].sum(axis=1), table.games[among].sum(axis=1))
+
+
+def _head_to_head_sweep(table, tied):
+    """Wild card head-to-head among 3+ clubs only counts a club that beat, or lost to, each of the others."""
+    among = (tied[:, None], tied)
+    played_all = (table.games[among] > 0).sum(axis=1) == len(tied) - 1
+    won, played = table.wins[among].sum(axis=1), table.games[among].sum(axis=1)
+    values = played_all * ((won == played).astype(int) - (won == 0).astype(int))
+    return values if values.any() else None
+
+
+def _common_games(table, tied, minimum=0):
+    common = (table.games[tied] > 0).all(axis=0)
+    common[tied] = False
+    won, played = table.wins[tied][:, common].sum(axis=1), table.games[tied][:, common].sum(axis=1)
+    if (played < max(minimum, 1)).any():
+        return None
+    return won / played
+
+
+def _division_criteria(table, tied):
+    yield _head_to_head(table, tied)
+    yield table.division_pct[tied]
+    yield _common_games(table, tied)
+    yield table.conference_pct[tied]
+    yield table.strength_of_victory[tied]
+    yield table.strength_of_schedule[tied]
+
+
+def _wild_card_criteria(table, tied):
+    if len(tied) == 2:
+        yield _head_to_head(table, tied) if table.games[tied[0], tied[1]] else None
+    else:
+        yield _head_to_head_sweep(table, tied)
+    yield table.conference_pct[tied]
+    yield _common_games(table, tied, COMMON_GAMES_MINIMUM)
+    yield table.strength_of_victory[tied]
+    yield table.strength_of_schedule[tied]
+
+
+def break_tie(table, tied, criteria):
+    """The club that wins a tie among `tied` (team indices).
+
+    Criteria are applied in order. As soon as one separates some clubs from the rest, the
+    clubs still tied start over from the first criterion, as the NFL procedure requires.
+    """
+    tied = np.asarray(tied)
+    while len(tied) > 1:
+        for values in criteria(table, tied):
+            if values is None:
+                continue
+            best = tied[values >= values.max() - EPSILON]
+            if len(best) < len(tied):
+                break
+        else:
+            best = tied[[np.argmin(table.coin[tied])]]
+        tied = best
+    return int(tied[0])
+
+
+def rank_teams(table, teams, criteria, division_rank=None, limit=None):
+    """Order teams by win percentage, breaking each tie with `criteria`. Stops after `limit` teams.
+
+    With division_rank, only the highest-ranked tied club of each division takes part in a
+    tie, as in wild card ties.
+    """
+    win_pct = table.win_pct
+    remaining = sorted(teams, key=lambda team: -win_pct[team])
+    limit = len(remaining) if limit is None else min(limit, len(remaining))
+    order = []
+    while len(order) < limit:
+        # Clubs level with the best remaining record; only these can be next
+        tied = [team for team in remaining if win_pct[team] >= win_pct[remaining[0]] - EPSILON]
+        if division_rank is not None and len(tied) > 1:
+            top_of_division = {}
+            for team in tied:
+                division = table.division[team]
+                if division not in top_of_division or division_rank[team] < division_rank[top_of_division[division]]:
+                    top_of_division[division] = team
+            tied = list(top_of_division.values())
+        best = tied[0] if len(tied) == 1 else break_tie(table, tied, criteria)
+        order.append(best)
+        remaining.remove(best)
+    return order
+
+
+def seed_playoffs(table):
+    """Division standings and playoff seeds for both conferences.
+
+    Returns {"division_rank": array of each team's place in its division (0 = winner),
+    "seeds": {conference: [team indices, seed 1 first]}}. Division winners take seeds 1-4,
+    the best three other clubs the wild cards.
+    """
+    division_rank = np.zeros(len(table.team_ids), dtype=int)
+    winners = {}
+    for division in np.unique(table.division):
+        members = np.flatnonzero(table.division == division)
+        order = rank_teams(table, members, _division_criteria)
+        division_rank[order] = np.arange(len(order))
+        winners[division] = order[0]
+
+    seeds = {}
+    for conference in np.unique(table.conference):
+        division_winners = [team for division, team in winners.items()
+                            if table.conference[team] == conference]
+        others = [team for team in np.flatnonzero(table.conference == conference) if division_rank[team] > 0]
+        wild_cards = rank_teams(table, others, _wild_card_criteria, division_rank,
+                                limit=PLAYOFF_SEEDS - len(division_winners))
+        seeds[int(conference)] = rank_teams(table, division_winners, _wild_card_criteria) + wild_cards
+    return {"division_rank": division_rank, "seeds": seeds}
+
+
+class _DivisionRank:
+    """Each team's place in its division, ranked one division at a time when a wild card tie
+    first asks for it. Most wild card ties involve at most one club per division and never do."""
+
+    def __init__(self, table):
+        self.table = table
+        self.rank = {}
+
+    def __getitem__(self, team):
+        if team not in self.rank:
+            members = np.flatnonzero(self.table.division == self.table.division[team])
+            for place, member in enumerate(rank_teams(self.table, members, _division_criteria)):
+                self.rank[member] = place
+        return self.rank[team]
+
+
+def _leader(table, teams, criteria):
+    """The first club rank_teams() would pick from teams, breaking a tie only when there is one."""
+    teams = np.asarray(teams)
+    pct = np.asarray(table.win_pct)[teams]
+    tied = teams[pct >= pct.max() - EPSILON]
+    return int(tied[0]) if len(tied) == 1 else break_tie(table, tied, criteria)
+
+
+def playoff_outcome(table, conference, leaders=None):
+    """Division winners, first-round bye and playoff clubs of one conference, as seed_playoffs()
+    would decide them.
+
+    Whole divisions and the seeds after the first aren't ranked: ties are only broken where they
+    decide a division title, the bye or the last wild card. This is all a simulated season needs.
+    leaders optionally gives the winner of each division (indexed by division) where it is already
+    known, -1 where it isn't. Returns (winners, bye, playoff clubs) as team indices.
+    """
+    win_pct = np.asarray(table.win_pct)
+    members = np.flatnonzero(table.conference == conference)
+    winners = []
+    for division in np.unique(table.division[members]):
+        if leaders is not None and leaders[division] >= 0:
+            winners.append(int(leaders[division]))
+        else:
+            winners.append(_leader(table, np.flatnonzero(table.division == division), _division_criteria))
+    bye = _leader(table, winners, _wild_card_criteria)
+
+    playoffs = list(winners)
+    others = np.array([team for team in members if team not in winners])
+    limit = PLAYOFF_SEEDS - len(winners)
+    if limit <= 0:
+        return winners, bye, playoffs
+    if len(others) <= limit:
+        return winners, bye, playoffs + others.tolist()
+    # Clubs better than the last one in are in. Only the clubs level with it compete for the
+    # places left, which is where rank_teams() would get to after picking the others.
+    cut = np.sort(win_pct[others])[-limit]
+    above = others[win_pct[others] > cut + EPSILON]
+    level = others[np.abs(win_pct[others] - cut) <= EPSILON]
+    places = limit - len(above)
+    if len(level) > places:
+        level = rank_teams(table, level.tolist(), _wild_card_criteria, _DivisionRank(table), limit=places)
+    return winners, bye, playoffs + above.tolist() + list(level)
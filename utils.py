@@ -2,14 +2,23 @@
 import json
 import re
 from dash import html
-import pandas as pd
 import pytz
 from collections import defaultdict
 import dash_bootstrap_components as dbc
 from datetime import datetime, timezone
-from config import ODDS_FILE_PATH
-from api import fetch_nfl_events, fetch_odds, fetch_division, fetch_team_records, fetch_teams, fetch_players_by_team, \
-    fetch_current_odds
+from urllib.parse import quote
+from fanout import fan_out
+from season_index import get_season_index, get_week
+from game_index import get_game_detail
+from render_cache import cached_fragment, get_fragment, store_fragment
+from roster_cache import get_team, get_roster
+from api import fetch_odds, fetch_division, fetch_nfl_events, fetch_teams, \
+    fetch_current_odds, fetch_scoring_plays
+from snapshot import export_snapshot
+from config import TEAMS_FILE_PATH, DIVISIONS_FILE_PATH
+
+
+ROSTER_COLUMNS = ("headshot", "jersey", "name", "position", "group", "height", "weight", "age", "college", "status")
 
 
 # Helper functions
@@ -25,40 +34,74 @@ def parse_and_capitalize(name):
     return ' '.join(word.capitalize() for word in words)
 
 
-# Odds functions
-def save_last_fetched_odds(last_fetched_odds):
-    with open(ODDS_FILE_PATH, 'w') as f:
-        json.dump(last_fetched_odds, f, indent=2)
+# API calls and formatting functions
+def get_game_odds(game_id, odds_store):
+    # Odds are resolved ahead of time by resolve_week_odds, rendering never calls upstream
+    return odds_store.get(game_id)
+
 
+def resolve_week_odds(week_index, odds_store):
+    """Fill in spreads for every game of a week and persist them in a single write.
 
-def load_last_fetched_odds():
-    """Load the last fetched odds from a JSON file."""
-    try:
-        with open(ODDS_FILE_PATH, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {}
+    Spreads come from the week's scoreboard response in one call; only games it has no odds
+    for are looked up individually, concurrently. Returns True if anything changed.
+    """
+    week_data = fetch_current_odds(week_index)
+    resolved = {}
+    gaps = []
 
+    for event in week_data.get('events', []):
+        game_id = event['id']
+        competition = event['competitions'][0]
+        if competition.get('odds'):
+            resolved[game_id] = competition['odds'][0].get('details')  # Assume first provider if multiple
+        elif game_id not in odds_store:
+            gaps.append(game_id)
 
-# API calls and formatting functions
-def get_game_odds(game_id, game_status, last_fetched_odds):
-    if game_id not in last_fetched_odds:
-        # Odds not available in the dictionary, fetch odds regardless of the game status
-        odds_data = fetch_odds(game_id)
-        last_fetched_odds[game_id] = odds_data  # Store the fetched odds
-        save_last_fetched_odds(last_fetched_odds)  # Save to file
-        return odds_data
-    else:
-        # Return the last fetched odds if the game is in progress or final
-        return last_fetched_odds[game_id]  # Return last fetched odds if available
-    return None  # Return None if no odds are found
+    if gaps:
+        results, stats = fan_out(fetch_odds, gaps)
+        report_fan_out("Odds", stats)
+        for index, game_id in enumerate(gaps):
+            # None is a failed or throttled lookup: leave the game out so the next run tries again
+            if results.get(index) is not None:
+                resolved[game_id] = results[index]
+
+    # The store skips unchanged spreads and commits the rest in one transaction
+    return odds_store.upsert_many(resolved) > 0
+
+
+def report_fan_out(label, stats):
+    print(f"{label}: {stats['calls']} calls ({stats['skipped']} skipped) in {stats['wall_time']:.2f}s, "
+          f"{stats['speedup']:.1f}x faster than serial ({stats['serial_time']:.2f}s)")
 
 
 def get_unique_divisions(teams_df):
+    import pandas as pd  # Only needed when regenerating data/, kept off the worker boot path
     division_dict = {}
-
-    for _, team in teams_df.iterrows():
-        division_data = fetch_division(team["id"])
+    resolved_team_ids = set()
+
+    def mark_resolved(index, team_id, division_data):
+        # Every team listed in a returned division no longer needs its own lookup
+        if division_data:
+            resolved_team_ids.update(str(div_team["id"]) for div_team in division_data.get("teams", []))
+
+    team_ids = teams_df["id"].tolist()
+    results, stats = fan_out(fetch_division, team_ids,
+                             skip=lambda team_id: str(team_id) in resolved_team_ids,
+                             on_result=mark_resolved)
+    report_fan_out("Divisions", stats)
+
+    # A partial map would drop teams from the standings; keep the current divisions.json instead
+    unresolved = [str(team_id) for team_id in team_ids if str(team_id) not in resolved_team_ids]
+    if unresolved:
+        print(f"Error fetching divisions for teams {', '.join(unresolved)}, keeping {DIVISIONS_FILE_PATH}")
+        return None
+
+    # Merge in team order so the output matches a serial walk of teams_df
+    for index in sorted(results):
+        division_data = results[index]
+        if not division_data:
+            continue
 
         division_id = division_data["id"]
         division_name = division_data["name"]
@@ -80,69 +123,16 @@ def get_unique_divisions(teams_df):
                 "team_id": team["id"],
             })
 
-    # Save to data/divisions.json
-    with open("data/divisions.json", "w") as f:
+    # Save to data/divisions.json, plus the binary snapshot the standings load from
+    with open(DIVISIONS_FILE_PATH, "w") as f:
         json.dump(division_records, f, indent=2)
+    export_snapshot(DIVISIONS_FILE_PATH, division_records)
 
     return pd.DataFrame(division_records)
 
 
-def get_records(teams_df):
-    # Initialize list to store records for each team
-    team_records = []
-
-    for _, team in teams_df.iterrows():
-        # Fetch records for the specific team
-        records_data = fetch_team_records(team['id'])
-
-        # Ensure records_data is a dictionary and contains the expected "items" key
-        if isinstance(records_data, dict) and "items" in records_data:
-            for record in records_data["items"]:  # Assuming "items" is a list of individual records
-                # Confirm record is a dictionary and has the "name" key
-                if isinstance(record, dict) and "name" in record:
-                    if record["name"] == "overall":
-                        # Extract stats within "overall"
-                        wins = next((stat["value"] for stat in record.get("stats", []) if stat.get("name") == "wins"),
-                                    0)
-                        losses = next(
-                            (stat["value"] for stat in record.get("stats", []) if stat.get("name") == "losses"), 0)
-                        ties = next((stat["value"] for stat in record.get("stats", []) if stat.get("name") == "ties"),
-                                    0)
-
-                    elif record["name"] == "vs. Div.":
-                        # Extract stats within "vs. Div."
-                        division_wins = next(
-                            (stat["value"] for stat in record.get("stats", []) if stat.get("name") == "divisionWins"),
-                            0)
-                        division_losses = next(
-                            (stat["value"] for stat in record.get("stats", []) if stat.get("name") == "divisionLosses"),
-                            0)
-                        division_ties = next(
-                            (stat["value"] for stat in record.get("stats", []) if stat.get("name") == "divisionTies"),
-                            0)
-
-            # Append processed data
-            team_records.append({
-                "id": team["id"],
-                "display_name": team["display_name"],
-                "wins": wins,
-                "losses": losses,
-                "ties": ties,
-                "division_wins": division_wins,
-                "division_losses": division_losses,
-                "division_ties": division_ties,
-                "color": team["color"],
-                "logo": team["logo"],
-            })
-
-    # Convert to DataFrame
-    # Save to data/records.json
-    with open("data/records.json", "w") as f:
-        json.dump(team_records, f, indent=2)
-    return pd.DataFrame(team_records)
-
-
 def get_teams():
+    import pandas as pd  # Only needed when regenerating data/, kept off the worker boot path
     teams_data = fetch_teams()
     team_data = [
         {
@@ -154,12 +144,12 @@ def get_teams():
         for team in teams_data.get("teams", [])
     ]
     # Save to data/teams.json
-    with open("data/teams.json", "w") as f:
+    with open(TEAMS_FILE_PATH, "w") as f:
         json.dump(team_data, f, indent=2)
     return pd.DataFrame(team_data)
 
 
-def get_game_info(event, last_fetched_odds):
+def get_game_info(event, odds_store):
     """Extract all relevant game information from an event."""
     eastern = pytz.timezone("America/New_York")
     event_start_utc = datetime.fromisoformat(event['date'][:-1]).replace(tzinfo=timezone.utc)
@@ -180,9 +170,9 @@ def get_game_info(event, last_fetched_odds):
         game_headline = None
 
 
-    # Fetch odds based on game status (fetch live odds if scheduled, retain last odds otherwise)
+    # Last stored spread, whatever the game status: final games keep their closing line
     game_id = event.get('id')
-    odds = get_game_odds(game_id, game_status, last_fetched_odds)
+    odds = get_game_odds(game_id, odds_store)
     # Extract overall records from the statistics
     home_team_record = event['competitions'][0]['competitors'][0]['records'][0]['summary']
     away_team_record = event['competitions'][0]['competitors'][1]['records'][0]['summary']
@@ -214,74 +204,99 @@ def get_game_info(event, last_fetched_odds):
     }
 
 
-# Game Details creation functions
-def create_line_scores():
-    # Retrieve the cached NFL events data
-    events_data = fetch_nfl_events()
-
-    # Initialize dictionary to store linescores by game_id
-    linescores_dict = {}
-
-    if not events_data:  # Check if events_data is None or empty
-        return linescores_dict  # Return an empty dictionary if no data is available
-
-    # Extract linescores information from each event
-    for event in events_data.get("events", []):
-        game_id = event.get("id")
-        game_status = event.get("status", {}).get("type", {}).get("description", "").lower()
-        season_type = event.get("season", {}).get("type")
-
-        # Only include regular season games with a final status
-        if season_type == 2 and game_status == "final":  # Regular season and completed games only
-            linescores_dict[game_id] = {
-                "away_line_scores": [],
-                "home_line_scores": []
-            }
-
-            # Loop through teams to classify home and away team scores
-            for competition in event.get("competitions", []):
-                for competitor in competition.get("competitors", []):
-                    team_linescores = [score.get("value") for score in competitor.get("linescores", [])]
-
-                    if competitor.get("homeAway") == "away":
-                        linescores_dict[game_id]["away_line_scores"] = team_linescores
-                    elif competitor.get("homeAway") == "home":
-                        linescores_dict[game_id]["home_line_scores"] = team_linescores
-
-    return linescores_dict, events_data  # Always returns a dictionary, even if empty
-
-
-def create_standings():
-    # Toggle standing_df to rebuild records json files
-    # teams_df = pd.read_json("data/teams.json")
-    # standings_df = get_records(teams_df)
-    standings_df = pd.read_json("data/records.json")
-    divisions_df = pd.read_json("data/divisions.json")
-
-
-    # Merge and clean up columns
-    standings_df = standings_df.merge(divisions_df, how='left', left_on='id', right_on='team_id')
-    standings_df.drop(columns=['team_id'], inplace=True)
-
-    # Calculate win percentages and sort
-    standings_df["overall_win%"] = standings_df["wins"] / (
-                standings_df["wins"] + standings_df["losses"] + standings_df["ties"])
-    standings_df["division_win%"] = standings_df["division_wins"] / (
-                standings_df["division_wins"] + standings_df["division_losses"] + standings_df["division_ties"])
-    standings_df = standings_df.sort_values(by=["division_name", "overall_win%", "division_win%"],
-                                            ascending=[True, False, False])
-
-
-    return standings_df
-
-
-def create_roster_table(team_id):
-    # Load team data
-    with open('data/teams.json') as f:
-        teams_data = json.load(f)
-
-    # Fetch the selected team data
-    team_data = next((team for team in teams_data if team["id"] == str(team_id)), None)
+def create_game_card(game_id, game_info):
+    """Clickable score card for one game. Live fields are filled in clientside."""
+    home_color = game_info['Home Team Color']
+    away_color = game_info['Away Team Color']
+    game_status = game_info['Game Status']
+    # home_id = game_info['Home Team ID']
+    # away_id = game_info['Away Team ID']
+    home_team_extra_info = ""
+    away_team_extra_info = ""
+    game_headline = game_info['Game Headline']
+
+    if game_status.lower() == "final":
+        home_score = game_info['Home Team Score']
+        away_score = game_info['Away Team Score']
+        quarter_time_display = ""
+    else:
+        home_score = ""
+        away_score = ""
+        quarter_time_display = ""
+
+    return dbc.Button(
+        dbc.Row([
+            dbc.Col(html.Img(src=game_info['Away Team Logo'], height="100px"), width=1,
+                    style={'textAlign': 'center'}),
+            dbc.Col(
+                html.Div([
+                    html.H4(game_info['Away Team'], style={'color': away_color, 'fontWeight': 'bold'}),
+                    html.P(f"{game_info['Away Team Record']}", style={'margin': '0', 'padding': '0'}),
+                    html.H3(away_score, id={'type': 'away-score', 'index': game_id},
+                            style={'color': away_color, 'fontWeight': 'bold'}),
+                    html.H6(away_team_extra_info, id={'type': 'away-extra', 'index': game_id},
+                            style={'color': away_color}),
+                ], style={'textAlign': 'center'}),
+                width=3,
+            ),
+            dbc.Col(
+                html.Div([
+                    # html.H5(game_info['Game Status']),
+                    html.H6(game_status, id={'type': 'game-status', 'index': game_id},
+                            style={'fontWeight': 'bold'}),
+                    html.H5(quarter_time_display, id={'type': 'quarter-time', 'index': game_id},
+                            style={'fontWeight': 'bold'}),
+                    html.H6(game_info['Odds']) if game_info['Odds'] else "",
+                    html.P(game_info['Start Date (EST)'], style={'margin': '0', 'padding': '0'}),
+                    html.P(f"{game_info['Location']} - {game_info['Network']}",
+                           style={'margin': '0', 'padding': '0'}),
+                ], style={'textAlign': 'center'}),
+                width=4
+            ),
+            dbc.Col(
+                html.Div([
+                    html.H4(game_info['Home Team'], style={'color': home_color, 'fontWeight': 'bold'}),
+                    html.P(f"{game_info['Home Team Record']}", style={'margin': '0', 'padding': '0'}),
+                    html.H3(home_score, id={'type': 'home-score', 'index': game_id},
+                            style={'color': home_color, 'fontWeight': 'bold'}),
+                    html.H6(home_team_extra_info, id={'type': 'home-extra', 'index': game_id},
+                            style={'color': home_color}),
+                ], style={'textAlign': 'center'}),
+                width=3
+            ),
+            dbc.Col(html.Img(src=game_info['Home Team Logo'], height="100px"), width=1,
+                    style={'textAlign': 'left', 'padding': '0'}),
+            dbc.Col(
+                html.Div(
+                    game_headline,
+                    style={
+                        'width': '100%',
+                        'textAlign': 'center',
+                        'fontStyle': 'italic',
+                        'fontSize': '1.0em',
+                        'marginTop': '10px',
+                    }
+                ),
+                width=12  # Adjust width as needed
+            ),
+        ], className="game-row", style={'padding': '10px'}),
+        id={'type': 'game-button', 'index': game_id},
+        n_clicks=0,
+        color='medium',
+        className='dash-bootstrap',
+        style={
+            '--team-home-color': home_color,
+            '--team-away-color': away_color,
+            'width': '100%',
+            'textAlign': 'left'
+        },
+        value=game_id,
+    )
+
+
+def create_roster_header(team_id):
+    """Logo and name card above the roster table."""
+    team_data = get_team(team_id)
     if not team_data:
         return html.Div("Team not found")
 
@@ -292,7 +307,7 @@ def create_roster_table(team_id):
     background_color_rgba = hex_to_rgba(team_color, alpha=1.0)
 
     # Team header (logo and name)
-    subheading = dbc.Card([
+    return dbc.Card([
         dbc.CardBody([
             html.Div([
                 html.Img(src=team_logo, height="80px", style={"marginRight": "10px"}),
@@ -316,74 +331,42 @@ def create_roster_table(team_id):
         "border": f"2px solid {team_color}",
     })
 
-    # Player data from API
-    player_data = fetch_players_by_team(team_id)
-    table_rows = []
 
-    # Iterate over each group
-    for group in player_data.get("athletes", []):
-        group_name = parse_and_capitalize(group.get("position", "Unknown Group"))
+def player_thumbnail(href, width=96, height=70):
+    # ESPN serves resized headshots through its image combiner, full size is 350x254
+    if href.startswith("https://a.espncdn.com/i/"):
+        path = quote(href[len('https://a.espncdn.com'):], safe="/")
+        return f"https://a.espncdn.com/combiner/i?img={path}&w={width}&h={height}"
+    return href
 
-       # Group header row
-        table_rows.append(html.Tr([
-            html.Th(group_name, colSpan=9, className="roster-group-header",
-                    style={'textAlign': 'center',
-                           "marginBottom": "0",
-                    "color": "white",  # Text color
-                    "backgroundColor": background_color_rgba,
-                    "fontWeight": "bold",
-                    "fontSize": "1.5rem"})
-        ]))
+
+def create_roster_data(team_id):
+    """Roster as columns of plain values (one list per field), ordered by group and position.
+
+    The roster page turns these into table rows in the browser (assets/roster_table.js).
+    """
+    columns = {name: [] for name in ROSTER_COLUMNS}
+    for group in get_roster(team_id).get("athletes", []):
+        group_name = parse_and_capitalize(group.get("position", "Unknown Group"))
 
         # Group players by position within each main group (e.g., Running Back under Offense)
         players_by_position = defaultdict(list)
         for player in group.get("items", []):
-            position = player["position"]["displayName"]
-            players_by_position[position].append(player)
+            players_by_position[player["position"]["displayName"]].append(player)
 
-        # Iterate over positions within each group
         for position, position_players in players_by_position.items():
-            # Position subheading
-            table_rows.append(html.Tr([
-                html.Th(position, colSpan=9, className="roster-position-header")
-            ]))
-
-            # Add smaller repeated headers for clarity
-            table_rows.append(html.Tr([
-                html.Th("", style={"fontSize": "14px", "fontWeight": "normal", "color": "white"}),
-                html.Th("Jersey", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
-                html.Th("Name", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
-                html.Th("Position", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
-                html.Th("Height", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
-                html.Th("Weight", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
-                html.Th("Age", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
-                html.Th("College", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"}),
-                html.Th("Status", style={"fontSize": "14px", "fontWeight": "normal", "color": "#white"})
-            ]))
-
-            # Player rows for each position
             for player in position_players:
-                player_row = html.Tr([
-                    html.Td(html.Img(src=player.get('headshot', {}).get('href', ''), height="50px",
-                                     className="player-photo")),
-                    html.Td(player.get("jersey", "N/A")),
-                    html.Td(player.get("displayName", "Unknown Name")),
-                    html.Td(player["position"].get("displayName", "Unknown Position")),
-                    html.Td(player.get("displayHeight", "N/A")),
-                    html.Td(player.get("displayWeight", "N/A")),
-                    html.Td(player.get("age", "N/A")),
-                    html.Td(player.get("college", {}).get("shortName", "N/A")),
-                    html.Td(player.get("status", {}).get("type", "N/A")),
-                ])
-                table_rows.append(player_row)
-
-        # Construct the final layout
-    return html.Div([
-        subheading,
-        html.Table([
-            html.Tbody(table_rows)
-        ], className="roster-table")
-    ])
+                columns["headshot"].append(player_thumbnail(player.get('headshot', {}).get('href', '')))
+                columns["jersey"].append(player.get("jersey", "N/A"))
+                columns["name"].append(player.get("displayName", "Unknown Name"))
+                columns["position"].append(position)
+                columns["group"].append(group_name)
+                columns["height"].append(player.get("displayHeight", "N/A"))
+                columns["weight"].append(player.get("displayWeight", "N/A"))
+                columns["age"].append(player.get("age", "N/A"))
+                columns["college"].append(player.get("college", {}).get("shortName", "N/A"))
+                columns["status"].append(player.get("status", {}).get("type", "N/A"))
+    return columns
 
 
 # Game Details formatting functions
@@ -500,37 +483,63 @@ def format_scoring_play(scoring_plays):
     ], className="section-container")
 
 
+def _build_game_details(game_detail, scoring_plays):
+    return [
+        format_line_score(game_detail["home_team"], game_detail["away_team"], game_detail["home_line_scores"],
+                          game_detail["away_line_scores"]),
+        format_game_leaders(game_detail["leaders"]),
+        format_scoring_play(scoring_plays)
+    ]
+
+
+def create_game_details(game_id):
+    """Line score, leaders and scoring plays panel for one game, cached by its content."""
+    game_detail = get_game_detail(game_id)
+    if not game_detail or not game_detail["home_team"] or not game_detail["away_team"]:
+        return [html.P("Game details not available.")]
+
+    if game_detail["status"] == "final":
+        # Final games never change: their panel is keyed without the scoring plays and looked up
+        # before fetching them, so a past game costs no upstream call once it has been rendered
+        inputs = {"game_id": game_id, "detail": game_detail}
+        fragment = get_fragment("game-details-final", inputs)
+        if fragment is not None:
+            return fragment
+        scoring_plays = fetch_scoring_plays(game_id)
+        panel = _build_game_details(game_detail, scoring_plays or [])
+        if scoring_plays is None:  # Fetch failed, don't keep the incomplete panel for good
+            return panel
+        return store_fragment("game-details-final", inputs, panel, permanent=True)
+
+    scoring_plays = fetch_scoring_plays(game_id) or []
+    return cached_fragment(
+        "game-details", {"game_id": game_id, "detail": game_detail, "scoring_plays": scoring_plays},
+        lambda: _build_game_details(game_detail, scoring_plays),
+    )
+
+
 # Bye Teams function
 def create_bye_teams(week):
-    data = fetch_current_odds(week)
+    # Teams on bye come from the season index, no scoreboard call needed
+    week_data = get_week(get_season_index(), week)
+    bye_team_ids = week_data["bye_team_ids"] if week_data else []
 
-    # Check if "teamsOnBye" is present and not empty
-    bye_teams = data.get("week", {}).get("teamsOnBye", [])
-
-    if not bye_teams:  # No teams on bye
+    if not bye_team_ids:  # No teams on bye
         return []  # Return an empty list or add a message if preferred
 
-    # Extract name, logo, and color for each team on bye
-    teams_on_bye = [
+    # Name, logo, and color for each team on bye from data/teams.json
+    teams = [get_team(team_id) for team_id in bye_team_ids]
+    return [
         {
             "id": team["id"],
-            "name": team["displayName"],
+            "name": team["display_name"],
             "logo": team["logo"],
+            "color": team["color"],
         }
-        for team in bye_teams
+        for team in teams if team
     ]
-    # Append team color from data/teams.json using team's id
-    with open('data/teams.json', 'r') as f:
-        teams = json.load(f)
-    for team in teams_on_bye:
-        team_match = next((t for t in teams if t['id'] == team['id']), None)
-        if team_match:
-            team['color'] = team_match['color']
-
-    return teams_on_bye
 
 
 def update_standings():
-    teams_df = pd.read_json("data/teams.json")
-    get_records(teams_df)
-    return
+    # Standings are computed from the season events, refreshing those is all an update needs
+    fetch_nfl_events(revalidate=True)